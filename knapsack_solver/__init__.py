@@ -0,0 +1,95 @@
+# Heurísticas para o problema da mochila 0/1.
+# Os nomes públicos são importados sob demanda (PEP 562): "import knapsack_solver" não
+# carrega NumPy nem lê instâncias; cada submódulo só é importado no primeiro uso.
+import importlib
+
+_EXPORTS = {
+    "BitSolution": "bitset",
+    "pack_solutions": "bitset",
+    "LazyInstance": "instance",
+    "load_instance": "instance",
+    "parse_knapsack_text": "instance",
+    "read_knapsack_data": "instance",
+    "save_instance": "instance",
+    "write_knapsack_text": "instance",
+    "generate_instance": "generator",
+    "generate_suite": "generator",
+    "evaluate_solution": "evaluation",
+    "evaluate_solutions": "evaluation",
+    "DeltaEvaluator": "evaluation",
+    "get_neighbors": "neighborhood",
+    "iter_moves": "neighborhood",
+    "generate_random_solution": "construction",
+    "greedy_randomized_solution": "construction",
+    "random_constructive_heuristic": "construction",
+    "smart_constructive_heuristic": "construction",
+    "RestrictedCandidateList": "construction",
+    "first_improvement": "local_search",
+    "best_improvement": "local_search",
+    "hill_climbing_fi": "local_search",
+    "hill_climbing_bi": "local_search",
+    "variable_neighborhood_descent": "local_search",
+    "MoveState": "moves",
+    "FlipNeighborhood": "moves",
+    "SwapNeighborhood": "moves",
+    "AddDropNeighborhood": "moves",
+    "SampledExchangeNeighborhood": "moves",
+    "dp_knapsack": "exact",
+    "branch_and_bound": "exact",
+    "solve_exact": "exact",
+    "optimality_gap": "exact",
+    "CoreProblem": "reduction",
+    "dantzig_bound": "reduction",
+    "reduce_instance": "reduction",
+    "solve_reduced": "reduction",
+    "genetic_algorithm": "genetic",
+    "ParetoFront2D": "pareto",
+    "NDTree": "pareto",
+    "hypervolume": "pareto",
+    "objective_matrix": "multiobjective",
+    "pareto_local_search": "multiobjective",
+    "Checkpointer": "checkpoint",
+    "solve_batch": "batch",
+    "iter_instance_paths": "batch",
+    "decode_items": "batch",
+    "ElitePool": "relinking",
+    "path_relinking": "relinking",
+    "grasp_path_relinking": "relinking",
+    "simulated_annealing": "annealing",
+    "GeometricCooling": "annealing",
+    "AdaptiveCooling": "annealing",
+    "ReheatingCooling": "annealing",
+    "SharedInstance": "shared",
+    "tune_alpha": "tuning",
+    "Probe": "instrumentation",
+    "ImprovementEvent": "instrumentation",
+    "profiling": "instrumentation",
+    "run_benchmark": "benchmark",
+    "summarize": "benchmark",
+    "AnytimeSolver": "anytime",
+    "CancelToken": "anytime",
+    "Deadline": "anytime",
+    "solve_anytime": "anytime",
+    "SolverService": "service",
+    "LocalClient": "service",
+    "ZobristTable": "memo",
+    "SolutionCache": "memo",
+    "TabuList": "memo",
+    "tabu_search": "tabu",
+    "grasp_knapsack": "grasp",
+    "reactive_grasp": "grasp",
+    "parallel_grasp_knapsack": "grasp",
+}
+
+__all__ = sorted(_EXPORTS)
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
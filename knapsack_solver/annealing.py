@@ -0,0 +1,220 @@
+import math
+import random
+import time
+
+from .construction import greedy_randomized_solution, smart_constructive_heuristic
+
+# Simulated annealing com movimentos de flip (um item entra ou sai) e de troca (um item
+# de fora entra e um de dentro sai). Os conjuntos de itens dentro e fora da mochila são
+# listas com posição indexada, então sortear um item de cada lado, avaliar o movimento
+# e aplicá-lo custam O(1).
+
+# Esquemas de resfriamento: a temperatura é atualizada a cada época (epoch movimentos)
+# com a taxa de aceitação da época e se o melhor lucro melhorou nela.
+
+# Resfriamento geométrico: T <- rate * T
+class GeometricCooling:
+    __slots__ = ("rate",)
+
+    def __init__(self, rate=0.95):
+        self.rate = rate
+
+    def reset(self, temperature):
+        pass
+
+    def next_temperature(self, temperature, acceptance_rate, improved):
+        return temperature * self.rate
+
+# Resfriamento adaptativo: esfria rápido enquanto a aceitação está acima do alvo e
+# devagar quando a busca já está seletiva
+class AdaptiveCooling:
+    __slots__ = ("target", "fast_rate", "slow_rate")
+
+    def __init__(self, target=0.2, fast_rate=0.9, slow_rate=0.99):
+        self.target = target
+        self.fast_rate = fast_rate
+        self.slow_rate = slow_rate
+
+    def reset(self, temperature):
+        pass
+
+    def next_temperature(self, temperature, acceptance_rate, improved):
+        if acceptance_rate > self.target:
+            return temperature * self.fast_rate
+        return temperature * self.slow_rate
+
+# Geométrico com reaquecimento: depois de patience épocas sem melhorar o melhor lucro,
+# a temperatura volta a reheat * temperatura inicial
+class ReheatingCooling:
+    __slots__ = ("rate", "patience", "reheat", "initial", "stalled")
+
+    def __init__(self, rate=0.95, patience=50, reheat=0.5):
+        self.rate = rate
+        self.patience = patience
+        self.reheat = reheat
+        self.initial = None
+        self.stalled = 0
+
+    def reset(self, temperature):
+        self.initial = temperature
+        self.stalled = 0
+
+    def next_temperature(self, temperature, acceptance_rate, improved):
+        self.stalled = 0 if improved else self.stalled + 1
+        if self.stalled >= self.patience:
+            self.stalled = 0
+            return self.initial * self.reheat
+        return temperature * self.rate
+
+COOLING_SCHEDULES = {
+    "geometric": GeometricCooling,
+    "adaptive": AdaptiveCooling,
+    "reheating": ReheatingCooling,
+}
+
+def _initial_solution(n, profits, weights, Q, initial, alpha, rng):
+    if initial == "smart":
+        return smart_constructive_heuristic(n, Q, weights, profits, float("inf"))[0]
+    if initial == "greedy":
+        return greedy_randomized_solution(n, profits, weights, Q, alpha, float("inf"), rng=rng)[0]
+    return list(initial)
+
+# Retira itens de solution, da pior razão lucro/peso para a melhor, até caber em Q
+def _repair_initial(solution, profits, weights, Q):
+    weight = sum(w for w, x in zip(weights, solution) if x)
+    if weight <= Q:
+        return solution
+    chosen = sorted((i for i in range(len(solution)) if solution[i]),
+                    key=lambda i: profits[i] / weights[i] if weights[i] else float("inf"))
+    for i in chosen:
+        if weight <= Q:
+            break
+        solution[i] = 0
+        weight -= weights[i]
+    return solution
+
+# Temperatura inicial que aceita com probabilidade ~1/2 uma piora média de movimentos flip
+def _estimate_temperature(profits, rng, samples=200):
+    n = len(profits)
+    mean_delta = sum(profits[int(rng.random() * n)] for _ in range(samples)) / samples
+    return max(mean_delta / math.log(2), 1e-9)
+
+# Simulated annealing partindo de smart_constructive_heuristic (initial="smart"), de
+# greedy_randomized_solution (initial="greedy") ou de uma solução dada.
+# schedule: nome ("geometric", "adaptive", "reheating") ou objeto de resfriamento.
+# infeasible="penalty" aceita soluções acima da capacidade, penalizando cada unidade de
+# excesso pela maior razão lucro/peso; infeasible="repair" transforma uma inclusão que
+# estoura a capacidade numa troca composta, retirando itens aleatórios até caber (uma
+# solução inicial acima da capacidade é reparada antes, retirando os itens de pior razão).
+# Para após max_iterations movimentos, time_limit segundos ou quando deadline
+# (anytime.Deadline) expira ou é cancelado; o tempo é verificado a cada época.
+# Devolve a melhor solução viável, seu lucro e o número de movimentos avaliados.
+def simulated_annealing(n, profits, weights, Q, initial="smart", schedule="geometric", initial_temperature=None,
+                        time_limit=None, max_iterations=1_000_000, swap_probability=0.5, infeasible="penalty",
+                        alpha=0.12, epoch=1000, min_temperature=1e-3, rng=random, deadline=None):
+    if infeasible not in ("penalty", "repair"):
+        raise ValueError(f"Tratamento de inviabilidade desconhecido: {infeasible}")
+    if isinstance(schedule, str):
+        schedule = COOLING_SCHEDULES[schedule]()
+    start_time = time.perf_counter()
+    end_time = None if time_limit is None else start_time + time_limit
+
+    repair = infeasible == "repair"
+    solution = _initial_solution(n, profits, weights, Q, initial, alpha, rng)
+    if repair:
+        solution = _repair_initial(solution, profits, weights, Q)
+    inside = [i for i in range(n) if solution[i]]
+    outside = [i for i in range(n) if not solution[i]]
+    position = [0] * n
+    for k, i in enumerate(inside):
+        position[i] = k
+    for k, i in enumerate(outside):
+        position[i] = k
+    profit = sum(profits[i] for i in inside)
+    weight = sum(weights[i] for i in inside)
+    penalty = max((p / w for p, w in zip(profits, weights) if w > 0), default=1.0)
+
+    best_profit = profit if weight <= Q else 0
+    best_solution = solution[:] if weight <= Q else [0] * n
+
+    temperature = initial_temperature or _estimate_temperature(profits, rng)
+    schedule.reset(temperature)
+    accepted = 0
+    improved = False
+    iteration = 0
+    random_ = rng.random
+
+    # Move o item i de um conjunto para o outro em O(1)
+    def move_item(i, source, target):
+        k = position[i]
+        last = source.pop()
+        if last != i:
+            source[k] = last
+            position[last] = k
+        position[i] = len(target)
+        target.append(i)
+
+    while iteration < max_iterations:
+        if iteration and iteration % epoch == 0:
+            if end_time is not None and time.perf_counter() >= end_time:
+                break
+            if deadline is not None and deadline.expired():
+                break
+            temperature = max(schedule.next_temperature(temperature, accepted / epoch, improved), min_temperature)
+            accepted = 0
+            improved = False
+        iteration += 1
+
+        # Sorteio do movimento: entra (lista adds) e sai (lista drops)
+        if inside and outside and random_() < swap_probability:
+            add = outside[int(random_() * len(outside))]
+            drop = inside[int(random_() * len(inside))]
+            delta_profit = profits[add] - profits[drop]
+            delta_weight = weights[add] - weights[drop]
+            drops = (drop,)
+        else:
+            i = int(random_() * n)
+            if solution[i]:
+                add = None
+                drops = (i,)
+                delta_profit = -profits[i]
+                delta_weight = -weights[i]
+            else:
+                add = i
+                drops = ()
+                delta_profit = profits[i]
+                delta_weight = weights[i]
+
+        new_weight = weight + delta_weight
+        if repair and new_weight > Q:
+            if add is None or weights[add] > Q:
+                continue
+            drops = list(drops)
+            while new_weight > Q:
+                drop = inside[int(random_() * len(inside))]
+                if drop in drops:
+                    continue
+                drops.append(drop)
+                delta_profit -= profits[drop]
+                new_weight -= weights[drop]
+
+        # Critério de Metropolis sobre o objetivo penalizado
+        delta = delta_profit - penalty * (max(new_weight - Q, 0) - max(weight - Q, 0))
+        if delta < 0 and random_() >= math.exp(delta / temperature):
+            continue
+
+        for drop in drops:
+            solution[drop] = 0
+            move_item(drop, inside, outside)
+        if add is not None:
+            solution[add] = 1
+            move_item(add, outside, inside)
+        profit += delta_profit
+        weight = new_weight
+        accepted += 1
+        if weight <= Q and profit > best_profit:
+            best_profit = profit
+            best_solution = solution[:]
+            improved = True
+
+    return best_solution, best_profit, iteration
@@ -0,0 +1,184 @@
+import random
+import threading
+import time
+from collections import namedtuple
+
+from .annealing import simulated_annealing
+from .construction import CHECK_EVERY, greedy_randomized_solution, smart_constructive_heuristic
+from .evaluation import evaluate_solution
+from .local_search import hill_climbing_fi
+
+# Resolução "anytime": com um prazo de relógio, sempre existe uma melhor solução viável
+# disponível, que melhora enquanto houver tempo. Serve a quem precisa de uma resposta
+# dentro de uma latência fixa: a solução gulosa (O(n log n)) fica pronta logo no início
+# e as fases seguintes só a substituem por outras melhores.
+
+# Sinal de cancelamento cooperativo, compartilhável entre threads
+class CancelToken:
+    __slots__ = ("_event",)
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+# Prazo de relógio (perf_counter) com cancelamento opcional. expired() só consulta o
+# relógio e o token a cada check_every chamadas (padrão CHECK_EVERY, como nas
+# construções), de modo que pode ficar dentro de laços curtos; depois de expirar,
+# continua expirado. Em laços apertados, não reduza check_every: cada consulta ao
+# relógio custa mais que um passo do laço. check_every=1 só serve a quem consulta o
+# prazo poucas vezes, entre etapas longas (uma varredura, uma iteração do GRASP).
+class Deadline:
+    __slots__ = ("end", "token", "check_every", "_countdown", "_expired")
+
+    def __init__(self, seconds=None, token=None, check_every=CHECK_EVERY):
+        self.end = None if seconds is None else time.perf_counter() + seconds
+        self.token = token
+        self.check_every = check_every
+        self._countdown = 1
+        self._expired = False
+
+    def expired(self):
+        if self._expired:
+            return True
+        self._countdown -= 1
+        if self._countdown > 0:
+            return False
+        self._countdown = self.check_every
+        if (self.token is not None and self.token.cancelled) or (self.end is not None and time.perf_counter() >= self.end):
+            self._expired = True
+        return self._expired
+
+    # Segundos restantes (None sem prazo; 0 se cancelado)
+    def remaining(self):
+        if self.token is not None and self.token.cancelled:
+            return 0.0
+        if self.end is None:
+            return None
+        return max(self.end - time.perf_counter(), 0.0)
+
+# Retrato da melhor solução: segundos desde o início, iteração e fase que a produziu
+Snapshot = namedtuple("Snapshot", ["solution", "profit", "weight", "time", "iteration", "phase"])
+
+# Melhor solução viável até o momento, protegida por trava para leitura de outra thread.
+# on_progress é chamado com cada novo Snapshot.
+class Incumbent:
+    __slots__ = ("_lock", "_snapshot", "start_time", "on_progress")
+
+    def __init__(self, on_progress=None):
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self.start_time = time.perf_counter()
+        self.on_progress = on_progress
+
+    # Aceita a solução se for melhor que a atual; a solução é copiada
+    def offer(self, solution, profit, weight, iteration=0, phase=""):
+        with self._lock:
+            if self._snapshot is not None and profit <= self._snapshot.profit:
+                return False
+            snapshot = Snapshot(list(solution), profit, weight, time.perf_counter() - self.start_time, iteration, phase)
+            self._snapshot = snapshot
+        if self.on_progress is not None:
+            self.on_progress(snapshot)
+        return True
+
+    @property
+    def profit(self):
+        snapshot = self._snapshot
+        return 0 if snapshot is None else snapshot.profit
+
+    def snapshot(self):
+        return self._snapshot
+
+ANYTIME_METHODS = ("grasp", "anneal")
+
+# Resolve até o prazo (time_limit segundos) ou até o token ser cancelado e devolve o
+# Snapshot da melhor solução. Começa pela construção gulosa; depois, com
+# method="grasp", repete construção gulosa randomizada + hill climbing, e com
+# method="anneal", reinicia o simulated annealing a partir da melhor solução.
+# Sem prazo nem token, pare por max_iterations. incumbent permite ler o progresso de
+# outra thread (AnytimeSolver).
+def solve_anytime(n, profits, weights, Q, time_limit=None, token=None, method="grasp", alpha=0.12,
+                  max_iterations=None, rng=random, on_progress=None, incumbent=None):
+    if method not in ANYTIME_METHODS:
+        raise ValueError(f"Método anytime desconhecido: {method}")
+    if time_limit is None and token is None and max_iterations is None:
+        raise ValueError("solve_anytime precisa de time_limit, token ou max_iterations")
+    if incumbent is None:
+        incumbent = Incumbent(on_progress)
+    # Consultado uma vez por iteração, por varredura da busca local e por época do
+    # annealing: etapas longas, em que cada consulta precisa olhar o relógio
+    deadline = Deadline(time_limit, token, check_every=1)
+
+    solution, weight, profit = smart_constructive_heuristic(n, Q, weights, profits, float("inf"))
+    incumbent.offer(solution, profit, weight, 0, "smart")
+
+    iteration = 0
+    while not deadline.expired() and (max_iterations is None or iteration < max_iterations):
+        iteration += 1
+        if method == "grasp":
+            remaining = deadline.remaining()
+            solution, _, _ = greedy_randomized_solution(n, profits, weights, Q, alpha,
+                                                        float("inf") if remaining is None else remaining, rng=rng)
+            solution = hill_climbing_fi(solution, profits, weights, Q, deadline=deadline)
+            profit, weight = evaluate_solution(solution, profits, weights, Q)
+        else:
+            start = incumbent.snapshot().solution
+            solution, profit, _ = simulated_annealing(n, profits, weights, Q, initial=start, max_iterations=100_000,
+                                                      deadline=deadline, rng=rng)
+            weight = evaluate_solution(solution, profits, weights, Q)[1]
+        incumbent.offer(solution, profit, weight, iteration, method)
+    return incumbent.snapshot()
+
+# solve_anytime numa thread separada: best() devolve a melhor solução a qualquer
+# momento, cancel() interrompe a busca e result() espera o fim e devolve o resultado.
+class AnytimeSolver:
+    def __init__(self, n, profits, weights, Q, time_limit=None, method="grasp", alpha=0.12, rng=random, on_progress=None):
+        self.token = CancelToken()
+        self.incumbent = Incumbent(on_progress)
+        self._error = None
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        args=(n, profits, weights, Q, time_limit, method, alpha, rng))
+
+    def _run(self, n, profits, weights, Q, time_limit, method, alpha, rng):
+        try:
+            solve_anytime(n, profits, weights, Q, time_limit, self.token, method, alpha, rng=rng, incumbent=self.incumbent)
+        except BaseException as e:
+            self._error = e
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def best(self):
+        return self.incumbent.snapshot()
+
+    def cancel(self):
+        self.token.cancel()
+
+    @property
+    def running(self):
+        return self._thread.is_alive()
+
+    # Espera o fim da busca (ou timeout segundos; então cancela e espera a iteração em
+    # curso) e devolve a melhor solução
+    def result(self, timeout=None):
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self.cancel()
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+        return self.best()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.cancel()
+        self._thread.join()
@@ -0,0 +1,179 @@
+import base64
+import csv
+import fnmatch
+import json
+import os
+import random
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import numpy as np
+
+from .anytime import solve_anytime
+from .instance import LazyInstance
+from .service import InlineExecutor
+
+# Resolução em lote de muitas instâncias. Os caminhos vêm de diretórios e de manifestos
+# (um caminho por linha) e são consumidos sob demanda; cada worker lê a sua instância,
+# resolve com solve_anytime dentro do prazo por instância e devolve um registro pequeno.
+# Os registros são gravados assim que cada instância termina (ordem de término; o campo
+# index dá a ordem de entrada), com no máximo max_pending instâncias em andamento, então
+# a memória não cresce com o número de instâncias.
+
+FIELDS = ("index", "instance", "n", "Q", "profit", "weight", "items", "solution", "found_at", "iterations", "load_time",
+          "solve_time", "method", "error")
+
+# Itens escolhidos em forma compacta: bits empacotados (1 bit por item) em base64
+def encode_items(solution):
+    return base64.b64encode(np.packbits(np.asarray(solution, dtype=np.uint8)).tobytes()).decode("ascii")
+
+# Índices dos itens escolhidos a partir do campo solution de um registro
+def decode_items(text, n):
+    bits = np.unpackbits(np.frombuffer(base64.b64decode(text), dtype=np.uint8), count=n)
+    return np.flatnonzero(bits).tolist()
+
+# Caminhos das instâncias, na ordem dada: diretórios são listados (arquivos que casam com
+# pattern, em ordem alfabética) e manifestos são lidos linha a linha, ignorando linhas
+# vazias e comentários (#); caminhos relativos do manifesto partem do seu diretório
+def iter_instance_paths(sources=(), manifests=(), pattern="*.txt"):
+    for source in sources:
+        if os.path.isdir(source):
+            names = sorted(entry.name for entry in os.scandir(source)
+                           if entry.is_file() and fnmatch.fnmatch(entry.name, pattern))
+            for name in names:
+                yield os.path.join(source, name)
+        else:
+            yield source
+    for manifest in manifests:
+        base = os.path.dirname(manifest)
+        with open(manifest) as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    yield os.path.join(base, line)
+
+# Resolve uma instância no worker. A semente de cada instância sai de seed e do caminho,
+# então o resultado não depende da ordem nem do número de workers. Erros de leitura ou
+# de resolução viram um registro com o campo error.
+def _solve_path(index, path, time_limit, method, alpha, seed, cache):
+    record = dict.fromkeys(FIELDS)
+    record.update(index=index, instance=path, method=method)
+    try:
+        start_time = time.perf_counter()
+        n, Q, profits, weights = LazyInstance(path, cache=cache).load()
+        load_time = time.perf_counter() - start_time
+        rng = random.Random(None if seed is None else f"{seed}:{path}")
+        snapshot = solve_anytime(n, profits, weights, Q, time_limit, method=method, alpha=alpha, rng=rng)
+        record.update(n=n, Q=Q, profit=snapshot.profit, weight=snapshot.weight, items=sum(snapshot.solution),
+                      solution=encode_items(snapshot.solution), found_at=snapshot.time, iterations=snapshot.iteration,
+                      load_time=load_time, solve_time=time.perf_counter() - start_time - load_time)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    return record
+
+# Gravadores de registros, um por linha/registro, liberados a cada gravação.
+# path "-" grava JSONL na saída padrão.
+class JSONLWriter:
+    def __init__(self, path):
+        self._own = path != "-"
+        self.file = open(path, "w") if self._own else sys.stdout
+
+    def write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def close(self):
+        if self._own:
+            self.file.close()
+
+class CSVWriter:
+    def __init__(self, path):
+        self.file = open(path, "w", newline="")
+        self.writer = csv.DictWriter(self.file, fieldnames=FIELDS)
+        self.writer.writeheader()
+
+    def write(self, record):
+        self.writer.writerow(record)
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+# Parquet (dependência opcional pyarrow): os registros são acumulados em grupos de
+# row_group_size linhas, cada grupo gravado assim que fica cheio
+class ParquetWriter:
+    def __init__(self, path, row_group_size=1024):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("A saída Parquet requer o pacote opcional pyarrow") from e
+        self._pa = pa
+        self.schema = pa.schema([
+            ("index", pa.int64()), ("instance", pa.string()), ("n", pa.int64()), ("Q", pa.int64()),
+            ("profit", pa.int64()), ("weight", pa.int64()), ("items", pa.int64()), ("solution", pa.string()),
+            ("found_at", pa.float64()), ("iterations", pa.int64()), ("load_time", pa.float64()),
+            ("solve_time", pa.float64()), ("method", pa.string()), ("error", pa.string()),
+        ])
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.row_group_size = row_group_size
+        self.rows = []
+
+    def write(self, record):
+        self.rows.append(record)
+        if len(self.rows) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self._pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+# Gravador pela extensão de path: .csv, .parquet ou JSONL (qualquer outra, ou "-")
+def open_writer(path):
+    if path.endswith(".csv"):
+        return CSVWriter(path)
+    if path.endswith(".parquet"):
+        return ParquetWriter(path)
+    return JSONLWriter(path)
+
+# Resolve as instâncias de paths (iterável, consumido sob demanda) em workers processos
+# (1 resolve no próprio processo) ou num executor já existente, com time_limit segundos
+# por instância. Cada registro é passado a writer.write assim que a instância termina.
+# Devolve um resumo: instâncias resolvidas, erros e tempo total.
+def solve_batch(paths, writer, time_limit=1.0, method="grasp", alpha=0.12, workers=1, executor=None,
+                max_pending=None, seed=None, cache=False):
+    own_executor = executor is None
+    if own_executor:
+        executor = InlineExecutor() if workers == 1 else ProcessPoolExecutor(max_workers=workers)
+    if max_pending is None:
+        max_pending = 2 * (workers or os.cpu_count() or 1)
+    start_time = time.perf_counter()
+    summary = {"solved": 0, "errors": 0}
+
+    def collect(futures):
+        for future in futures:
+            record = future.result()
+            summary["errors" if record["error"] else "solved"] += 1
+            writer.write(record)
+
+    pending = set()
+    try:
+        for index, path in enumerate(paths):
+            if len(pending) >= max_pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(_solve_path, index, os.fspath(path), time_limit, method, alpha, seed, cache))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            collect(done)
+    finally:
+        if own_executor:
+            executor.shutdown(wait=True, cancel_futures=True)
+    summary["time"] = time.perf_counter() - start_time
+    return summary
@@ -0,0 +1,170 @@
+import csv
+import json
+import os
+import platform
+import random
+import time
+
+import numpy as np
+
+from .annealing import simulated_annealing
+from .construction import (
+    generate_random_solution,
+    greedy_randomized_solution,
+    random_constructive_heuristic,
+    smart_constructive_heuristic,
+)
+from .evaluation import evaluate_solution
+from .exact import branch_and_bound, dp_knapsack
+from .genetic import genetic_algorithm
+from .grasp import grasp_knapsack
+from .instance import read_knapsack_data
+from .local_search import (
+    best_improvement,
+    first_improvement,
+    hill_climbing_bi,
+    hill_climbing_fi,
+    variable_neighborhood_descent,
+)
+from .relinking import grasp_path_relinking
+
+# Benchmark reprodutível das heurísticas. Cada caso recebe a instância e um gerador
+# semeado, prepara o que não deve ser medido (ex.: a solução inicial da busca local) e
+# devolve a função cronometrada, que produz uma solução. O tempo é medido com
+# perf_counter e o lucro é calculado fora da medição.
+# A repetição k usa a mesma semente para todas as heurísticas e instâncias.
+
+def _random_start(n, Q, profits, weights, rng):
+    return generate_random_solution(weights, Q, rng=rng)
+
+def _case_random(n, Q, profits, weights, rng):
+    return lambda: random_constructive_heuristic(n, Q, profits, weights, float("inf"), rng=rng)[0]
+
+def _case_smart(n, Q, profits, weights, rng):
+    return lambda: smart_constructive_heuristic(n, Q, weights, profits, float("inf"))[0]
+
+def _case_greedy(n, Q, profits, weights, rng):
+    return lambda: greedy_randomized_solution(n, profits, weights, Q, 0.12, float("inf"), rng=rng)[0]
+
+def _case_local_search(search):
+    def case(n, Q, profits, weights, rng):
+        start = _random_start(n, Q, profits, weights, rng)
+        return lambda: search(start, profits, weights, Q)
+    return case
+
+def _case_grasp(n, Q, profits, weights, rng):
+    return lambda: grasp_knapsack(n, profits, weights, Q, 10, rng=rng)[0]
+
+def _case_grasp_pr(n, Q, profits, weights, rng):
+    return lambda: grasp_path_relinking(n, profits, weights, Q, 10, rng=rng)[0]
+
+def _case_anneal(n, Q, profits, weights, rng):
+    return lambda: simulated_annealing(n, profits, weights, Q, max_iterations=100_000, rng=rng)[0]
+
+def _case_ga(n, Q, profits, weights, rng):
+    return lambda: genetic_algorithm(n, profits, weights, Q, generations=50, seed=rng.getrandbits(32))[0]
+
+def _case_dp(n, Q, profits, weights, rng):
+    return lambda: dp_knapsack(n, Q, profits, weights)[0]
+
+def _case_bb(n, Q, profits, weights, rng):
+    return lambda: branch_and_bound(n, Q, profits, weights, time_limit=10.0)[0]
+
+BENCHMARKS = {
+    "random": _case_random,
+    "smart": _case_smart,
+    "greedy": _case_greedy,
+    "fi": _case_local_search(first_improvement),
+    "bi": _case_local_search(best_improvement),
+    "hc-fi": _case_local_search(hill_climbing_fi),
+    "hc-bi": _case_local_search(hill_climbing_bi),
+    "vnd": _case_local_search(variable_neighborhood_descent),
+    "grasp": _case_grasp,
+    "grasp-pr": _case_grasp_pr,
+    "anneal": _case_anneal,
+    "ga": _case_ga,
+    "dp": _case_dp,
+    "bb": _case_bb,
+}
+
+# Casos executados por padrão: as heurísticas rápidas (sem GRASP, SA e métodos exatos)
+DEFAULT_BENCHMARKS = ("random", "smart", "greedy", "fi", "bi", "hc-fi")
+
+# Executa cada caso repeats vezes (após warmup execuções descartadas) em cada instância
+# e devolve um registro por execução: instância, n, caso, repetição, semente, segundos
+# e lucro. instances é uma lista de caminhos de arquivos de instância.
+def run_benchmark(instances, benchmarks=DEFAULT_BENCHMARKS, repeats=5, warmup=1, seed=0):
+    for name in benchmarks:
+        if name not in BENCHMARKS:
+            raise ValueError(f"Caso de benchmark desconhecido: {name}")
+    seeds = [int(s) for s in np.random.SeedSequence(seed).generate_state(warmup + repeats)]
+    records = []
+    for path in instances:
+        n, Q, profits, weights = read_knapsack_data(path)
+        for name in benchmarks:
+            case = BENCHMARKS[name]
+            for k, run_seed in enumerate(seeds):
+                rng = random.Random(run_seed)
+                random.seed(run_seed)  # Para as heurísticas que usam o gerador global
+                run = case(n, Q, profits, weights, rng)
+                start_time = time.perf_counter()
+                solution = run()
+                seconds = time.perf_counter() - start_time
+                if k < warmup:
+                    continue
+                profit, weight = evaluate_solution(solution, profits, weights, Q)
+                records.append({"instance": os.path.basename(path), "n": n, "benchmark": name, "repeat": k - warmup,
+                                "seed": run_seed, "seconds": seconds, "profit": profit, "weight": weight})
+    return records
+
+# Uma linha por (instância, caso): mediana e percentis 10/90 do tempo, lucro médio e melhor
+def summarize(records):
+    groups = {}
+    for record in records:
+        groups.setdefault((record["instance"], record["benchmark"]), []).append(record)
+    summary = []
+    for (instance, name), group in groups.items():
+        seconds = np.array([r["seconds"] for r in group])
+        profits = np.array([r["profit"] for r in group])
+        p10, median, p90 = np.percentile(seconds, [10, 50, 90])
+        summary.append({"instance": instance, "n": group[0]["n"], "benchmark": name, "samples": len(group),
+                        "median": float(median), "p10": float(p10), "p90": float(p90),
+                        "min": float(seconds.min()), "max": float(seconds.max()),
+                        "mean_profit": float(profits.mean()), "best_profit": int(profits.max())})
+    return summary
+
+def _environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "platform": platform.platform(),
+            "processor": platform.processor(), "cpus": os.cpu_count()}
+
+# Grava os resultados: .json com ambiente, registros e resumo; .csv só com o resumo
+def write_results(path, records, summary=None):
+    if summary is None:
+        summary = summarize(records)
+    if path.endswith(".csv"):
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(summary[0]) if summary else ["instance"])
+            writer.writeheader()
+            writer.writerows(summary)
+    else:
+        with open(path, "w") as f:
+            json.dump({"environment": _environment(), "records": records, "summary": summary}, f, indent=2)
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+# Compara o resumo atual com um resultado anterior (.json): devolve os casos cuja
+# mediana ficou mais de threshold (fração) acima da mediana de referência
+def compare_results(baseline, summary, threshold=0.1):
+    reference = {(row["instance"], row["benchmark"]): row for row in baseline["summary"]}
+    regressions = []
+    for row in summary:
+        before = reference.get((row["instance"], row["benchmark"]))
+        if before is None or before["median"] <= 0:
+            continue
+        ratio = row["median"] / before["median"]
+        if ratio > 1 + threshold:
+            regressions.append({"instance": row["instance"], "benchmark": row["benchmark"],
+                                "baseline": before["median"], "median": row["median"], "ratio": ratio})
+    return regressions
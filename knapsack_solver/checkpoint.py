@@ -0,0 +1,123 @@
+import contextlib
+import hashlib
+import os
+import tempfile
+import time
+
+import numpy as np
+
+# Checkpoints de execuções longas. O estado é um conjunto de vetores NumPy gravado como
+# .npz comprimido (sem pickle): soluções com um bit por item, o estado do gerador
+# random.Random e o conteúdo dos caches. A gravação é atômica: o arquivo antigo só é
+# substituído depois que o novo está inteiro no disco, então um processo morto no meio
+# da gravação deixa o checkpoint anterior intacto.
+
+FORMAT_VERSION = 2
+
+# Grava os vetores em path num arquivo temporário do mesmo diretório, força os dados para
+# o disco e o renomeia sobre path (os.replace é atômico no mesmo sistema de arquivos)
+def atomic_savez(path, **arrays):
+    path = os.fspath(path)
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(prefix=".checkpoint-", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.savez_compressed(f, **arrays)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    finally:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+    # Persiste também a entrada do diretório (POSIX)
+    if hasattr(os, "O_DIRECTORY"):
+        dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+# Identifica a instância, para não retomar um checkpoint com dados diferentes
+def instance_fingerprint(n, Q, profits, weights):
+    digest = hashlib.sha256()
+    digest.update(np.array([n, Q], dtype=np.int64).tobytes())
+    digest.update(np.asarray(profits, dtype=np.int64).tobytes())
+    digest.update(np.asarray(weights, dtype=np.int64).tobytes())
+    return np.frombuffer(digest.digest(), dtype=np.uint8)
+
+# Soluções 0/1 (uma ou uma matriz, uma por linha) com um bit por item
+def pack_bits(solutions):
+    return np.packbits(np.asarray(solutions, dtype=np.uint8), axis=-1)
+
+def unpack_bits(packed, n):
+    return np.unpackbits(packed, axis=-1, count=n)
+
+# Estado de um random.Random (ou do módulo random): as 624 palavras do Mersenne Twister
+# e a posição, mais o valor guardado de gauss (NaN se não houver)
+def pack_rng(rng):
+    version, internal, gauss_next = rng.getstate()
+    return {
+        "rng_version": np.array(version, dtype=np.int64),
+        "rng_internal": np.array(internal, dtype=np.uint32),
+        "rng_gauss": np.array(np.nan if gauss_next is None else gauss_next, dtype=np.float64),
+    }
+
+def unpack_rng(rng, state):
+    gauss_next = float(state["rng_gauss"])
+    rng.setstate((int(state["rng_version"]), tuple(int(x) for x in state["rng_internal"]),
+                  None if np.isnan(gauss_next) else gauss_next))
+
+# Parâmetros da execução, conferidos por Checkpointer.check ao retomar
+def pack_params(**params):
+    return {f"param_{name}": np.array(value) for name, value in params.items()}
+
+# Checkpoint periódico em path: due(iteration) é verdadeiro a cada every iterações e/ou
+# depois de interval segundos desde a última gravação. save grava atomicamente os
+# vetores dados; load devolve o último estado gravado (dict de vetores) ou None se o
+# arquivo não existe.
+class Checkpointer:
+    __slots__ = ("path", "every", "interval", "clock", "saves", "last_iteration", "last_time")
+
+    def __init__(self, path, every=None, interval=60.0, clock=time.perf_counter):
+        self.path = os.fspath(path)
+        self.every = every
+        self.interval = interval
+        self.clock = clock
+        self.saves = 0
+        self.last_iteration = 0
+        self.last_time = clock()
+
+    def due(self, iteration):
+        if self.every is not None and iteration - self.last_iteration >= self.every:
+            return True
+        return self.interval is not None and self.clock() - self.last_time >= self.interval
+
+    def save(self, iteration, **arrays):
+        atomic_savez(self.path, format_version=np.array(FORMAT_VERSION), iteration=np.array(iteration, dtype=np.int64),
+                     **arrays)
+        self.saves += 1
+        self.last_iteration = iteration
+        self.last_time = self.clock()
+
+    def load(self):
+        if not os.path.exists(self.path):
+            return None
+        with np.load(self.path, allow_pickle=False) as data:
+            state = {key: data[key] for key in data.files}
+        version = int(state.get("format_version", -1))
+        if version != FORMAT_VERSION:
+            raise ValueError(f"{self.path}: versão de checkpoint {version} não suportada (esperada {FORMAT_VERSION})")
+        self.last_iteration = int(state["iteration"])
+        return state
+
+    # Confere se o checkpoint é desta instância e destes parâmetros
+    def check(self, state, fingerprint, **params):
+        if not np.array_equal(state["fingerprint"], fingerprint):
+            raise ValueError(f"{self.path}: o checkpoint é de outra instância")
+        for name, value in params.items():
+            saved = state[f"param_{name}"].item()
+            if saved != value:
+                raise ValueError(f"{self.path}: o checkpoint usa {name} = {saved}, não {value}")
+
+    def __repr__(self):
+        return f"Checkpointer({self.path!r}, every={self.every}, interval={self.interval})"
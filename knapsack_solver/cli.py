@@ -0,0 +1,557 @@
+import argparse
+import random
+import time
+
+from .instance import LAYOUTS, LazyInstance
+
+# Linha de comando: python -m knapsack_solver <subcomando> <instância> [opções]
+# Cada subcomando só importa as heurísticas que usa e só lê a instância ao executar.
+
+CONSTRUCT_METHODS = ("random", "smart", "greedy")
+LOCAL_SEARCH_METHODS = ("fi", "bi", "hc-fi", "hc-bi", "vnd")
+
+def build_parser():
+    # As escolhas válidas vêm dos próprios módulos, para não divergirem
+    from .generator import FAMILIES
+    from .instrumentation import PROFILERS
+    from .moves import NEIGHBORHOODS
+    from .tuning import TUNING_METHODS
+
+    parser = argparse.ArgumentParser(prog="knapsack_solver", description="Heurísticas para o problema da mochila 0/1")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("instance", help="arquivo da instância (texto ou .npz)")
+    common.add_argument("--seed", type=int, default=None, help="semente do gerador aleatório")
+    common.add_argument("--cache", action="store_true", help="usa/grava a cópia binária <instância>.npz")
+    common.add_argument("--layout", choices=LAYOUTS, default=None, help="formato do arquivo texto (padrão: detectado)")
+    common.add_argument("--profile", default=None, metavar="PATH", help="grava o perfil da execução em PATH")
+    common.add_argument("--profiler", choices=PROFILERS, default="cprofile", help="cProfile (.prof) ou pyinstrument (.html/.txt)")
+
+    checkpointing = argparse.ArgumentParser(add_help=False)
+    checkpointing.add_argument("--checkpoint", default=None, metavar="PATH", help="grava o estado da busca em PATH (.npz)")
+    checkpointing.add_argument("--checkpoint-every", type=int, default=None, metavar="N", help="grava a cada N iterações")
+    checkpointing.add_argument("--checkpoint-interval", type=float, default=60.0, metavar="SECONDS",
+                               help="grava depois de SECONDS segundos desde a última gravação")
+    checkpointing.add_argument("--resume", action="store_true", help="continua do checkpoint, se existir")
+
+    construct = subparsers.add_parser("construct", parents=[common], help="constrói uma solução inicial")
+    construct.add_argument("--method", choices=CONSTRUCT_METHODS, default="greedy")
+    construct.add_argument("--alpha", type=float, default=0.12, help="α da construção gulosa randomizada")
+    construct.add_argument("--time-limit", type=float, default=2.0, help="limite de tempo da construção (s)")
+
+    local_search = subparsers.add_parser("local-search", parents=[common, checkpointing], help="busca local a partir de soluções aleatórias")
+    local_search.add_argument("--method", choices=LOCAL_SEARCH_METHODS, default="hc-fi")
+    local_search.add_argument("--starts", type=int, default=1, help="número de soluções iniciais")
+    local_search.add_argument("--order", choices=("sequential", "circular", "random"), default="circular")
+    local_search.add_argument("--time-limit", type=float, default=None, help="tempo total (s); nenhuma nova partida começa depois dele")
+    local_search.add_argument("--neighborhoods", nargs="+", choices=NEIGHBORHOODS, default=list(NEIGHBORHOODS),
+                              help="vizinhanças encadeadas pelo VND, em ordem")
+
+    grasp = subparsers.add_parser("grasp", parents=[common, checkpointing], help="GRASP (construção + hill climbing)")
+    grasp.add_argument("--iterations", type=int, default=10000)
+    grasp.add_argument("--alpha", type=float, default=0.12)
+    grasp.add_argument("--workers", type=int, default=1, help="processos; 1 executa em série")
+    grasp.add_argument("--target", type=int, default=None, help="para ao alcançar este lucro (modo paralelo)")
+    grasp.add_argument("--time-limit", type=float, default=None, help="tempo total (s)")
+    grasp.add_argument("--reactive", action="store_true", help="GRASP reativo: α adaptado durante a execução")
+    grasp.add_argument("--reduce", action="store_true", help="fixa itens por custo reduzido e resolve só o núcleo")
+    grasp.add_argument("--core-size", type=int, default=None, help="limita o núcleo (fixação heurística dos demais)")
+    grasp.add_argument("--memo", type=int, default=0, metavar="SIZE", help="guarda até SIZE ótimos locais por construção (modo serial)")
+    grasp.add_argument("--stats", action="store_true", help="conta avaliações e movimentos e mede cada fase (modo serial)")
+    grasp.add_argument("--trace", default=None, metavar="PATH", help="grava os eventos de melhora em CSV (modo serial)")
+    grasp.add_argument("--relink", choices=("forward", "backward", "mixed"), default=None,
+                       help="path relinking com um pool de elite, na direção dada (modo serial)")
+    grasp.add_argument("--relink-mode", choices=("intensify", "post", "both"), default="both",
+                       help="relinking de cada ótimo local com o pool, do pool ao final, ou os dois")
+    grasp.add_argument("--pool-size", type=int, default=10, help="soluções no pool de elite")
+
+    tune_alpha = subparsers.add_parser("tune-alpha", parents=[common], help="procura o melhor α da construção")
+    tune_alpha.add_argument("--alpha-values", type=int, default=100, help="testa α = 0, 1/k, ..., 1")
+    tune_alpha.add_argument("--time-limit", type=float, default=1.0, help="limite de tempo de cada construção (s)")
+    tune_alpha.add_argument("--method", choices=("serial",) + TUNING_METHODS, default="halving",
+                            help="varredura serial (uma amostra por α), successive halving ou racing")
+    tune_alpha.add_argument("--workers", type=int, default=None, help="processos (padrão: número de CPUs)")
+    tune_alpha.add_argument("--samples", type=int, default=32, help="máximo de amostras por α")
+    tune_alpha.add_argument("--local-search", action="store_true", help="avalia cada amostra após hill climbing")
+    tune_alpha.add_argument("--top", type=int, default=10, help="linhas da tabela exibidas")
+
+    anneal = subparsers.add_parser("anneal", parents=[common], help="simulated annealing")
+    anneal.add_argument("--initial", choices=("smart", "greedy"), default="smart", help="heurística da solução inicial")
+    anneal.add_argument("--schedule", choices=("geometric", "adaptive", "reheating"), default="geometric")
+    anneal.add_argument("--infeasible", choices=("penalty", "repair"), default="penalty")
+    anneal.add_argument("--iterations", type=int, default=1_000_000, help="número máximo de movimentos")
+    anneal.add_argument("--alpha", type=float, default=0.12, help="α da solução inicial gulosa randomizada")
+    anneal.add_argument("--time-limit", type=float, default=None, help="tempo total (s)")
+
+    solve = subparsers.add_parser("solve", parents=[common], help="melhor solução dentro de um prazo (anytime)")
+    solve.add_argument("--time-limit", type=float, default=1.0, help="prazo em segundos")
+    solve.add_argument("--method", choices=("grasp", "anneal"), default="grasp", help="fase de melhora após a construção gulosa")
+    solve.add_argument("--alpha", type=float, default=0.12, help="α da construção gulosa randomizada (grasp)")
+    solve.add_argument("--progress", action="store_true", help="mostra cada melhora")
+
+    ga = subparsers.add_parser("ga", parents=[common], help="algoritmo genético vetorizado")
+    ga.add_argument("--population", type=int, default=100)
+    ga.add_argument("--generations", type=int, default=None, help="número máximo de gerações")
+    ga.add_argument("--time-limit", type=float, default=None, help="tempo total (s); padrão 5 s sem --generations")
+    ga.add_argument("--crossover", choices=("uniform", "one-point"), default="uniform")
+    ga.add_argument("--mutation-rate", type=float, default=None, help="probabilidade de inverter cada bit (padrão 1/n)")
+    ga.add_argument("--elite", type=int, default=2, help="melhores indivíduos mantidos a cada geração")
+
+    pareto = subparsers.add_parser("pareto", parents=[common], help="frente de Pareto por Pareto local search")
+    pareto.add_argument("--objectives", choices=("profit-weight", "bi-profit"), default="profit-weight")
+    pareto.add_argument("--second", default=None, help="arquivo com o segundo vetor de lucros (bi-profit); padrão: "
+                                                      "lucros aleatórios em [1, 1000] pela semente")
+    pareto.add_argument("--moves", choices=("flip", "flip+pairs", "flip+swap"), default=None,
+                        help="vizinhança da busca (padrão: flip+swap em bi-profit, flip em profit-weight)")
+    pareto.add_argument("--time-limit", type=float, default=10.0, help="tempo total (s)")
+    pareto.add_argument("--output", default=None, help="grava a frente: objetivos e itens escolhidos, uma por linha")
+
+    tabu = subparsers.add_parser("tabu", parents=[common], help="busca tabu (bit flip, tabu por hash de solução)")
+    tabu.add_argument("--initial", choices=("smart", "greedy"), default="smart", help="heurística da solução inicial")
+    tabu.add_argument("--tenure", type=int, default=None, help="soluções mantidas na lista tabu (padrão: max(7, n/10))")
+    tabu.add_argument("--iterations", type=int, default=1000)
+    tabu.add_argument("--alpha", type=float, default=0.12, help="α da solução inicial gulosa randomizada")
+    tabu.add_argument("--time-limit", type=float, default=None, help="tempo total (s)")
+
+    exact = subparsers.add_parser("exact", parents=[common], help="resolve de forma exata e compara com as heurísticas")
+    exact.add_argument("--method", choices=("dp", "bb"), default="dp", help="programação dinâmica ou branch-and-bound")
+    exact.add_argument("--time-limit", type=float, default=None, help="limite de tempo do branch-and-bound (s)")
+    exact.add_argument("--reduce", action="store_true", help="fixa itens por custo reduzido e resolve só o núcleo")
+    exact.add_argument("--core-size", type=int, default=None, help="limita o núcleo (fixação heurística; sem prova)")
+    exact.add_argument("--compare", action="store_true", help="mostra o gap de cada heurística em relação ao ótimo")
+
+    batch = subparsers.add_parser("batch", help="resolve muitas instâncias e grava um registro por instância")
+    batch.add_argument("sources", nargs="*", help="arquivos de instância ou diretórios")
+    batch.add_argument("--manifest", action="append", default=[], metavar="FILE", help="arquivo com um caminho por linha")
+    batch.add_argument("--pattern", default="*.txt", help="arquivos considerados dentro dos diretórios")
+    batch.add_argument("--output", default="-", help="saída .jsonl, .csv ou .parquet (pyarrow); '-' grava JSONL na tela")
+    batch.add_argument("--time-limit", type=float, default=1.0, help="prazo por instância (s)")
+    batch.add_argument("--method", choices=("grasp", "anneal"), default="grasp", help="fase de melhora após a construção gulosa")
+    batch.add_argument("--alpha", type=float, default=0.12, help="α da construção gulosa randomizada (grasp)")
+    batch.add_argument("--workers", type=int, default=1, help="processos; 1 resolve em série")
+    batch.add_argument("--seed", type=int, default=None)
+    batch.add_argument("--cache", action="store_true", help="usa/grava a cópia binária <instância>.npz")
+
+    generate = subparsers.add_parser("generate", help="gera instâncias sintéticas (famílias de Pisinger)")
+    generate.add_argument("directory", help="diretório de saída")
+    generate.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 10000])
+    generate.add_argument("--families", nargs="+", choices=FAMILIES, default=list(FAMILIES))
+    generate.add_argument("--per-family", type=int, default=1, help="instâncias por família e tamanho")
+    generate.add_argument("--range", type=int, default=1000, dest="R", help="pesos em [1, R]")
+    generate.add_argument("--capacity-ratio", type=float, default=0.5, help="capacidade como fração da soma dos pesos")
+    generate.add_argument("--seed", type=int, default=0)
+
+    benchmark = subparsers.add_parser("benchmark", help="mede tempo e lucro das heurísticas com sementes fixas")
+    benchmark.add_argument("instances", nargs="+", help="arquivos de instância")
+    benchmark.add_argument("--benchmarks", nargs="+", default=None, help="casos a executar (padrão: heurísticas rápidas)")
+    benchmark.add_argument("--repeats", type=int, default=5)
+    benchmark.add_argument("--warmup", type=int, default=1, help="execuções descartadas antes das medidas")
+    benchmark.add_argument("--seed", type=int, default=0)
+    benchmark.add_argument("--output", nargs="+", default=[], help="arquivos .json e/ou .csv de resultados")
+    benchmark.add_argument("--baseline", default=None, help="resultado .json anterior para detectar regressões")
+    benchmark.add_argument("--threshold", type=float, default=0.1, help="aumento relativo da mediana tratado como regressão")
+
+    return parser
+
+# Com --reduce, troca a instância pelo núcleo (reduction.reduce_instance)
+def reduce_if_requested(args, n, Q, profits, weights):
+    if not args.reduce:
+        return None, (n, Q, profits, weights)
+    from .reduction import reduce_instance
+
+    core = reduce_instance(n, Q, profits, weights, core_size=args.core_size)
+    print(f"Core: {core.n} of {n} items free, {len(core.fixed_ones)} fixed to 1, "
+          f"bounds [{core.lower_bound}, {core.upper_bound}]")
+    return core, (core.n, core.Q, core.profits, core.weights)
+
+# Solução completa a partir da solução do núcleo (ou a solução conhecida, se for melhor)
+def expand_core(core, solution, profits, weights, Q):
+    from .evaluation import evaluate_solution
+
+    candidates = [core.incumbent]
+    if solution is not None:
+        candidates.append(core.expand(solution))
+    solution = max(candidates, key=lambda s: evaluate_solution(s, profits, weights, Q)[0])
+    return solution, evaluate_solution(solution, profits, weights, Q)[0]
+
+# Checkpointer das opções --checkpoint*, ou None
+def make_checkpointer(args):
+    if args.checkpoint is None:
+        if args.resume:
+            raise ValueError("--resume precisa de --checkpoint")
+        return None
+    from .checkpoint import Checkpointer
+
+    return Checkpointer(args.checkpoint, args.checkpoint_every, args.checkpoint_interval)
+
+def run_construct(args, instance):
+    from .construction import greedy_randomized_solution, random_constructive_heuristic, smart_constructive_heuristic
+
+    n, Q, profits, weights = instance.load()
+    start_time = time.perf_counter()
+    if args.method == "random":
+        solution, weight, profit = random_constructive_heuristic(n, Q, profits, weights, args.time_limit)
+    elif args.method == "smart":
+        solution, weight, profit = smart_constructive_heuristic(n, Q, weights, profits, args.time_limit)
+    else:
+        solution, weight, profit = greedy_randomized_solution(n, profits, weights, Q, args.alpha, args.time_limit)
+    elapsed = time.perf_counter() - start_time
+    print(f"Method: {args.method}")
+    print(f"Items selected: {sum(solution)}")
+    print(f"Total weight: {weight}")
+    print(f"Total Profit: {profit}")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_local_search(args, instance):
+    from .construction import generate_random_solution
+    from .evaluation import evaluate_solution
+    from .local_search import (
+        best_improvement,
+        first_improvement,
+        hill_climbing_bi,
+        hill_climbing_fi,
+        variable_neighborhood_descent,
+    )
+
+    n, Q, profits, weights = instance.load()
+    rng = random.Random(args.seed)
+    searches = {
+        "fi": lambda s: first_improvement(s, profits, weights, Q, args.order, rng=rng),
+        "bi": lambda s: best_improvement(s, profits, weights, Q),
+        "hc-fi": lambda s: hill_climbing_fi(s, profits, weights, Q, args.order, rng=rng),
+        "hc-bi": lambda s: hill_climbing_bi(s, profits, weights, Q),
+        "vnd": lambda s: variable_neighborhood_descent(s, profits, weights, Q, args.neighborhoods, rng=rng),
+    }
+    search = searches[args.method]
+    checkpoint = make_checkpointer(args)
+    start_time = time.perf_counter()
+    results = []
+    if checkpoint is not None:
+        import numpy as np
+
+        from .checkpoint import instance_fingerprint, pack_params, pack_rng, unpack_rng
+
+        fingerprint = instance_fingerprint(n, Q, profits, weights)
+        params = {"method": args.method, "order": args.order, "neighborhoods": ",".join(args.neighborhoods)}
+        state = checkpoint.load() if args.resume else None
+        if state is not None:
+            checkpoint.check(state, fingerprint, **params)
+            results = state["results"].tolist()
+            unpack_rng(rng, state)
+            start_time -= float(state["elapsed"])
+
+        def save():
+            checkpoint.save(len(results), fingerprint=fingerprint, results=np.array(results, dtype=np.int64),
+                            elapsed=np.array(time.perf_counter() - start_time),
+                            **pack_params(**params), **pack_rng(rng))
+
+    for _ in range(len(results), args.starts):
+        if args.time_limit is not None and time.perf_counter() - start_time >= args.time_limit:
+            break
+        solution = search(generate_random_solution(weights, Q, rng=rng))
+        results.append(evaluate_solution(solution, profits, weights, Q)[0])
+        if checkpoint is not None and checkpoint.due(len(results)):
+            save()
+    if checkpoint is not None:
+        save()
+    elapsed = time.perf_counter() - start_time
+    print(f"Method: {args.method}")
+    print(f"Starts: {len(results)}")
+    if results:
+        print(f"Average Profit: {sum(results) / len(results)}")
+        print(f"Best Profit: {max(results)}")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_grasp(args, instance):
+    from .evaluation import evaluate_solution
+    from .grasp import grasp_knapsack, parallel_grasp_knapsack, reactive_grasp
+
+    full = instance.load()
+    checkpoint = make_checkpointer(args)
+    if checkpoint is not None and (args.reactive or args.workers > 1 or args.target is not None
+                                   or (args.relink is not None and args.relink_mode != "post")):
+        raise ValueError("--checkpoint só vale para o GRASP serial")
+    if args.relink is not None and args.relink_mode != "post":
+        # grasp_path_relinking tem laço próprio, sem paralelismo, cache nem instrumentação
+        ignored = [option for option, used in (("--workers", args.workers > 1), ("--target", args.target is not None),
+                                               ("--memo", args.memo), ("--stats", args.stats),
+                                               ("--trace", args.trace is not None), ("--reactive", args.reactive))
+                   if used]
+        if ignored:
+            raise ValueError(f"--relink-mode {args.relink_mode} não aceita {', '.join(ignored)} (use --relink-mode post)")
+    start_time = time.perf_counter()
+    core, (n, Q, profits, weights) = reduce_if_requested(args, *full)
+    if core is not None and not core.n:
+        solution, profit = None, 0
+    elif args.reactive:
+        solution, profit, table = reactive_grasp(n, profits, weights, Q, args.iterations, time_limit=args.time_limit,
+                                                 rng=random.Random(args.seed))
+        for row in table:
+            mean = "-" if row["mean"] is None else f"{row['mean']:.1f}"
+            print(f"alpha={row['alpha']:.2f} p={row['probability']:.3f} mean={mean} samples={row['samples']}")
+    elif args.relink is not None and args.relink_mode != "post":
+        from .relinking import grasp_path_relinking
+
+        solution, profit, pool = grasp_path_relinking(n, profits, weights, Q, args.iterations, args.alpha,
+                                                      args.pool_size, direction=args.relink,
+                                                      post_optimization=args.relink_mode == "both",
+                                                      time_limit=args.time_limit, rng=random.Random(args.seed))
+        print(f"Elite pool: {len(pool)} solutions, profits {pool.profits[:len(pool)].min()}..{profit}")
+    elif args.workers > 1 or args.target is not None:
+        solution, profit = parallel_grasp_knapsack(n, profits, weights, Q, args.iterations, args.alpha, workers=args.workers,
+                                                   seed=args.seed, target_profit=args.target, time_limit=args.time_limit)
+    else:
+        probe = None
+        if args.stats or args.trace:
+            from .instrumentation import Probe
+
+            probe = Probe()
+        cache = None
+        if args.memo:
+            from .memo import SolutionCache
+
+            cache = SolutionCache(n, args.memo)
+        pool = None
+        search_limit = args.time_limit
+        if args.relink is not None:
+            from .relinking import POST_SHARE, ElitePool
+
+            pool = ElitePool(n, args.pool_size)
+            if search_limit is not None:
+                search_limit *= 1 - POST_SHARE  # O resto do tempo fica para a pós-otimização
+        solution, profit = grasp_knapsack(n, profits, weights, Q, args.iterations, args.alpha, time_limit=search_limit,
+                                          rng=random.Random(args.seed), probe=probe, cache=cache, checkpoint=checkpoint,
+                                          resume=args.resume, pool=pool)
+        if pool is not None and len(pool) > 1:
+            from .relinking import post_optimize
+
+            remaining = None
+            if args.time_limit is not None:
+                remaining = max(args.time_limit - (time.perf_counter() - start_time), 0.0)
+            pool = post_optimize(pool, profits, weights, Q, args.relink, time_limit=remaining)
+            solution, profit = pool.best()
+            print(f"Elite pool: {len(pool)} solutions, profits {pool.profits[:len(pool)].min()}..{profit}")
+        if checkpoint is not None:
+            print(f"Checkpoint: {checkpoint.path} ({checkpoint.saves} saves, iteration {checkpoint.last_iteration})")
+        if cache is not None:
+            stats = cache.stats
+            print(f"Memo: {stats['hits']} hits, {stats['misses']} misses, {stats['evictions']} evictions "
+                  f"(hit rate {stats['hit_rate']:.1%})")
+        if args.stats:
+            print(probe.format_report())
+        if args.trace:
+            from .instrumentation import write_events
+
+            write_events(args.trace, probe.events)
+    n, Q, profits, weights = full
+    if core is not None:
+        solution, profit = expand_core(core, solution, profits, weights, Q)
+    elapsed = time.perf_counter() - start_time
+    print(f"Profit: {profit}")
+    if solution is not None:
+        print(f"Total weight: {evaluate_solution(solution, profits, weights, Q)[1]}")
+        print(f"Items selected: {sum(solution)}")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_tune_alpha(args, instance):
+    n, Q, profits, weights = instance.load()
+    start_time = time.perf_counter()
+    if args.method == "serial":
+        from .experiments import find_best_alpha
+
+        best_alpha, best_profit = find_best_alpha(n, profits, weights, Q, args.alpha_values, args.time_limit)
+        print(f"Best alpha: {best_alpha}, Best profit: {best_profit}")
+    else:
+        from .tuning import tune_alpha
+
+        alphas = [i / args.alpha_values for i in range(args.alpha_values + 1)]
+        table = tune_alpha(n, profits, weights, Q, alphas, args.method, max_samples=args.samples, workers=args.workers,
+                           seed=args.seed, time_limit=args.time_limit, local_search=args.local_search)
+        for row in table[:args.top]:
+            eliminated = "-" if row["eliminated"] is None else row["eliminated"]
+            print(f"alpha={row['alpha']:.2f} mean={row['mean']:.1f} std={row['std']:.1f} best={row['best']} "
+                  f"samples={row['samples']} eliminated={eliminated}")
+        print(f"Best alpha: {table[0]['alpha']}, Mean profit: {table[0]['mean']:.1f}")
+    elapsed = time.perf_counter() - start_time
+    print(f"Time: {elapsed:.6f}s")
+
+def run_anneal(args, instance):
+    from .annealing import simulated_annealing
+
+    n, Q, profits, weights = instance.load()
+    start_time = time.perf_counter()
+    solution, profit, moves = simulated_annealing(n, profits, weights, Q, args.initial, args.schedule, time_limit=args.time_limit,
+                                                  max_iterations=args.iterations, infeasible=args.infeasible, alpha=args.alpha,
+                                                  rng=random.Random(args.seed))
+    elapsed = time.perf_counter() - start_time
+    print(f"Profit: {profit}")
+    print(f"Items selected: {sum(solution)}")
+    print(f"Moves: {moves} ({moves / elapsed:.0f}/s)")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_ga(args, instance):
+    from .genetic import genetic_algorithm
+
+    n, Q, profits, weights = instance.load()
+    time_limit = args.time_limit
+    if time_limit is None and args.generations is None:
+        time_limit = 5.0
+    start_time = time.perf_counter()
+    solution, profit, generations, rate = genetic_algorithm(n, profits, weights, Q, args.population, args.generations,
+                                                            time_limit, args.crossover, mutation_rate=args.mutation_rate,
+                                                            elite=args.elite, seed=args.seed)
+    elapsed = time.perf_counter() - start_time
+    print(f"Profit: {profit}")
+    print(f"Items selected: {sum(solution)}")
+    print(f"Generations: {generations} ({rate:.1f}/s)")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_pareto(args, instance):
+    from .multiobjective import default_reference, front_summary, objective_matrix, pareto_local_search
+
+    n, Q, profits, weights = instance.load()
+    second = None
+    if args.objectives == "bi-profit":
+        if args.second is not None:
+            with open(args.second) as f:
+                second = [int(v) for v in f.read().split()]
+            if len(second) != n:
+                raise ValueError(f"{args.second}: esperados {n} lucros, lidos {len(second)}")
+        else:
+            rng = random.Random(args.seed)
+            second = [rng.randint(1, 1000) for _ in range(n)]
+    matrix = objective_matrix(profits, weights, args.objectives, second)
+    start_time = time.perf_counter()
+    archive, evaluations = pareto_local_search(n, matrix, weights, Q, time_limit=args.time_limit, moves=args.moves,
+                                               rng=random.Random(args.seed))
+    elapsed = time.perf_counter() - start_time
+    summary = front_summary(archive, default_reference(matrix, Q))
+    print(f"Front size: {summary['size']}")
+    print(f"Hypervolume: {summary['hypervolume']}")
+    print(f"Best per objective: {' '.join(str(v) for v in summary['best'])}")
+    print(f"Evaluations: {evaluations}")
+    print(f"Time: {elapsed:.6f}s")
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            for objectives, solution in sorted(archive.points(), key=lambda point: point[0]):
+                f.write(" ".join(str(v) for v in objectives) + " | " + " ".join(str(i) for i in solution.ones()) + "\n")
+
+def run_tabu(args, instance):
+    from .tabu import tabu_search
+
+    n, Q, profits, weights = instance.load()
+    start_time = time.perf_counter()
+    solution, profit, iterations = tabu_search(n, profits, weights, Q, args.initial, args.tenure, args.iterations,
+                                               args.time_limit, args.alpha, rng=random.Random(args.seed))
+    elapsed = time.perf_counter() - start_time
+    print(f"Profit: {profit}")
+    print(f"Items selected: {sum(solution)}")
+    print(f"Iterations: {iterations}")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_solve(args, instance):
+    from .anytime import solve_anytime
+
+    n, Q, profits, weights = instance.load()
+
+    def show(snapshot):
+        print(f"{snapshot.time:.6f}s {snapshot.phase} #{snapshot.iteration}: {snapshot.profit}")
+
+    result = solve_anytime(n, profits, weights, Q, args.time_limit, method=args.method, alpha=args.alpha,
+                           rng=random.Random(args.seed), on_progress=show if args.progress else None)
+    print(f"Profit: {result.profit}")
+    print(f"Total weight: {result.weight}")
+    print(f"Items selected: {sum(result.solution)}")
+    print(f"Found at: {result.time:.6f}s (iteration {result.iteration}, {result.phase})")
+
+def run_exact(args, instance):
+    n, Q, profits, weights = instance.load()
+    if args.compare:
+        from .experiments import optimality_report
+
+        optimality_report(n, profits, weights, Q, args.method, exact_time_limit=args.time_limit)
+        return
+
+    from .exact import solve_exact
+
+    start_time = time.perf_counter()
+    core, (core_n, core_Q, core_profits, core_weights) = reduce_if_requested(args, n, Q, profits, weights)
+    solution, optimum, proven, elapsed = solve_exact(core_n, core_Q, core_profits, core_weights, args.method, args.time_limit)
+    if core is not None:
+        solution, optimum = expand_core(core, solution, profits, weights, Q)
+        proven = proven and args.core_size is None
+        elapsed = time.perf_counter() - start_time
+    print(f"Optimum: {optimum}" + ("" if proven else " (não provado)"))
+    print(f"Items selected: {sum(solution)}")
+    print(f"Time: {elapsed:.6f}s")
+
+def run_batch(args, instance):
+    import sys
+
+    from .batch import iter_instance_paths, open_writer, solve_batch
+
+    paths = iter_instance_paths(args.sources, args.manifest, args.pattern)
+    writer = open_writer(args.output)
+    try:
+        summary = solve_batch(paths, writer, args.time_limit, args.method, args.alpha, args.workers, seed=args.seed,
+                              cache=args.cache)
+    finally:
+        writer.close()
+    # Com a saída na tela, o resumo vai para stderr para não se misturar ao JSONL
+    log = sys.stderr if args.output == "-" else sys.stdout
+    print(f"Solved: {summary['solved']}", file=log)
+    print(f"Errors: {summary['errors']}", file=log)
+    print(f"Time: {summary['time']:.6f}s", file=log)
+    return 1 if summary["errors"] else 0
+
+def run_generate(args, instance):
+    from .generator import generate_suite
+
+    paths = generate_suite(args.directory, args.sizes, args.families, args.per_family, args.R, args.capacity_ratio, args.seed)
+    for path in paths:
+        print(path)
+
+def run_benchmark(args, instance):
+    from .benchmark import DEFAULT_BENCHMARKS, compare_results, load_results, run_benchmark, summarize, write_results
+
+    records = run_benchmark(args.instances, args.benchmarks or DEFAULT_BENCHMARKS, args.repeats, args.warmup, args.seed)
+    summary = summarize(records)
+    for row in summary:
+        print(f"{row['instance']} {row['benchmark']}: median={row['median']:.6f}s p10={row['p10']:.6f}s "
+              f"p90={row['p90']:.6f}s mean_profit={row['mean_profit']:.1f} best_profit={row['best_profit']}")
+    for path in args.output:
+        write_results(path, records, summary)
+    if args.baseline is not None:
+        regressions = compare_results(load_results(args.baseline), summary, args.threshold)
+        for row in regressions:
+            print(f"REGRESSION {row['instance']} {row['benchmark']}: {row['baseline']:.6f}s -> {row['median']:.6f}s "
+                  f"({row['ratio']:.2f}x)")
+        return 1 if regressions else 0
+
+COMMANDS = {
+    "construct": run_construct,
+    "local-search": run_local_search,
+    "grasp": run_grasp,
+    "tune-alpha": run_tune_alpha,
+    "anneal": run_anneal,
+    "tabu": run_tabu,
+    "ga": run_ga,
+    "pareto": run_pareto,
+    "solve": run_solve,
+    "exact": run_exact,
+    "batch": run_batch,
+    "generate": run_generate,
+    "benchmark": run_benchmark,
+}
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    random.seed(args.seed)
+    instance = LazyInstance(args.instance, args.layout, args.cache) if "instance" in args else None
+    if getattr(args, "profile", None):
+        from .instrumentation import profiling
+
+        with profiling(args.profile, args.profiler):
+            return COMMANDS[args.command](args, instance) or 0
+    return COMMANDS[args.command](args, instance) or 0
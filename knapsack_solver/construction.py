@@ -0,0 +1,183 @@
+import random
+import time
+
+from .bitset import BitSolution
+
+# Heurísticas construtivas: todas devolvem uma solução completa (lista de 0/1, ou
+# BitSolution com compact=True). Se o limite de tempo acabar antes, devolvem a
+# solução (viável) construída até ali. O relógio é consultado a cada CHECK_EVERY
+# passos, e não a cada item.
+
+CHECK_EVERY = 256
+
+# Heurística construtiva aleatória: percorre os itens e inclui cada um com probabilidade 1/2
+def random_constructive_heuristic(n, Q, profits, weights, time_limit, compact=False, rng=random):
+    start_time = time.perf_counter()
+    solution = BitSolution(n) if compact else [0] * n
+    total_weight = 0
+    total_profit = 0
+    i = 0
+
+    while i < n:
+        if i % CHECK_EVERY == 0 and time.perf_counter() - start_time >= time_limit:
+            break
+        if rng.random() > 0.5 and total_weight + weights[i] <= Q:
+            solution[i] = 1  # Caso o item i seja adicionado à solução, marcamos na lista
+            total_weight += weights[i]
+            total_profit += profits[i]
+        i += 1
+    
+    return solution, total_weight, total_profit
+
+# Heurística construtiva gulosa: prioridade para a maior razão lucro/peso
+def smart_constructive_heuristic(n, Q, weights, profits, time_limit, compact=False):
+    start_time = time.perf_counter()
+    solution = BitSolution(n) if compact else [0] * n
+    total_weight = 0
+    total_profit = 0
+    i = 0
+
+    # Mantemos o índice original e ordenamos pela razão lucro/peso
+    items = [(i, profits[i], weights[i]) for i in range(n)]
+
+    items.sort(key=lambda x: x[1] / x[2], reverse=True)
+
+    while i < n:
+        if i % CHECK_EVERY == 0 and time.perf_counter() - start_time >= time_limit:
+            break
+        if total_weight + items[i][2] <= Q:
+            solution[items[i][0]] = 1
+            total_weight += items[i][2]
+            total_profit += items[i][1]
+        i += 1
+
+    return solution, total_weight, total_profit
+
+# Lista restrita de candidatos (RCL) da construção gulosa randomizada.
+# Os itens são ordenados pela razão lucro/peso uma única vez; uma árvore de Fenwick
+# sobre essa ordem marca os candidatos ainda ativos, de modo que sortear um dos
+# primeiros α candidatos custa O(log n). Como a capacidade só diminui, um item que
+# deixa de caber nunca volta a ser candidato: os itens ordenados por peso são
+# descartados do mais pesado para o mais leve à medida que a capacidade encolhe.
+class RestrictedCandidateList:
+    __slots__ = ("order", "position", "by_weight", "heaviest", "weights", "active", "tree", "top", "count")
+
+    def __init__(self, n, profits, weights, capacity):
+        # Mesma ordem da ordenação estável usada antes: razão decrescente, empate pelo índice
+        self.order = sorted(range(n), key=lambda i: profits[i] / weights[i], reverse=True)
+        self.position = [0] * n
+        for pos, i in enumerate(self.order):
+            self.position[i] = pos
+        self.by_weight = sorted(range(n), key=lambda i: weights[i], reverse=True)
+        self.heaviest = 0
+        self.weights = weights
+        self.active = bytearray(b"\x01") * n
+        # Árvore de Fenwick com todos os itens ativos, construída em O(n)
+        tree = [0] * (n + 1)
+        for k in range(1, n + 1):
+            tree[k] += 1
+            parent = k + (k & -k)
+            if parent <= n:
+                tree[parent] += tree[k]
+        self.tree = tree
+        self.top = 1 << (n.bit_length() - 1) if n else 0
+        self.count = n
+        self.shrink(capacity)
+
+    def __len__(self):
+        return self.count
+
+    # Retira o item da lista de candidatos
+    def remove(self, item):
+        if not self.active[item]:
+            return
+        self.active[item] = 0
+        self.count -= 1
+        tree = self.tree
+        k = self.position[item] + 1
+        while k < len(tree):
+            tree[k] -= 1
+            k += k & -k
+
+    # Descarta os itens que não cabem mais na capacidade restante
+    def shrink(self, remaining_capacity):
+        by_weight, weights = self.by_weight, self.weights
+        while self.heaviest < len(by_weight) and weights[by_weight[self.heaviest]] > remaining_capacity:
+            self.remove(by_weight[self.heaviest])
+            self.heaviest += 1
+
+    # Candidato na posição rank (0 = melhor razão) entre os ativos
+    def candidate(self, rank):
+        tree = self.tree
+        pos = 0
+        rank += 1
+        step = self.top
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] < rank:
+                pos = nxt
+                rank -= tree[nxt]
+            step >>= 1
+        return self.order[pos]
+
+    # Sorteia uniformemente um dos max(1, int(α * candidatos)) melhores candidatos
+    def select(self, alpha, rng=random):
+        num_candidates = min(self.count, max(1, int(alpha * self.count)))
+        return self.candidate(rng.randrange(num_candidates))
+
+# Heurística gulosa randomizada para gerar solução inicial
+# Com probe (instrumentation.Probe), conta construções e itens escolhidos e mede a fase
+# Com zobrist (memo.ZobristTable), mantém o hash da solução a cada item incluído e o
+# devolve como quarto elemento, sem uma nova passada pelos n itens
+def greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit, compact=False, rng=random, probe=None,
+                               zobrist=None):
+    start_time = time.perf_counter()
+    if probe is not None:
+        phase_start = probe.clock()
+    solution = BitSolution(n) if compact else [0] * n
+    remaining_capacity = capacity
+    total_profit = 0
+    candidates = RestrictedCandidateList(n, profits, weights, capacity)
+    keys = zobrist.keys if zobrist is not None else None
+    key = 0
+    step = 0
+    while candidates:
+        if step % CHECK_EVERY == 0 and time.perf_counter() - start_time >= time_limit:
+            break
+        step += 1
+        # Seleção gulosa randomizada
+        selected_item = candidates.select(alpha, rng)
+        solution[selected_item] = 1
+        remaining_capacity -= weights[selected_item]
+        total_profit += profits[selected_item]
+        if keys is not None:
+            key ^= keys[selected_item]
+        candidates.remove(selected_item)
+        candidates.shrink(remaining_capacity)
+    if probe is not None:
+        probe.add_time("construction", probe.clock() - phase_start)
+        probe.count("constructions")
+        probe.count("construction_steps", sum(solution) if not compact else solution.popcount())
+    if keys is not None:
+        return solution, capacity-remaining_capacity, total_profit, key
+    return solution, capacity-remaining_capacity, total_profit
+
+# Função para gerar uma solução inicial aleatória válida para o problema da mochila
+# Sem rng, usa o gerador global (semeado por quem chama, ex.: --seed da linha de comando)
+def generate_random_solution(weights, capacity, inclusion_prob=0.7, compact=False, rng=random):
+    n = len(weights)
+    solution = BitSolution(n) if compact else [0] * n  # Inicialmente, nenhum item está na mochila
+    total_weight = 0
+
+    # Cria uma lista com os índices dos itens embaralhada para inclusão aleatória
+    indices = list(range(n))
+    rng.shuffle(indices)
+
+    for i in indices:
+        # Adiciona um fator de probabilidade para incluir o item
+        if rng.random() < inclusion_prob:  # Só inclui o item com a probabilidade definida
+            if total_weight + weights[i] <= capacity:
+                solution[i] = 1  # Inclui o item na mochila
+                total_weight += weights[i]
+    
+    return solution
@@ -0,0 +1,91 @@
+import numpy as np
+
+from .bitset import BitSolution, pack_solutions
+
+# Calcula o lucro e o peso (com probe, conta a avaliação em "evaluations")
+def evaluate_solution(solution, profits, weights, Q, probe=None):
+    if probe is not None:
+        probe.count("evaluations")
+    total_profit = sum(p * s for p, s in zip(profits, solution))
+    total_weight = sum(w * s for w, s in zip(weights, solution))
+    if total_weight > Q:
+        return 0, total_weight  # Se excerder a capacidade retorna 0
+    return total_profit, total_weight
+
+# Avaliação em lote: cada linha da matriz é uma solução (uint8 com 0/1, ou bits
+# empacotados com np.packbits quando packed=True; uma lista de BitSolution também
+# é aceita). Lucros e pesos de todas as linhas saem de um único produto de matrizes;
+# soluções inviáveis recebem lucro 0.
+def evaluate_solutions(solutions, profits, weights, Q, packed=False):
+    if isinstance(solutions, (list, tuple)) and solutions and isinstance(solutions[0], BitSolution):
+        solutions = pack_solutions(solutions)
+        packed = True
+    solutions = np.asarray(solutions, dtype=np.uint8)
+    if solutions.ndim == 1:
+        solutions = solutions[np.newaxis, :]
+    if packed:
+        solutions = np.unpackbits(solutions, axis=1, count=len(profits))
+    items = np.column_stack((profits, weights)).astype(np.int64)
+    totals = solutions @ items
+    total_weights = totals[:, 1]
+    total_profits = np.where(total_weights > Q, 0, totals[:, 0])  # Se exceder a capacidade retorna 0
+    return total_profits, total_weights
+
+# Avaliação incremental: mantém o lucro e o peso da solução corrente e avalia
+# um movimento em O(1) a partir dos deltas dos itens, sem copiar a solução.
+# Um movimento é uma tupla com os índices dos bits a inverter: (i,) é um bit flip
+# simples, (i, i+1) é o flip de dois bits adjacentes e (i, j) com solution[i] != solution[j]
+# é uma troca (um item sai e outro entra).
+class DeltaEvaluator:
+    __slots__ = ("solution", "profits", "weights", "Q", "profit", "weight")
+
+    def __init__(self, solution, profits, weights, Q):
+        self.solution = solution.copy()  # Cópia única; os movimentos aceitos são aplicados nela
+        self.profits = profits
+        self.weights = weights
+        self.Q = Q
+        self.profit = sum(p * s for p, s in zip(profits, solution))
+        self.weight = sum(w * s for w, s in zip(weights, solution))
+
+    # Variação de lucro e peso causada pelo movimento
+    def delta(self, move):
+        solution, profits, weights = self.solution, self.profits, self.weights
+        delta_profit = 0
+        delta_weight = 0
+        for i in move:
+            if solution[i]:  # O item sai da mochila
+                delta_profit -= profits[i]
+                delta_weight -= weights[i]
+            else:  # O item entra na mochila
+                delta_profit += profits[i]
+                delta_weight += weights[i]
+        return delta_profit, delta_weight
+
+    # Mesma regra de evaluate_solution para a solução corrente
+    def evaluate(self):
+        if self.weight > self.Q:
+            return 0, self.weight
+        return self.profit, self.weight
+
+    # Mesma regra de evaluate_solution para o vizinho, sem construí-lo
+    def evaluate_move(self, move):
+        delta_profit, delta_weight = self.delta(move)
+        weight = self.weight + delta_weight
+        if weight > self.Q:
+            return 0, weight  # Se exceder a capacidade retorna 0
+        return self.profit + delta_profit, weight
+
+    # Aceita o movimento atualizando a solução corrente
+    def apply(self, move):
+        delta_profit, delta_weight = self.delta(move)
+        for i in move:
+            self.solution[i] = 1 - self.solution[i]
+        self.profit += delta_profit
+        self.weight += delta_weight
+
+    # Materializa o vizinho (só quando o movimento é aceito)
+    def neighbor(self, move):
+        neighbor = self.solution.copy()
+        for i in move:
+            neighbor[i] = 1 - neighbor[i]
+        return neighbor
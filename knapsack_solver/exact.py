@@ -0,0 +1,132 @@
+import time
+from bisect import bisect_right
+
+import numpy as np
+
+# Métodos exatos, usados como referência para medir a distância das heurísticas ao ótimo.
+
+# Programação dinâmica 0/1 com um único vetor sobre a capacidade: best[c] é o maior lucro
+# com peso até c usando os itens já processados. Cada item atualiza o vetor inteiro com
+# uma operação NumPy, de modo que n = 10.000 e Q = 49.877 levam poucos segundos.
+# Com reconstruct=True, guarda um bit por (item, capacidade) empacotado (n * Q / 8 bytes)
+# para recuperar os itens escolhidos; sem ele, a memória é só O(Q).
+def dp_knapsack(n, Q, profits, weights, reconstruct=True):
+    best = np.zeros(Q + 1, dtype=np.int64)
+    keep = [] if reconstruct else None
+    for i in range(n):
+        p, w = int(profits[i]), int(weights[i])
+        if w > Q:
+            if reconstruct:
+                keep.append(None)
+            continue
+        candidate = best[:Q + 1 - w] + p  # Valores antes da atualização (cópia)
+        if reconstruct:
+            taken = candidate > best[w:]
+            keep.append(np.packbits(taken))
+            np.maximum(best[w:], candidate, out=best[w:])
+        else:
+            np.maximum(best[w:], candidate, out=best[w:])
+
+    optimum = int(best[Q])
+    if not reconstruct:
+        return None, optimum
+
+    # Reconstrução de trás para frente a partir da capacidade total
+    solution = [0] * n
+    capacity = Q
+    for i in range(n - 1, -1, -1):
+        row = keep[i]
+        w = int(weights[i])
+        if row is None or capacity < w:
+            continue
+        offset = capacity - w
+        if (row[offset >> 3] >> (7 - (offset & 7))) & 1:
+            solution[i] = 1
+            capacity -= w
+    return solution, optimum
+
+# Branch-and-bound de Horowitz-Sahni com o limitante fracionário de Dantzig. Os itens
+# seguem a ordem da razão lucro/peso usada por smart_constructive_heuristic; o
+# limitante de cada nó sai de somas prefixadas e de uma busca binária pelo item crítico.
+# Devolve (solução, lucro, provado_ótimo): se time_limit acabar, devolve a melhor
+# solução encontrada até ali com provado_ótimo = False.
+def branch_and_bound(n, Q, profits, weights, time_limit=None):
+    start_time = time.time()
+    order = sorted(range(n), key=lambda i: profits[i] / weights[i], reverse=True)
+    p = [int(profits[i]) for i in order]
+    w = [int(weights[i]) for i in order]
+    prefix_profit = [0] * (n + 1)
+    prefix_weight = [0] * (n + 1)
+    for k in range(n):
+        prefix_profit[k + 1] = prefix_profit[k] + p[k]
+        prefix_weight[k + 1] = prefix_weight[k] + w[k]
+
+    best_profit = 0
+    best_taken = []
+    taken = []  # Índices (na ordem da razão) com x = 1, em ordem crescente
+    capacity = Q
+    profit = 0
+    j = 0
+    nodes = 0
+    proven = True
+
+    while True:
+        nodes += 1
+        if time_limit is not None and nodes & 1023 == 0 and time.time() - start_time >= time_limit:
+            proven = False
+            break
+
+        prune = False
+        if j < n:
+            # Item crítico r: os itens j..r-1 cabem inteiros na capacidade restante
+            r = bisect_right(prefix_weight, prefix_weight[j] + capacity) - 1
+            fill_weight = prefix_weight[r] - prefix_weight[j]
+            fill_profit = prefix_profit[r] - prefix_profit[j]
+            bound = profit + fill_profit
+            if r < n:
+                bound += (capacity - fill_weight) * p[r] // w[r]
+            if bound <= best_profit:
+                prune = True
+            else:
+                # Passo para frente: inclui j..r-1 e exclui o item crítico
+                taken.extend(range(j, r))
+                capacity -= fill_weight
+                profit += fill_profit
+                j = r + 1
+                if j < n:
+                    continue
+
+        if not prune and profit > best_profit:
+            best_profit = profit
+            best_taken = taken[:]
+
+        # Retrocesso: o último item incluído passa a ser excluído
+        if not taken:
+            break
+        i = taken.pop()
+        capacity += w[i]
+        profit -= p[i]
+        j = i + 1
+
+    solution = [0] * n
+    for k in best_taken:
+        solution[order[k]] = 1
+    return solution, best_profit, proven
+
+# Distância relativa ao ótimo (0.0 = ótimo)
+def optimality_gap(profit, optimum):
+    if optimum == 0:
+        return 0.0
+    return (optimum - profit) / optimum
+
+# Resolve exatamente e mede o tempo: method "dp" ou "bb"
+def solve_exact(n, Q, profits, weights, method="dp", time_limit=None):
+    start_time = time.perf_counter()
+    if method == "dp":
+        solution, optimum = dp_knapsack(n, Q, profits, weights)
+        proven = True
+    elif method == "bb":
+        solution, optimum, proven = branch_and_bound(n, Q, profits, weights, time_limit)
+    else:
+        raise ValueError(f"Método exato desconhecido: {method}")
+    return solution, optimum, proven, time.perf_counter() - start_time
@@ -0,0 +1,191 @@
+import random
+import time
+
+import numpy as np
+
+from .construction import (
+    generate_random_solution,
+    greedy_randomized_solution,
+    random_constructive_heuristic,
+    smart_constructive_heuristic,
+)
+from .evaluation import evaluate_solutions
+from .exact import optimality_gap, solve_exact
+from .grasp import grasp_knapsack
+from .local_search import best_improvement, first_improvement, hill_climbing_bi, hill_climbing_fi
+
+# Experimentos que comparam as heurísticas e imprimem os resultados
+
+# Comparação de soluções: as populações são montadas como matrizes e avaliadas em lote
+def compare_solutions(n, Q, weights, profits, time_limit, num_solutions=10):
+    random_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+    smart_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+
+    for k in range(num_solutions):
+        random_solutions[k], _, _ = random_constructive_heuristic(n, Q, profits, weights, time_limit)
+        smart_solutions[k], _, _ = smart_constructive_heuristic(n, Q, weights, profits, time_limit)
+
+    random_evals, _ = evaluate_solutions(random_solutions, profits, weights, Q)
+    smart_evals, _ = evaluate_solutions(smart_solutions, profits, weights, Q)
+
+    avg_random = float(random_evals.mean())
+    avg_smart = float(smart_evals.mean())
+
+    return avg_random, avg_smart
+
+# Compara First e Best Improvement a partir de soluções aleatórias
+def local_search_experiment(profits, weights, Q, num_solutions=1000, rng=random):
+    n = len(weights)
+    fi_times = []
+    bi_times = []
+    fi_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+    bi_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+
+    for k in range(num_solutions):
+        solution = generate_random_solution(weights, Q, rng=rng)
+
+        # First Improvement
+        start_time = time.perf_counter()
+        fi_solutions[k] = first_improvement(solution, profits, weights, Q)
+        fi_times.append(time.perf_counter() - start_time)
+
+        # Best Improvement
+        start_time = time.perf_counter()
+        bi_solutions[k] = best_improvement(solution, profits, weights, Q)
+        bi_times.append(time.perf_counter() - start_time)
+
+    # As soluções refinadas são avaliadas em lote
+    fi_profits, _ = evaluate_solutions(fi_solutions, profits, weights, Q)
+    bi_profits, _ = evaluate_solutions(bi_solutions, profits, weights, Q)
+
+    # Compute averages
+    avg_fi_time = sum(fi_times) / len(fi_times)
+    avg_fi_profit = float(fi_profits.mean())
+
+    avg_bi_time = sum(bi_times) / len(bi_times)
+    avg_bi_profit = float(bi_profits.mean())
+
+    print(f"First Improvement: Average Time = {avg_fi_time:.6f}s, Average Profit = {avg_fi_profit}")
+    print(f"Best Improvement: Average Time = {avg_bi_time:.6f}s, Average Profit = {avg_bi_profit}")
+    
+    # Compare results
+    if avg_fi_profit > avg_bi_profit:
+        print("First Improvement performs better in terms of profit.")
+    else:
+        print("Best Improvement performs better in terms of profit.")
+    
+    if avg_fi_time < avg_bi_time:
+        print("First Improvement is faster.")
+    else:
+        print("Best Improvement is faster.")
+
+# Experimento de busca local para comparar técnicas
+def local_search_comparison(profits, weights, Q, num_solutions=1000, rng=random):
+    n = len(weights)
+    hc_bi_times, hc_fi_times = [], []
+    hc_bi_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+    hc_fi_solutions = np.zeros((num_solutions, n), dtype=np.uint8)
+
+    for k in range(num_solutions):
+        solution = generate_random_solution(weights, Q, rng=rng)
+
+        # Hill Climbing BI
+        start_time = time.perf_counter()
+        hc_bi_solutions[k] = hill_climbing_bi(solution, profits, weights, Q)
+        hc_bi_times.append(time.perf_counter() - start_time)
+
+        # Hill Climbing FI
+        start_time = time.perf_counter()
+        hc_fi_solutions[k] = hill_climbing_fi(solution, profits, weights, Q)
+        hc_fi_times.append(time.perf_counter() - start_time)
+
+    # As soluções refinadas são avaliadas em lote
+    hc_bi_profits, _ = evaluate_solutions(hc_bi_solutions, profits, weights, Q)
+    hc_fi_profits, _ = evaluate_solutions(hc_fi_solutions, profits, weights, Q)
+
+    # Média dos resultados
+    avg_hc_bi_time = sum(hc_bi_times) / len(hc_bi_times)
+    avg_hc_bi_profit = float(hc_bi_profits.mean())
+
+    avg_hc_fi_time = sum(hc_fi_times) / len(hc_fi_times)
+    avg_hc_fi_profit = float(hc_fi_profits.mean())
+
+    # Resultados
+    print(f"Hill Climbing BI: Average Time = {avg_hc_bi_time:.6f}s, Average Profit = {avg_hc_bi_profit}")
+    print(f"Hill Climbing FI: Average Time = {avg_hc_fi_time:.6f}s, Average Profit = {avg_hc_fi_profit}")
+
+    # Comparar os melhores
+    if avg_hc_fi_profit > avg_hc_bi_profit:
+        print("First Improvement performs better in terms of profit than Best Improvement.")
+    else:
+        print("Best Improvement performs better in terms of profit than First Improvement.")
+    
+    if avg_hc_fi_time < avg_hc_bi_time:
+        print("Hill Climbing is faster than Random Descent.")
+    else:
+        print("Random Descent is faster than Hill Climbing.")
+    return hc_bi_profits, hc_fi_profits, hc_bi_times, hc_fi_times
+
+# Encontrar o melhor valor de alpha (entre 0 e 1)
+def find_best_alpha(n, profits, weights, capacity, alpha_values=100, time_limit=1):
+    best_alpha = 0
+    best_profit = float('-inf')
+    for alpha in [i / alpha_values for i in range(alpha_values + 1)]:
+        solution, w, prof = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit)
+        if prof > best_profit:
+            best_profit = prof
+            best_alpha = alpha
+    return best_alpha, best_profit
+
+# Gerar múltiplas soluções com o melhor alpha
+def generate_solutions(n, profits, weights, capacity, alpha, num_solutions=10, time_limit=1):
+    total_weight = 0
+    total_profit = 0
+    solutions = []
+    for _ in range(num_solutions):
+        sol, weight, prof = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit)
+        total_weight += weight
+        total_profit += prof
+        solutions.append((sol, weight, prof))
+    mean_weight = total_weight / num_solutions
+    mean_prof = total_profit / num_solutions
+    return mean_weight, mean_prof
+
+def compare_strategies(n, profits, weights, capacity, best_alpha, num_solutions=10, time_limit=1):
+
+    greedy_solution, greedy_weight, greedy_profit = greedy_randomized_solution(n, profits, weights, capacity, 0.0, time_limit)
+    random_solution, random_weight, random_profit = greedy_randomized_solution(n, profits, weights, capacity, 1.0, time_limit)
+    best_alpha_weight, best_alpha_profit = generate_solutions(n, profits, weights, capacity, best_alpha, num_solutions, time_limit)
+
+    # Exibir os resultados
+    print("\nSolução puramente gulosa:")
+    print(f"Peso na mochila: {greedy_weight}, Lucro: {greedy_profit}")
+
+    print("\nSolução puramente aleatória:")
+    print(f"Peso na mochila: {random_weight}, Lucro: {random_profit}")
+
+    print("\nMédia das soluções com o melhor alpha encontrado:")
+    print(f"Peso na mochila: {best_alpha_weight}, Lucro: {best_alpha_profit}")
+
+    return
+
+# Resolve a instância de forma exata e mede a distância (gap) de cada heurística ao ótimo
+def optimality_report(n, profits, weights, Q, method="dp", alpha=0.12, time_limit=1.0, grasp_iterations=10, exact_time_limit=None):
+    _, optimum, proven, solve_time = solve_exact(n, Q, profits, weights, method, exact_time_limit)
+    status = "" if proven else " (não provado)"
+    print(f"Optimum ({method}): {optimum}{status}, Time = {solve_time:.6f}s")
+
+    heuristics = {
+        "Random constructive": lambda: random_constructive_heuristic(n, Q, profits, weights, time_limit)[2],
+        "Smart constructive": lambda: smart_constructive_heuristic(n, Q, weights, profits, time_limit)[2],
+        f"Greedy randomized (alpha={alpha})": lambda: greedy_randomized_solution(n, profits, weights, Q, alpha, time_limit)[2],
+        f"GRASP ({grasp_iterations} iterations)": lambda: grasp_knapsack(n, profits, weights, Q, grasp_iterations, alpha)[1],
+    }
+    gaps = {}
+    for name, heuristic in heuristics.items():
+        start_time = time.perf_counter()
+        profit = heuristic()
+        elapsed = time.perf_counter() - start_time
+        gaps[name] = optimality_gap(profit, optimum)
+        print(f"{name}: Profit = {profit}, Gap = {gaps[name]:.4%}, Time = {elapsed:.6f}s")
+    return optimum, gaps
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+
+from .instance import write_knapsack_text
+
+# Gerador de instâncias nas famílias clássicas de Pisinger, com pesos em [1, R]:
+#   "uncorrelated": lucros e pesos independentes em [1, R]
+#   "weakly":       lucro = peso + ruído uniforme em [-R/10, R/10] (no mínimo 1)
+#   "strongly":     lucro = peso + R/10
+#   "subset-sum":   lucro = peso
+# A capacidade é capacity_ratio vezes a soma dos pesos. A mesma semente gera sempre a
+# mesma instância.
+
+FAMILIES = ("uncorrelated", "weakly", "strongly", "subset-sum")
+
+# Devolve n, Q, lucros e pesos (int64), como load_instance
+def generate_instance(n, family="uncorrelated", R=1000, capacity_ratio=0.5, seed=None):
+    rng = np.random.default_rng(seed)
+    weights = rng.integers(1, R + 1, size=n, dtype=np.int64)
+    if family == "uncorrelated":
+        profits = rng.integers(1, R + 1, size=n, dtype=np.int64)
+    elif family == "weakly":
+        noise = rng.integers(-(R // 10), R // 10 + 1, size=n, dtype=np.int64)
+        profits = np.maximum(weights + noise, 1)
+    elif family == "strongly":
+        profits = weights + R // 10
+    elif family == "subset-sum":
+        profits = weights.copy()
+    else:
+        raise ValueError(f"Família de instâncias desconhecida: {family}")
+    Q = max(int(capacity_ratio * int(weights.sum())), 1)
+    return n, Q, profits, weights
+
+# Gera per_family instâncias de cada família e tamanho em directory, com nomes
+# <família>_<n>_<k>.txt no formato "pairs". Cada arquivo tem sua própria semente,
+# derivada de seed, e a lista de caminhos é devolvida na ordem de geração.
+def generate_suite(directory, sizes=(100, 1000, 10000), families=FAMILIES, per_family=1, R=1000,
+                   capacity_ratio=0.5, seed=0):
+    os.makedirs(directory, exist_ok=True)
+    specs = [(family, n, k) for family in families for n in sizes for k in range(per_family)]
+    seeds = np.random.SeedSequence(seed).spawn(len(specs))
+    paths = []
+    for (family, n, k), instance_seed in zip(specs, seeds):
+        path = os.path.join(directory, f"{family}_{n}_{k}.txt")
+        write_knapsack_text(path, *generate_instance(n, family, R, capacity_ratio, instance_seed))
+        paths.append(path)
+    return paths
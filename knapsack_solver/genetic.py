@@ -0,0 +1,159 @@
+import random
+import time
+
+import numpy as np
+
+from .construction import greedy_randomized_solution
+
+# Algoritmo genético com a população inteira numa matriz de bits (uma linha por
+# indivíduo). Cada etapa de uma geração (seleção por torneio, cruzamento, mutação,
+# reparo e avaliação) é uma operação vetorizada sobre a matriz inteira, sem laço
+# Python por indivíduo.
+#
+# Internamente as colunas ficam na ordem decrescente de razão lucro/peso (o cruzamento
+# de um ponto corta nessa ordem); a solução devolvida volta à ordem original.
+# Reparo guloso (Chu e Beasley), sobre essa ordem: um filho acima da capacidade perde o
+# menor sufixo de itens incluídos (os de menor razão) cujo peso cobre o excesso; depois
+# ganha, na ordem de razão, cada item de fora que ainda cabe na folga.
+
+CROSSOVERS = ("uniform", "one-point")
+
+class _Repair:
+    __slots__ = ("Q", "order", "weights", "items", "dtype")
+
+    def __init__(self, profits, weights, Q):
+        p = np.asarray(profits, dtype=np.int64)
+        w = np.asarray(weights, dtype=np.int64)
+        self.Q = Q
+        self.order = np.argsort(-(p / np.maximum(w, 1)), kind="stable")
+        # Somas acumuladas em int32 quando cabem: metade da memória percorrida
+        self.dtype = np.int32 if int(w.sum()) < 2 ** 31 else np.int64
+        self.weights = w[self.order].astype(self.dtype)
+        self.items = np.column_stack((p[self.order], w[self.order])).astype(np.float64)  # Produto via BLAS
+
+    # Lucro e peso de cada linha
+    def evaluate(self, population):
+        totals = population @ self.items
+        return totals[:, 0].astype(np.int64), totals[:, 1].astype(np.int64)
+
+    # Repara as linhas (in place) e devolve lucros e pesos já viáveis
+    def __call__(self, population):
+        _, weights = self.evaluate(population)
+        excess = weights - self.Q
+        over = np.flatnonzero(excess > 0)
+        if len(over):
+            rows = population[over]
+            backwards = rows[:, ::-1]
+            item_weights = backwards * self.weights[::-1]
+            carried = np.cumsum(item_weights, axis=1, dtype=self.dtype)
+            # Retira os itens incluídos até o peso retirado antes deles cobrir o excesso
+            backwards[(carried - item_weights < excess[over, None]) & (backwards == 1)] = 0
+            population[over] = rows
+            weights[over] = self.evaluate(rows)[1]
+        # Inclusão gulosa: cada passada inclui, nas linhas ainda ativas, o prefixo dos itens
+        # de fora que cabem na folga; o primeiro que estoura é pulado e a passada seguinte
+        # continua depois dele com a folga que sobrou, como a varredura item a item
+        slack = (self.Q - weights).astype(self.dtype)
+        active = np.arange(len(population))
+        while len(active):
+            rows = population[active]
+            fits = (rows == 0) & (self.weights <= slack[active, None])
+            added = np.cumsum(fits * self.weights, axis=1, dtype=self.dtype)
+            take = fits & (added <= slack[active, None])
+            taken = take.any(axis=1)
+            active, take = active[taken], take[taken]
+            rows = rows[taken]
+            rows[take] = 1
+            population[active] = rows
+            slack[active] -= (take * self.weights).sum(axis=1, dtype=self.dtype)
+        return self.evaluate(population)
+
+    # Linha na ordem interna <-> solução na ordem original
+    def to_internal(self, solution):
+        return np.asarray(solution, dtype=np.uint8)[self.order]
+
+    def to_solution(self, row):
+        solution = np.empty_like(row)
+        solution[self.order] = row
+        return solution.tolist()
+
+# População aleatória vetorizada, no espírito de generate_random_solution: cada linha
+# percorre os itens numa ordem aleatória e inclui cada um com probabilidade
+# inclusion_prob enquanto o peso acumulado couber
+def _random_population(rows, weights, Q, rng, inclusion_prob=0.7):
+    n = len(weights)
+    order = np.argsort(rng.random((rows, n)), axis=1)
+    chosen = rng.random((rows, n)) < inclusion_prob
+    carried = np.cumsum(np.where(chosen, weights[order], 0), axis=1)
+    population = np.zeros((rows, n), dtype=np.uint8)
+    np.put_along_axis(population, order, (chosen & (carried <= Q)).astype(np.uint8), axis=1)
+    return population
+
+# Evolui population_size indivíduos até generations gerações ou time_limit segundos.
+# A população inicial mistura greedy_fraction de construções gulosas randomizadas (α
+# entre 0 e max_alpha) com soluções aleatórias geradas em bloco. Os elite
+# melhores passam intactos para a geração seguinte. mutation_rate é a probabilidade de
+# inverter cada bit (padrão 1/n). Devolve a melhor solução, seu lucro, o número de
+# gerações e as gerações por segundo (sem contar a população inicial).
+def genetic_algorithm(n, profits, weights, Q, population_size=100, generations=None, time_limit=None,
+                      crossover="uniform", crossover_rate=0.9, mutation_rate=None, elite=2, tournament=2,
+                      greedy_fraction=0.1, max_alpha=0.3, seed=None):
+    if crossover not in CROSSOVERS:
+        raise ValueError(f"Cruzamento desconhecido: {crossover}")
+    if generations is None and time_limit is None:
+        raise ValueError("genetic_algorithm precisa de generations ou time_limit")
+    start_time = time.perf_counter()
+    rng = np.random.default_rng(seed)
+    seeder = random.Random(int(rng.integers(2 ** 32)))
+    mutation_rate = 1 / n if mutation_rate is None else mutation_rate
+    repair = _Repair(profits, weights, Q)
+
+    num_greedy = int(greedy_fraction * population_size)
+    population = np.empty((population_size, n), dtype=np.uint8)
+    for k in range(num_greedy):
+        alpha = max_alpha * k / max(num_greedy - 1, 1)
+        solution = greedy_randomized_solution(n, profits, weights, Q, alpha, float("inf"), rng=seeder)[0]
+        population[k] = repair.to_internal(solution)
+    population[num_greedy:] = _random_population(population_size - num_greedy, repair.weights, Q, rng)
+    fitness, _ = repair(population)
+    evolution_start = time.perf_counter()
+
+    num_children = population_size - elite
+    generation = 0
+    while generations is None or generation < generations:
+        if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+            break
+        generation += 1
+
+        # Seleção por torneio: 2 pais por filho
+        contenders = rng.integers(0, population_size, size=(2 * num_children, tournament))
+        winners = contenders[np.arange(2 * num_children), fitness[contenders].argmax(axis=1)]
+        mothers = population[winners[:num_children]]
+        fathers = population[winners[num_children:]]
+
+        # Cruzamento
+        if crossover == "uniform":  # Um bit aleatório por gene, sorteados em bytes
+            random_bytes = rng.integers(0, 256, size=(num_children, (n + 7) // 8), dtype=np.uint8)
+            mask = np.unpackbits(random_bytes, axis=1, count=n)
+        else:
+            mask = (np.arange(n) < rng.integers(1, max(n, 2), size=num_children)[:, None]).view(np.uint8)
+        mask *= (rng.random(num_children) < crossover_rate).astype(np.uint8)[:, None]
+        children = mothers ^ ((mothers ^ fathers) & mask)
+
+        # Mutação: sorteia quantos bits invertem e depois as posições
+        flips = rng.binomial(children.size, mutation_rate)
+        if flips:
+            flat = children.reshape(-1)
+            positions = rng.integers(0, children.size, size=flips)
+            flat[positions] ^= 1
+
+        children_fitness, _ = repair(children)
+
+        # Elitismo: os elite melhores da geração anterior continuam
+        best = np.argpartition(-fitness, elite - 1)[:elite] if elite else np.empty(0, dtype=np.int64)
+        population = np.concatenate((population[best], children))
+        fitness = np.concatenate((fitness[best], children_fitness))
+
+    k = int(fitness.argmax())
+    elapsed = time.perf_counter() - evolution_start
+    return repair.to_solution(population[k]), int(fitness[k]), generation, generation / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,273 @@
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .bitset import BitSolution
+from .construction import greedy_randomized_solution
+from .evaluation import evaluate_solution, evaluate_solutions
+from .local_search import hill_climbing_fi
+from .shared import SharedInstance, attach_instance
+
+TARGET_CHUNKS = 256  # Blocos do GRASP paralelo: vários por worker, para equilibrar a carga
+MAX_CHUNK_SIZE = 64
+
+# Função GRASP completa
+# As soluções refinadas são acumuladas em blocos de batch_size linhas e avaliadas em lote.
+# Com time_limit (segundos), para de iniciar iterações quando o tempo acaba; com deadline
+# (anytime.Deadline), também interrompe a busca local em curso quando o prazo expira ou
+# a busca é cancelada. iterations=None repete até o tempo acabar.
+# Com probe (instrumentation.Probe), repassa-o à construção e à busca local, conta as
+# iterações e avalia cada solução refinada assim que sai da busca local, para emitir o
+# evento de melhora no instante (e na iteração) em que ela acontece.
+# Com cache (memo.SolutionCache), construções já vistas reaproveitam o ótimo local
+# guardado, com seu lucro e peso, em vez de repetir a busca local e a avaliação.
+# Com pool (relinking.ElitePool), os ótimos locais também disputam a entrada no pool de
+# elite, para uma pós-otimização por path relinking (relinking.post_optimize).
+# Com checkpoint (checkpoint.Checkpointer), grava o estado (iteração, melhor solução,
+# bloco em curso, estado de rng, conteúdo do cache e tempo gasto) sempre que
+# checkpoint.due(iteração) e ao terminar (mais o pool, se houver); com resume=True, continua do último checkpoint
+# gravado, se houver, e chega ao mesmo resultado que a execução sem interrupção (o
+# time_limit conta só o tempo em execução).
+def grasp_knapsack(n, profits, weights, capacity, iterations, alpha=0.12, batch_size=256, time_limit=None, rng=random,
+                   probe=None, deadline=None, cache=None, checkpoint=None, resume=False, pool=None):
+    if iterations is None:
+        if time_limit is None and deadline is None:
+            raise ValueError("grasp_knapsack sem iterations precisa de time_limit ou deadline")
+        iterations = float("inf")
+    start_time = time.time()
+    best_solution = None
+    best_profit = 0
+    batch = np.zeros((int(min(batch_size, iterations)), n), dtype=np.uint8)
+    row_profits = np.zeros(len(batch), dtype=np.int64)  # Lucros já conhecidos pelo cache
+    done = 0
+    size = 0
+    expired = False
+
+    if checkpoint is not None:
+        from .checkpoint import instance_fingerprint, pack_bits, pack_params, pack_rng, unpack_bits, unpack_rng
+
+        fingerprint = instance_fingerprint(n, capacity, profits, weights)
+        params = pack_params(alpha=alpha, batch_size=batch_size)
+        state = checkpoint.load() if resume else None
+        if state is not None:
+            checkpoint.check(state, fingerprint, alpha=alpha, batch_size=batch_size)
+            done = int(state["done"])
+            size = int(state["size"])
+            batch[:size] = unpack_bits(state["batch"], n)
+            if cache is not None and size:
+                row_profits[:size] = evaluate_solutions(batch[:size], profits, weights, capacity)[0]
+            best_profit = int(state["best_profit"])
+            if len(state["best_solution"]):
+                best_solution = unpack_bits(state["best_solution"], n).tolist()
+            unpack_rng(rng, state)
+            if cache is not None and "cache_keys" in state:
+                cache.restore(state)
+            if pool is not None and "pool_rows" in state:
+                pool.restore(state)
+            start_time -= float(state["elapsed"])
+            if probe is not None and size:
+                # O bloco em curso pode ter sido gravado sem probe, ainda sem avaliação
+                batch_profits, _ = evaluate_solutions(batch[:size], profits, weights, capacity)
+                k = int(batch_profits.argmax())
+                if batch_profits[k] > best_profit:
+                    best_profit = int(batch_profits[k])
+                    best_solution = batch[k].tolist()
+                if pool is not None:
+                    for row, profit in zip(batch[:size], batch_profits.tolist()):
+                        pool.add(row, profit)
+
+        def save():
+            arrays = pack_rng(rng)
+            if cache is not None:
+                arrays.update(cache.state())
+            if pool is not None:
+                arrays.update(pool.state())
+            best = pack_bits(best_solution) if best_solution is not None else np.zeros(0, dtype=np.uint8)
+            checkpoint.save(done + size, fingerprint=fingerprint, done=np.array(done), size=np.array(size),
+                            batch=pack_bits(batch[:size]), best_profit=np.array(best_profit), best_solution=best,
+                            elapsed=np.array(time.time() - start_time), **params, **arrays)
+
+    while done < iterations and not expired:
+        while size < min(batch_size, iterations - done):
+            if (time_limit is not None and time.time() - start_time >= time_limit) or (deadline is not None and deadline.expired()):
+                expired = True
+                break
+            # Fase de construção (com cache, também o hash Zobrist da solução construída)
+            refined_solution = None
+            if cache is None:
+                solution, greedy_sol_weight, greedy_sol_profit = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit=2.0, rng=rng, probe=probe)
+            else:
+                solution, greedy_sol_weight, greedy_sol_profit, key = greedy_randomized_solution(
+                    n, profits, weights, capacity, alpha, time_limit=2.0, rng=rng, probe=probe, zobrist=cache.zobrist)
+
+            # Fase de busca local
+            if cache is not None:
+                entry = cache.get(key)
+                if entry is not None:
+                    refined_solution, profit, _ = entry
+            if refined_solution is None:
+                refined_solution = hill_climbing_fi(solution, profits, weights, capacity, probe=probe, deadline=deadline)
+                if cache is not None:
+                    profit, refined_weight = evaluate_solution(refined_solution, profits, weights, capacity, probe)
+                    if deadline is None or not deadline.expired():
+                        cache.put(key, (refined_solution, profit, refined_weight))
+            batch[size] = refined_solution
+            if cache is not None:
+                row_profits[size] = profit
+            if probe is not None:
+                probe.count("iterations")
+                if cache is None:
+                    with probe.phase("evaluation"):
+                        profit, _ = evaluate_solution(refined_solution, profits, weights, capacity, probe)
+                if profit > best_profit:
+                    best_profit = profit
+                    best_solution = refined_solution
+                    probe.improvement(done + size, profit)
+                if pool is not None:
+                    pool.add(refined_solution, profit)
+            size += 1
+            if checkpoint is not None and checkpoint.due(done + size):
+                save()
+        done += size
+        if not size:
+            break
+        if probe is None:
+            # Avaliação do bloco de soluções (com probe, já avaliadas uma a uma; com cache,
+            # os lucros já vêm das entradas do cache)
+            if cache is not None:
+                batch_profits = row_profits[:size]
+            else:
+                batch_profits, _ = evaluate_solutions(batch[:size], profits, weights, capacity)
+            k = int(batch_profits.argmax())
+            if batch_profits[k] > best_profit:
+                best_profit = int(batch_profits[k])
+                best_solution = batch[k].tolist()
+            if pool is not None:
+                for row, profit in zip(batch[:size], batch_profits.tolist()):
+                    pool.add(row, profit)
+        size = 0
+
+    if checkpoint is not None:
+        save()
+    return best_solution, best_profit
+
+# GRASP paralelo: as iterações são divididas em blocos de chunk_size e distribuídas num
+# pool de processos (workers processos, ou um executor já existente). Lucros e pesos são
+# copiados uma única vez para memória compartilhada; cada tarefa recebe só o nome do
+# segmento. Cada bloco tem seu próprio gerador, semeado a partir de seed, então o
+# resultado não depende de quantos workers existem nem da ordem em que terminam.
+# Sem chunk_size, as iterações viram cerca de TARGET_CHUNKS blocos de no máximo
+# MAX_CHUNK_SIZE iterações: poucas iterações ainda se espalham por todos os workers. O
+# tamanho do bloco depende só de iterations, e não de workers, para manter o resultado.
+# Com target_profit, a busca para assim que algum worker alcança esse lucro; com
+# time_limit (segundos), os workers param de iniciar iterações quando o tempo acaba.
+def parallel_grasp_knapsack(n, profits, weights, capacity, iterations, alpha=0.12, workers=None,
+                            chunk_size=None, seed=None, target_profit=None, executor=None, time_limit=None):
+    deadline = None if time_limit is None else time.time() + time_limit
+    if chunk_size is None:
+        chunk_size = min(MAX_CHUNK_SIZE, max(1, -(-iterations // TARGET_CHUNKS)))
+    chunks = [(start, min(chunk_size, iterations - start)) for start in range(0, iterations, chunk_size)]
+    seeds = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(len(chunks))]
+    results = {}
+
+    with SharedInstance(n, profits, weights) as instance:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            futures = {
+                executor.submit(_grasp_chunk, instance.name, n, capacity, alpha, size, chunk_seed, target_profit, deadline): k
+                for k, ((_, size), chunk_seed) in enumerate(zip(chunks, seeds))
+            }
+            for future in as_completed(futures):
+                if future.cancelled():
+                    continue
+                chunk_profit, chunk_solution = future.result()
+                results[futures[future]] = (chunk_profit, chunk_solution)
+                if target_profit is not None and chunk_profit >= target_profit:
+                    instance.stop()  # Avisa os blocos em andamento
+                    for pending in futures:
+                        pending.cancel()
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    # Redução para o melhor global; empates ficam com o bloco de menor índice
+    best_solution = None
+    best_profit = 0
+    for k in sorted(results):
+        chunk_profit, chunk_solution = results[k]
+        if chunk_profit > best_profit:
+            best_profit = chunk_profit
+            best_solution = chunk_solution.to_list()
+    return best_solution, best_profit
+
+# Bloco de iterações GRASP executado num worker
+def _grasp_chunk(shm_name, n, capacity, alpha, iterations, seed, target_profit, deadline):
+    profits, weights, stop = attach_instance(shm_name, n)
+    rng = random.Random(seed)
+    best_solution = None
+    best_profit = 0
+    for _ in range(iterations):
+        if stop[0] or (deadline is not None and time.time() >= deadline):
+            break
+        solution, _, _ = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit=2.0, rng=rng)
+        refined_solution = hill_climbing_fi(solution, profits, weights, capacity)
+        profit, _ = evaluate_solution(refined_solution, profits, weights, capacity)
+        if profit > best_profit:
+            best_profit = profit
+            best_solution = refined_solution
+            if target_profit is not None and profit >= target_profit:
+                stop[0] = 1
+                break
+    if best_solution is not None:
+        best_solution = BitSolution.from_list(best_solution)
+    return best_profit, best_solution
+
+# GRASP reativo (Prais e Ribeiro): α é sorteado a cada iteração entre alphas com
+# probabilidades que se adaptam à qualidade média das soluções obtidas com cada valor.
+# A cada update_every iterações, q_i = (média_i / melhor)^delta e as probabilidades
+# passam a ser q_i normalizados; valores ainda não usados ficam com a maior média vista.
+# Devolve a melhor solução, seu lucro e uma tabela (α, probabilidade, média, amostras).
+def reactive_grasp(n, profits, weights, capacity, iterations, alphas=None, update_every=50, delta=10,
+                   local_search=True, time_limit=None, rng=random):
+    if alphas is None:
+        alphas = [0.0, 0.05, 0.1, 0.15, 0.2, 0.3, 0.4, 0.5, 0.6, 0.8, 1.0]
+    alphas = list(alphas)
+    k = len(alphas)
+    probabilities = [1 / k] * k
+    totals = [0] * k
+    counts = [0] * k
+    start_time = time.time()
+    best_solution = None
+    best_profit = 0
+
+    for iteration in range(iterations):
+        if time_limit is not None and time.time() - start_time >= time_limit:
+            break
+        choice = rng.choices(range(k), probabilities)[0]
+        solution, weight, profit = greedy_randomized_solution(n, profits, weights, capacity, alphas[choice], time_limit=2.0, rng=rng)
+        if local_search:
+            solution = hill_climbing_fi(solution, profits, weights, capacity)
+            profit, _ = evaluate_solution(solution, profits, weights, capacity)
+        totals[choice] += profit
+        counts[choice] += 1
+        if profit > best_profit:
+            best_profit = profit
+            best_solution = solution
+
+        if (iteration + 1) % update_every == 0 and best_profit > 0:
+            means = [totals[i] / counts[i] if counts[i] else None for i in range(k)]
+            seen = max(m for m in means if m is not None)
+            q = [((m if m is not None else seen) / best_profit) ** delta for m in means]
+            total = sum(q)
+            probabilities = [x / total for x in q]
+
+    table = [
+        {"alpha": alphas[i], "probability": probabilities[i], "mean": totals[i] / counts[i] if counts[i] else None,
+         "samples": counts[i]}
+        for i in range(k)
+    ]
+    return best_solution, best_profit, table
@@ -0,0 +1,149 @@
+import os
+import warnings
+
+import numpy as np
+
+# Leitura das instâncias da mochila. Dois formatos de texto são aceitos:
+#   "columns": n, Q, uma linha com os n lucros e outra com os n pesos (knapsack_data.txt)
+#   "pairs":   n, Q e depois n linhas "lucro peso" (knapsack_data_big.txt)
+# O arquivo é convertido de uma vez para um vetor de inteiros (np.fromstring), sem
+# laço em Python por linha. Uma cópia binária (.npz) pode ser gravada ao lado do
+# arquivo para que execuções seguintes não precisem interpretar o texto.
+
+LAYOUTS = ("columns", "pairs")
+
+# Identifica o formato pela terceira linha: n valores em "columns", 2 em "pairs".
+# Com n = 2 os dois formatos têm a mesma forma no arquivo; vale "pairs", com um aviso
+# quando as duas leituras dão itens diferentes (passe layout para escolher).
+def detect_layout(text, n):
+    lines = text.split(b"\n", 3)
+    if len(lines) < 3:
+        return "pairs"
+    third_line = len(lines[2].split())
+    if third_line == 2:
+        if n == 2 and lines[2].split()[1] != lines[3].split()[0]:
+            warnings.warn("Instância com n = 2: os formatos \"columns\" e \"pairs\" são ambíguos; "
+                          "lida como \"pairs\" (passe layout para escolher)", stacklevel=3)
+        return "pairs"
+    if third_line == n:
+        return "columns"
+    raise ValueError(f"Formato de instância desconhecido: a terceira linha tem {third_line} valores para n = {n}")
+
+# Interpreta o conteúdo de um arquivo texto e devolve n, Q, lucros e pesos (int64)
+def parse_knapsack_text(text, layout=None):
+    if isinstance(text, str):
+        text = text.encode()
+    values = np.fromstring(text, dtype=np.int64, sep=" ")
+    if len(values) < 2:
+        raise ValueError("Instância sem n e Q")
+    n, Q = int(values[0]), int(values[1])
+    if len(values) != 2 + 2 * n:
+        raise ValueError(f"A instância declara n = {n} itens, mas tem {(len(values) - 2) / 2:g}")
+    if layout is None:
+        layout = detect_layout(text, n)
+    if layout == "columns":
+        profits, weights = values[2:2 + n], values[2 + n:]
+    elif layout == "pairs":
+        profits, weights = values[2::2], values[3::2]
+    else:
+        raise ValueError(f"Formato de instância desconhecido: {layout}")
+    return n, Q, np.ascontiguousarray(profits), np.ascontiguousarray(weights)
+
+# Grava a instância no formato binário (.npz)
+def save_instance(path, n, Q, profits, weights):
+    np.savez(path, n=n, Q=Q, profits=np.asarray(profits, dtype=np.int64), weights=np.asarray(weights, dtype=np.int64))
+
+# Grava a instância como texto, no formato "columns" ou "pairs"
+def write_knapsack_text(path, n, Q, profits, weights, layout="pairs"):
+    profits = np.asarray(profits, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    with open(path, "w") as f:
+        f.write(f"{n}\n{Q}\n")
+        if layout == "columns":
+            f.write(" ".join(map(str, profits.tolist())) + "\n")
+            f.write(" ".join(map(str, weights.tolist())) + "\n")
+        elif layout == "pairs":
+            f.writelines(f"{p} {w}\n" for p, w in zip(profits.tolist(), weights.tolist()))
+        else:
+            raise ValueError(f"Formato de instância desconhecido: {layout}")
+
+def load_cached_instance(path):
+    with np.load(path) as data:
+        return int(data["n"]), int(data["Q"]), data["profits"], data["weights"]
+
+def cache_path(filename):
+    return filename + ".npz"
+
+# Identifica a versão do arquivo texto de que a cópia binária veio: mtime em
+# nanossegundos e tamanho (o mtime em segundos não distingue edições no mesmo segundo)
+def _source_stamp(filename):
+    stat = os.stat(filename)
+    return np.array([stat.st_mtime_ns, stat.st_size], dtype=np.int64)
+
+# Cópia binária ainda válida: mesmo arquivo texto e mesmo layout pedido
+def _cache_is_fresh(cached, stamp, layout):
+    if not os.path.exists(cached):
+        return False
+    with np.load(cached) as data:
+        return ("source" in data.files and np.array_equal(data["source"], stamp)
+                and str(data["layout"]) == (layout or "auto"))
+
+# Carrega uma instância como vetores NumPy. Com cache=True usa (ou cria) a cópia binária
+# <arquivo>.npz, que guarda o mtime e o tamanho do arquivo texto e o layout pedido, e só
+# é aproveitada se os três continuam iguais.
+# Arquivos .npz também podem ser passados diretamente.
+def load_instance(filename, layout=None, cache=False):
+    filename = os.fspath(filename)
+    if filename.endswith(".npz"):
+        return load_cached_instance(filename)
+    cached = cache_path(filename)
+    if cache:
+        stamp = _source_stamp(filename)
+        if _cache_is_fresh(cached, stamp, layout):
+            return load_cached_instance(cached)
+    with open(filename, "rb") as f:
+        n, Q, profits, weights = parse_knapsack_text(f.read(), layout)
+    if cache:
+        np.savez(cached, n=n, Q=Q, profits=profits, weights=weights, source=stamp, layout=np.array(layout or "auto"))
+    return n, Q, profits, weights
+
+# Mesma interface das versões antigas dos scripts: n, Q e listas de lucros e pesos
+def read_knapsack_data(filename, layout=None, cache=False):
+    n, Q, profits, weights = load_instance(filename, layout, cache)
+    return n, Q, profits.tolist(), weights.tolist()
+
+# Instância carregada só no primeiro acesso aos dados (n, Q, profits ou weights).
+# Os vetores ficam como listas, que é o que as heurísticas indexam no laço interno.
+class LazyInstance:
+    __slots__ = ("path", "layout", "cache", "_data")
+
+    def __init__(self, path, layout=None, cache=False):
+        self.path = os.fspath(path)
+        self.layout = layout
+        self.cache = cache
+        self._data = None
+
+    def load(self):
+        if self._data is None:
+            self._data = read_knapsack_data(self.path, self.layout, self.cache)
+        return self._data
+
+    @property
+    def n(self):
+        return self.load()[0]
+
+    @property
+    def Q(self):
+        return self.load()[1]
+
+    @property
+    def profits(self):
+        return self.load()[2]
+
+    @property
+    def weights(self):
+        return self.load()[3]
+
+    def __repr__(self):
+        state = "carregada" if self._data is not None else "não carregada"
+        return f"LazyInstance({self.path!r}, {state})"
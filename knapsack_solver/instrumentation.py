@@ -0,0 +1,120 @@
+import cProfile
+import time
+from collections import namedtuple
+from contextlib import contextmanager
+
+# Instrumentação das buscas. As funções instrumentadas recebem probe=None por padrão e
+# só contam ou medem algo quando recebem um Probe; desligada, a instrumentação custa um
+# teste "probe is not None" por chamada (ou por varredura, nas buscas locais), nunca
+# por movimento avaliado.
+#
+# Contadores usados pelas heurísticas:
+#   constructions, construction_steps   greedy_randomized_solution
+#   neighbors                           get_neighbors (vizinhos gerados)
+#   evaluations                         evaluate_solution (avaliações completas)
+#   moves_evaluated, moves_accepted     buscas locais (avaliações incrementais)
+#   sweeps                              buscas locais (varreduras da vizinhança)
+#   iterations                          grasp_knapsack
+# Fases cronometradas: construction, local_search, evaluation.
+
+# Evento de melhora: segundos desde a criação do Probe, iteração e melhor lucro
+ImprovementEvent = namedtuple("ImprovementEvent", ["time", "iteration", "profit"])
+
+class Probe:
+    __slots__ = ("counters", "timings", "observers", "events", "record_events", "start_time")
+
+    def __init__(self, observers=(), record_events=True):
+        self.counters = {}
+        self.timings = {}
+        self.observers = list(observers)
+        self.events = []
+        self.record_events = record_events
+        self.start_time = time.perf_counter()
+
+    clock = staticmethod(time.perf_counter)
+
+    def count(self, name, k=1):
+        self.counters[name] = self.counters.get(name, 0) + k
+
+    def add_time(self, phase, seconds):
+        self.timings[phase] = self.timings.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    # Registra uma função chamada com cada ImprovementEvent
+    def subscribe(self, callback):
+        self.observers.append(callback)
+
+    def improvement(self, iteration, profit):
+        event = ImprovementEvent(time.perf_counter() - self.start_time, iteration, profit)
+        if self.record_events:
+            self.events.append(event)
+        for callback in self.observers:
+            callback(event)
+
+    def report(self):
+        return {"elapsed": time.perf_counter() - self.start_time, "counters": dict(self.counters),
+                "timings": dict(self.timings), "improvements": len(self.events)}
+
+    def format_report(self):
+        report = self.report()
+        lines = [f"Elapsed: {report['elapsed']:.6f}s"]
+        lines += [f"  {name}: {value}" for name, value in sorted(report["counters"].items())]
+        lines += [f"  {name} time: {seconds:.6f}s" for name, seconds in sorted(report["timings"].items())]
+        lines.append(f"  improvements: {report['improvements']}")
+        return "\n".join(lines)
+
+# Repassa os itens de iterable contando-os em probe.counters[name]. O total é somado uma
+# vez, quando o gerador termina ou é descartado (ex.: break na primeira melhora), então
+# o custo por item é só o do gerador, e só existe quando a instrumentação está ligada.
+def counted(iterable, probe, name):
+    k = 0
+    try:
+        for item in iterable:
+            k += 1
+            yield item
+    finally:
+        probe.count(name, k)
+
+# Grava os eventos de melhora em CSV (tempo, iteração, lucro) para curvas de convergência
+def write_events(path, events):
+    with open(path, "w") as f:
+        f.write("time,iteration,profit\n")
+        f.writelines(f"{e.time:.6f},{e.iteration},{e.profit}\n" for e in events)
+
+PROFILERS = ("cprofile", "pyinstrument")
+
+# Executa o bloco sob um profiler e grava o resultado em path: estatísticas do cProfile
+# (para pstats/snakeviz) ou, com pyinstrument (dependência opcional), um relatório HTML
+# se path terminar em .html e texto caso contrário
+@contextmanager
+def profiling(path, profiler="cprofile"):
+    if profiler == "cprofile":
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            yield profile
+        finally:
+            profile.disable()
+            profile.dump_stats(path)
+    elif profiler == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise ImportError("O modo pyinstrument requer o pacote opcional pyinstrument") from e
+        profile = Profiler()
+        profile.start()
+        try:
+            yield profile
+        finally:
+            profile.stop()
+            with open(path, "w") as f:
+                f.write(profile.output_html() if path.endswith(".html") else profile.output_text())
+    else:
+        raise ValueError(f"Profiler desconhecido: {profiler}")
@@ -0,0 +1,137 @@
+import random
+
+from .evaluation import DeltaEvaluator
+from .instrumentation import counted
+from .moves import MoveState, make_neighborhoods
+from .neighborhood import iter_moves
+
+# Buscas locais na vizinhança de iter_moves, avaliadas de forma incremental (DeltaEvaluator)
+# Com probe (instrumentation.Probe), contam movimentos avaliados e aceitos e varreduras
+# e medem a fase "local_search"; sem ele, o laço interno não muda.
+
+def _moves(n, order="sequential", start=0, probe=None, rng=random):
+    moves = iter_moves(n, order, start, rng)
+    if probe is not None:
+        probe.count("sweeps")
+        moves = counted(moves, probe, "moves_evaluated")
+    return moves
+
+def _finish(probe, phase_start, accepted):
+    probe.add_time("local_search", probe.clock() - phase_start)
+    probe.count("moves_accepted", accepted)
+
+# First Improvement: explora as soluções vizinhas e aceita a primeira melhora
+def first_improvement(solution, profits, weights, Q, order="sequential", probe=None, rng=random):
+    phase_start = probe.clock() if probe is not None else None
+    state = DeltaEvaluator(solution, profits, weights, Q)
+    current_profit, _ = state.evaluate()
+    for move in _moves(len(solution), order, probe=probe, rng=rng):
+        neighbor_profit, _ = state.evaluate_move(move)
+        if neighbor_profit > current_profit:
+            if probe is not None:
+                _finish(probe, phase_start, 1)
+            return state.neighbor(move)
+    if probe is not None:
+        _finish(probe, phase_start, 0)
+    return solution  # Se não encontrar melhora retorna a solução corrente
+
+# Best Improvement: Explora todas as soluções vizinhas e pega a melhor
+def best_improvement(solution, profits, weights, Q, probe=None):
+    phase_start = probe.clock() if probe is not None else None
+    state = DeltaEvaluator(solution, profits, weights, Q)
+    best_profit, _ = state.evaluate()
+    best_move = None
+    for move in _moves(len(solution), probe=probe):
+        neighbor_profit, _ = state.evaluate_move(move)
+        if neighbor_profit > best_profit:
+            best_move = move
+            best_profit = neighbor_profit
+    if probe is not None:
+        _finish(probe, phase_start, best_move is not None)
+    if best_move is None:
+        return solution.copy()
+    return state.neighbor(best_move)
+
+# Hill Climbing (Best Improvement)
+def hill_climbing_bi(solution, profits, weights, Q, probe=None):
+    phase_start = probe.clock() if probe is not None else None
+    state = DeltaEvaluator(solution, profits, weights, Q)
+    current_profit, _ = state.evaluate()
+    accepted = 0
+    while True:
+        best_move = None
+        best_profit = current_profit
+        for move in _moves(len(solution), probe=probe):
+            neighbor_profit, _ = state.evaluate_move(move)
+            if neighbor_profit > best_profit:
+                best_move = move
+                best_profit = neighbor_profit
+        if best_move is not None:
+            state.apply(best_move)
+            current_profit = best_profit
+            accepted += 1
+        else:
+            break  # Para se nenhuma melhora for encontrada
+    if probe is not None:
+        _finish(probe, phase_start, accepted)
+    return state.solution
+
+# Hill Climbing (First Improvement)
+# Com order="circular" (padrão) cada varredura retoma a partir do último movimento
+# aceito; com order="sequential" cada varredura recomeça do item 0 e repassa o prefixo
+# já sem melhoras, o que custa O(n) por movimento aceito (a partir de uma solução
+# aleatória com n = 10000, segundos por partida em vez de centésimos)
+# Com deadline (anytime.Deadline), para antes de uma nova varredura quando o prazo
+# expira ou a busca é cancelada, devolvendo a solução melhorada até ali
+def hill_climbing_fi(solution, profits, weights, Q, order="circular", probe=None, deadline=None, rng=random):
+    phase_start = probe.clock() if probe is not None else None
+    state = DeltaEvaluator(solution, profits, weights, Q)
+    current_profit, _ = state.evaluate()
+    start = 0
+    accepted = 0
+
+    while deadline is None or not deadline.expired():
+        improvement_found = False  # Indicador para saber se houve melhoria
+
+        for move in _moves(len(solution), order, start, probe, rng):
+            neighbor_profit, _ = state.evaluate_move(move)
+
+            if neighbor_profit > current_profit:
+                state.apply(move)
+                current_profit = neighbor_profit
+                start = move[0] + 1
+                accepted += 1
+                improvement_found = True  # Marcamos que encontramos uma melhoria
+                break  # Saímos do loop para aceitar a primeira melhoria
+
+        if not improvement_found:
+            break  # Paramos se não houver mais melhorias
+
+    if probe is not None:
+        _finish(probe, phase_start, accepted)
+    return state.solution
+
+# Variable Neighborhood Descent: aplica o melhor movimento da primeira vizinhança que
+# melhora e volta à primeira; termina quando nenhuma vizinhança melhora (ótimo local de
+# todas). neighborhoods são nomes de moves.NEIGHBORHOODS ("flip", "swap", "add-drop",
+# "2-2") ou objetos com best_move(state). Soluções inviáveis são reparadas antes.
+def variable_neighborhood_descent(solution, profits, weights, Q, neighborhoods=("flip", "swap", "add-drop", "2-2"),
+                                  samples=200, max_moves=None, rng=random, probe=None):
+    phase_start = probe.clock() if probe is not None else None
+    state = MoveState(solution, profits, weights, Q)
+    state.repair()
+    neighborhoods = make_neighborhoods(neighborhoods, samples, rng)
+    accepted = 0
+    k = 0
+    while k < len(neighborhoods) and (max_moves is None or accepted < max_moves):
+        found = neighborhoods[k].best_move(state)
+        if found is None:
+            k += 1
+            continue
+        state.apply(found[1])
+        accepted += 1
+        k = 0
+    if probe is not None:
+        probe.count("sweeps")
+        _finish(probe, phase_start, accepted)
+    return state.solution()
@@ -0,0 +1,119 @@
+import random
+from collections import OrderedDict, deque
+
+import numpy as np
+
+# Hash de soluções no estilo Zobrist: cada item tem uma chave aleatória de 64 bits e o
+# hash de uma solução é o XOR das chaves dos itens incluídos. Inverter o bit i muda o
+# hash por um XOR com a chave de i, então o hash de um vizinho custa O(|movimento|).
+# Duas soluções diferentes colidem com probabilidade 2^-64.
+class ZobristTable:
+    __slots__ = ("keys",)
+
+    def __init__(self, n, seed=0):
+        rng = random.Random(seed)
+        self.keys = [rng.getrandbits(64) for _ in range(n)]
+
+    def hash(self, solution):
+        h = 0
+        keys = self.keys
+        for i, x in enumerate(solution):
+            if x:
+                h ^= keys[i]
+        return h
+
+    # Hash depois de aplicar o movimento (tupla de índices invertidos)
+    def update(self, h, move):
+        keys = self.keys
+        for i in move:
+            h ^= keys[i]
+        return h
+
+# Cache limitado (LRU) de soluções construídas: hash Zobrist -> (ótimo local, lucro, peso).
+# Usado pelo GRASP para não repetir a busca local nem a avaliação de construções já
+# vistas. A construção gulosa mantém o hash com a tabela zobrist do cache, um XOR por
+# item incluído; key calcula o hash de uma solução qualquer, em O(n).
+class SolutionCache:
+    __slots__ = ("zobrist", "maxsize", "entries", "hits", "misses", "evictions")
+
+    def __init__(self, n, maxsize=4096, seed=0):
+        self.zobrist = ZobristTable(n, seed)
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, solution):
+        return self.zobrist.hash(solution)
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+
+    def __len__(self):
+        return len(self.entries)
+
+    # Conteúdo em vetores, na ordem LRU, para checkpoint.Checkpointer
+    def state(self):
+        from .checkpoint import pack_bits
+
+        n = len(self.zobrist.keys)
+        return {
+            "cache_keys": np.fromiter(self.entries.keys(), dtype=np.uint64, count=len(self.entries)),
+            "cache_solutions": pack_bits([entry[0] for entry in self.entries.values()] or np.zeros((0, n))),
+            "cache_values": np.array([entry[1:] for entry in self.entries.values()], dtype=np.int64).reshape(-1, 2),
+            "cache_counters": np.array([self.hits, self.misses, self.evictions], dtype=np.int64),
+        }
+
+    def restore(self, state):
+        from .checkpoint import unpack_bits
+
+        solutions = unpack_bits(state["cache_solutions"], len(self.zobrist.keys))
+        values = state["cache_values"].tolist()
+        self.entries = OrderedDict((int(k), (solution, profit, weight))
+                                   for k, solution, (profit, weight) in zip(state["cache_keys"], solutions.tolist(), values))
+        self.hits, self.misses, self.evictions = (int(x) for x in state["cache_counters"])
+
+    @property
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {"size": len(self.entries), "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0}
+
+# Lista tabu de hashes das últimas tenure soluções visitadas, com consulta em O(1)
+class TabuList:
+    __slots__ = ("tenure", "order", "counts")
+
+    def __init__(self, tenure):
+        self.tenure = tenure
+        self.order = deque()
+        self.counts = {}
+
+    def add(self, key):
+        self.order.append(key)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        if len(self.order) > self.tenure:
+            old = self.order.popleft()
+            if self.counts[old] == 1:
+                del self.counts[old]
+            else:
+                self.counts[old] -= 1
+
+    def __contains__(self, key):
+        return key in self.counts
+
+    def __len__(self):
+        return len(self.order)
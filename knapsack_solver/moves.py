@@ -0,0 +1,217 @@
+import random
+
+import numpy as np
+
+# Biblioteca de vizinhanças para a busca local, além do flip de bits adjacentes de
+# iter_moves. Um movimento continua sendo a tupla de índices cujos bits são invertidos,
+# então pode ser aplicado por DeltaEvaluator.apply; o ganho é a variação de lucro.
+#
+#   FlipNeighborhood     (j,): inclui um item que cabe na folga
+#   SwapNeighborhood     (i, j): troca 1-1, um item sai e outro entra
+#   AddDropNeighborhood  (j, i1, i2, ...): inclui j e retira os itens de menor razão
+#                        lucro/peso até voltar a caber, ou retira i e inclui os itens
+#                        de fora de maior razão que couberem
+#   SampledExchangeNeighborhood  (i1, i2, j1, j2): trocas 2-2 amostradas
+#
+# As vizinhanças trabalham sobre um MoveState, que mantém a tabela de deltas de cada
+# item (variação de lucro e peso ao inverter o bit) e índices ordenados por peso e por
+# razão. O filtro de capacidade usa esses índices: para cada item que sai, os itens que
+# podem entrar formam um prefixo da ordem por peso (peso <= peso do que sai + folga), e o
+# máximo prefixado dos lucros de fora dá o melhor candidato com uma busca binária, sem
+# enumerar os O(n²) pares.
+
+class MoveState:
+    __slots__ = ("n", "Q", "profits", "weights", "x", "profit", "weight", "delta_profit", "delta_weight",
+                 "by_weight", "sorted_weights", "sorted_profits", "by_ratio")
+
+    def __init__(self, solution, profits, weights, Q):
+        self.n = n = len(profits)
+        self.Q = Q
+        self.profits = p = np.asarray(profits, dtype=np.int64)
+        self.weights = w = np.asarray(weights, dtype=np.int64)
+        self.x = x = np.asarray(list(solution), dtype=bool)
+        self.profit = int(p[x].sum())
+        self.weight = int(w[x].sum())
+        # Tabela de deltas: variação ao inverter o bit i (sai se está dentro, entra se está fora)
+        self.delta_profit = np.where(x, -p, p)
+        self.delta_weight = np.where(x, -w, w)
+        self.by_weight = np.argsort(w, kind="stable")
+        self.sorted_weights = w[self.by_weight]
+        self.sorted_profits = p[self.by_weight]
+        self.by_ratio = np.argsort(p / np.maximum(w, 1), kind="stable")  # Razão crescente
+
+    @property
+    def slack(self):
+        return self.Q - self.weight
+
+    def gain(self, move):
+        return int(self.delta_profit[list(move)].sum())
+
+    def move_weight(self, move):
+        return int(self.delta_weight[list(move)].sum())
+
+    # Aplica o movimento e atualiza só as entradas da tabela de deltas dos itens movidos
+    def apply(self, move):
+        for i in move:
+            self.profit += int(self.delta_profit[i])
+            self.weight += int(self.delta_weight[i])
+            self.x[i] = not self.x[i]
+            self.delta_profit[i] = -self.delta_profit[i]
+            self.delta_weight[i] = -self.delta_weight[i]
+
+    def solution(self):
+        return self.x.astype(np.uint8).tolist()
+
+    # Solução inviável: retira itens na ordem crescente de razão até caber
+    def repair(self):
+        for i in self.by_ratio.tolist():
+            if self.weight <= self.Q:
+                break
+            if self.x[i]:
+                self.apply((i,))
+
+    # Melhor item de fora com peso <= limit, para cada limite: (lucro, item), lucro -1 se nenhum
+    def best_outside(self, limits):
+        n = self.n
+        outside = ~self.x[self.by_weight]
+        keys = np.where(outside, self.sorted_profits * (n + 1) + np.arange(n), -1)
+        prefix = np.maximum.accumulate(keys) if n else keys
+        count = np.searchsorted(self.sorted_weights, limits, side="right")
+        best = np.where(count > 0, prefix[np.maximum(count - 1, 0)], -1)
+        found = best >= 0
+        return np.where(found, best // (n + 1), -1), np.where(found, self.by_weight[np.maximum(best, 0) % (n + 1)], -1)
+
+class FlipNeighborhood:
+    name = "flip"
+
+    # Melhor inclusão viável: o item de maior lucro com peso <= folga
+    def best_move(self, state):
+        if state.slack < 0:
+            return None
+        profit, item = state.best_outside(np.array([state.slack]))
+        if profit[0] <= 0:
+            return None
+        return int(profit[0]), (int(item[0]),)
+
+class SwapNeighborhood:
+    name = "swap"
+
+    # Para cada item i dentro, o melhor j de fora com peso <= peso(i) + folga
+    def best_move(self, state):
+        inside = np.flatnonzero(state.x)
+        if not len(inside) or state.x.all():
+            return None
+        profit, item = state.best_outside(state.weights[inside] + state.slack)
+        gains = np.where(item >= 0, profit - state.profits[inside], 0)
+        k = int(gains.argmax())
+        if gains[k] <= 0:
+            return None
+        return int(gains[k]), (int(inside[k]), int(item[k]))
+
+class AddDropNeighborhood:
+    name = "add-drop"
+
+    # Dois sentidos, ambos com somas acumuladas sobre a ordem por razão e busca binária:
+    #   add-drop: para cada j de fora, retira os itens de dentro de menor razão até j caber
+    #   drop-add: para cada i de dentro, retira i e inclui os itens de fora de maior razão
+    #             enquanto couberem no espaço liberado
+    def best_move(self, state):
+        best = self._add_drop(state)
+        other = self._drop_add(state)
+        if best is None or (other is not None and other[0] > best[0]):
+            best = other
+        return best
+
+    def _add_drop(self, state):
+        outside = np.flatnonzero(~state.x)
+        if not len(outside) or not len(state.x):
+            return None
+        x_ratio = state.x[state.by_ratio]
+        cum_weight = np.cumsum(np.where(x_ratio, state.weights[state.by_ratio], 0))
+        cum_profit = np.cumsum(np.where(x_ratio, state.profits[state.by_ratio], 0))
+        need = state.weights[outside] - state.slack
+        k = np.searchsorted(cum_weight, need, side="left")
+        feasible = (need <= 0) | (k < len(cum_weight))
+        loss = np.where(need <= 0, 0, cum_profit[np.minimum(k, len(cum_profit) - 1)])
+        gains = np.where(feasible, state.profits[outside] - loss, 0)
+        best = int(gains.argmax())
+        if gains[best] <= 0:
+            return None
+        j = int(outside[best])
+        if need[best] <= 0:
+            return int(gains[best]), (j,)
+        dropped = state.by_ratio[:k[best] + 1][x_ratio[:k[best] + 1]]
+        return int(gains[best]), (j,) + tuple(int(i) for i in dropped)
+
+    def _drop_add(self, state):
+        inside = np.flatnonzero(state.x)
+        if not len(inside) or state.x.all():
+            return None
+        order = state.by_ratio[::-1]  # Razão decrescente
+        outside = order[~state.x[order]]
+        cum_weight = np.cumsum(state.weights[outside])
+        cum_profit = np.cumsum(state.profits[outside])
+        room = state.weights[inside] + state.slack
+        k = np.searchsorted(cum_weight, room, side="right")  # Itens de fora que cabem em sequência
+        gained = np.where(k > 0, cum_profit[np.maximum(k - 1, 0)], 0)
+        gains = gained - state.profits[inside]
+        best = int(gains.argmax())
+        if gains[best] <= 0:
+            return None
+        return int(gains[best]), (int(inside[best]),) + tuple(int(j) for j in outside[:k[best]])
+
+class SampledExchangeNeighborhood:
+    name = "2-2"
+
+    def __init__(self, samples=200, rng=random):
+        self.samples = samples
+        self.rng = rng
+
+    # Sorteia pares de itens de dentro e, para cada par, dois itens de fora entre os que
+    # cabem no espaço liberado (prefixo da ordem por peso); devolve a melhor troca
+    def best_move(self, state):
+        inside = np.flatnonzero(state.x).tolist()
+        if len(inside) < 2 or state.n - len(inside) < 2:
+            return None
+        rng = self.rng
+        x, by_weight, sorted_weights = state.x, state.by_weight, state.sorted_weights
+        profits, weights = state.profits, state.weights
+        best = None
+        for _ in range(self.samples):
+            i1, i2 = rng.sample(inside, 2)
+            room = int(weights[i1] + weights[i2]) + state.slack
+            count = int(np.searchsorted(sorted_weights, room, side="right"))
+            if count < 2:
+                continue
+            j1 = int(by_weight[rng.randrange(count)])
+            rest = int(np.searchsorted(sorted_weights, room - weights[j1], side="right"))
+            if rest < 1:
+                continue
+            j2 = int(by_weight[rng.randrange(rest)])
+            if j1 == j2 or x[j1] or x[j2]:
+                continue
+            gain = int(profits[j1] + profits[j2] - profits[i1] - profits[i2])
+            if gain > 0 and (best is None or gain > best[0]):
+                best = (gain, (i1, i2, j1, j2))
+        return best
+
+NEIGHBORHOODS = {
+    "flip": FlipNeighborhood,
+    "swap": SwapNeighborhood,
+    "add-drop": AddDropNeighborhood,
+    "2-2": SampledExchangeNeighborhood,
+}
+
+# Vizinhanças a partir de nomes (ou objetos já construídos)
+def make_neighborhoods(names, samples=200, rng=random):
+    result = []
+    for name in names:
+        if not isinstance(name, str):
+            result.append(name)
+        elif name == "2-2":
+            result.append(SampledExchangeNeighborhood(samples, rng))
+        elif name in NEIGHBORHOODS:
+            result.append(NEIGHBORHOODS[name]())
+        else:
+            raise ValueError(f"Vizinhança desconhecida: {name}")
+    return result
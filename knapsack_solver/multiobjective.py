@@ -0,0 +1,152 @@
+import random
+import time
+
+import numpy as np
+
+from .bitset import BitSolution
+from .construction import smart_constructive_heuristic
+from .neighborhood import iter_moves
+from .pareto import hypervolume, make_archive
+
+# Modo multiobjetivo. Os objetivos são linhas de uma matriz (objetivos x itens), todas
+# maximizadas, com a restrição de capacidade usual:
+#   "profit-weight": lucro contra peso usado (o peso entra negativo, -w)
+#   "bi-profit":     dois vetores de lucro (o da instância e second_profits)
+# A busca é uma Pareto local search (PLS) sobre a vizinhança do pacote (flips de um
+# item, flips de bits adjacentes de iter_moves e trocas 1-1): cada solução do arquivo
+# ainda não explorada tem seus vizinhos viáveis avaliados em O(objetivos) por vizinho, e
+# os não dominados entram no arquivo (pareto.ParetoFront2D ou NDTree) para serem
+# explorados.
+
+OBJECTIVES = ("profit-weight", "bi-profit")
+PLS_MOVES = ("flip", "flip+pairs", "flip+swap")
+
+def objective_matrix(profits, weights, objectives="profit-weight", second_profits=None):
+    if objectives == "profit-weight":
+        return np.array([profits, [-w for w in weights]], dtype=np.int64)
+    if objectives == "bi-profit":
+        if second_profits is None:
+            raise ValueError("O modo bi-profit precisa de second_profits")
+        return np.array([profits, second_profits], dtype=np.int64)
+    raise ValueError(f"Objetivos desconhecidos: {objectives}")
+
+# Valor de cada objetivo da solução (avaliação vetorial)
+def evaluate_objectives(solution, matrix):
+    return tuple(int(v) for v in matrix @ np.asarray(list(solution), dtype=np.int64))
+
+# Ponto de referência padrão do hipervolume: um pouco pior que o menor valor possível
+# de cada objetivo (0 para lucros, -Q - 1 para o peso negativo)
+def default_reference(matrix, Q):
+    return tuple(-1 if row.min() >= 0 else -Q - 1 for row in matrix)
+
+# Soluções iniciais: a mochila vazia (extremo do peso em "profit-weight"; dominada nos
+# demais casos) e a construção gulosa de smart_constructive_heuristic sobre somas
+# ponderadas dos objetivos, com pesos igualmente espaçados
+def scalarized_starts(n, matrix, weights, Q, count=11):
+    starts = [[0] * n]
+    k = len(matrix)
+    for t in range(count):
+        if k == 2:
+            lam = np.array([1 - t / max(count - 1, 1), t / max(count - 1, 1)])
+        else:
+            lam = np.random.default_rng(t).dirichlet(np.ones(k))
+        score = lam @ matrix
+        # A razão usada pela construção gulosa precisa de valores positivos
+        shifted = (score - score.min() + 1).tolist()
+        starts.append(smart_constructive_heuristic(n, Q, weights, shifted, float("inf"))[0])
+    return starts
+
+# Trocas 1-1 filtradas pela capacidade, como em moves.SwapNeighborhood: para cada item i
+# dentro e cada objetivo, o item j de fora de maior valor nesse objetivo entre os que
+# cabem no lugar de i (peso <= peso(i) + folga), achado por busca binária sobre os itens
+# de fora ordenados por peso e um máximo acumulado. Devolve pares (i, j).
+def _swap_moves(x, matrix, weights, slack):
+    inside = np.flatnonzero(x)
+    outside = np.flatnonzero(~x)
+    if not len(inside) or not len(outside):
+        return []
+    order = outside[np.argsort(weights[outside], kind="stable")]
+    limit = np.searchsorted(weights[order], weights[inside] + slack, side="right")
+    valid = limit > 0
+    inside, last = inside[valid], limit[valid] - 1
+    positions = np.arange(len(order))
+    moves = set()
+    for row in matrix:
+        values = row[order]
+        running = np.maximum.accumulate(values)
+        best = np.maximum.accumulate(np.where(values == running, positions, 0))
+        moves.update(zip(inside.tolist(), order[best[last]].tolist()))
+    return sorted(moves)
+
+# Pareto local search. Devolve o arquivo (pontos = vetores de objetivos, payloads =
+# BitSolution) e o número de vizinhos avaliados. Para após time_limit segundos ou
+# max_evaluations vizinhos; sem eles, até não haver soluções por explorar.
+# moves: "flip", "flip+pairs" ou "flip+swap". Sem ele, "flip+swap" quando todos os
+# objetivos são lucros (bi-profit: as soluções iniciais são maximais, e nenhum flip
+# delas é viável e não dominado) e "flip" quando um deles é o peso.
+def pareto_local_search(n, matrix, weights, Q, starts=None, time_limit=None, max_evaluations=None, moves=None,
+                        rng=random):
+    start_time = time.perf_counter()
+    matrix = np.asarray(matrix, dtype=np.int64)
+    columns = [tuple(int(v) for v in col) for col in matrix.T]
+    archive = make_archive(len(matrix))
+    if starts is None:
+        starts = scalarized_starts(n, matrix, weights, Q)
+
+    unexplored = []
+    for solution in starts:
+        objectives = evaluate_objectives(solution, matrix)
+        compact = BitSolution.from_list(list(solution))
+        if archive.add(objectives, compact):
+            unexplored.append((objectives, compact))
+
+    if moves is None:
+        moves = "flip+swap" if (matrix >= 0).all() else "flip"
+    if moves == "flip" or moves == "flip+swap":
+        move_list = [(i,) for i in range(n)]
+    elif moves == "flip+pairs":
+        move_list = [(i,) for i in range(n)] + list(iter_moves(n))
+    else:
+        raise ValueError(f"Vizinhança multiobjetivo desconhecida: {moves}")
+    swaps = moves == "flip+swap"
+    weight_array = np.asarray(weights, dtype=np.int64)
+
+    evaluations = 0
+    while unexplored:
+        if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+            break
+        if max_evaluations is not None and evaluations >= max_evaluations:
+            break
+        objectives, solution = unexplored.pop(rng.randrange(len(unexplored)))
+        if archive.is_dominated(objectives, strict=True):
+            continue  # Já saiu do arquivo, dominada por uma solução encontrada depois
+        weight = sum(weights[i] for i in solution.ones())
+        neighborhood = move_list
+        if swaps:
+            neighborhood = move_list + _swap_moves(solution.to_array().astype(bool), matrix, weight_array, Q - weight)
+        for move in neighborhood:
+            delta_weight = 0
+            new = list(objectives)
+            for i in move:
+                sign = -1 if solution[i] else 1
+                delta_weight += sign * weights[i]
+                for k, c in enumerate(columns[i]):
+                    new[k] += sign * c
+            evaluations += 1
+            if weight + delta_weight > Q:
+                continue
+            new = tuple(new)
+            if archive.is_dominated(new):
+                continue
+            neighbor = solution.copy()
+            for i in move:
+                neighbor.flip(i)
+            archive.add(new, neighbor)
+            unexplored.append((new, neighbor))
+    return archive, evaluations
+
+# Resumo de uma frente para comparar execuções: tamanho, hipervolume e extremos
+def front_summary(archive, reference):
+    points = [p for p, _ in archive.points()]
+    return {"size": len(points), "hypervolume": hypervolume(points, reference),
+            "best": [max(p[k] for p in points) for k in range(len(reference))] if points else []}
@@ -0,0 +1,45 @@
+import itertools
+import random
+
+# Neighborhood structure: bit flip
+# Gera os vizinhos sob demanda: cada cópia só é feita quando o vizinho é consumido
+# Com probe, conta os vizinhos gerados ("neighbors")
+def get_neighbors(solution, probe=None):
+    for move in iter_moves(len(solution)):
+        neighbor = solution.copy()
+        for i in move:
+            neighbor[i] = 1 - neighbor[i]
+        if probe is not None:
+            probe.count("neighbors")
+        yield neighbor
+
+# Gera os movimentos da vizinhança (flip de i e i+1) sob demanda, sem copiar a solução.
+# order: "sequential" (0..n-2), "circular" (começa em start e dá a volta) ou "random"
+# (permutação aleatória). A memória usada é no máximo O(n).
+def iter_moves(n, order="sequential", start=0, rng=random):
+    num_moves = n - 1
+    if num_moves <= 0:
+        return
+    if order == "sequential":
+        positions = range(num_moves)
+    elif order == "circular":
+        start %= num_moves
+        positions = itertools.chain(range(start, num_moves), range(start))
+    elif order == "random":
+        positions = _lazy_permutation(num_moves, rng)
+    else:
+        raise ValueError(f"Ordem de varredura desconhecida: {order}")
+    for i in positions:
+        yield (i, i+1)
+
+# Permutação aleatória de range(m) gerada sob demanda (Fisher-Yates com troca no sorteio):
+# o k-ésimo elemento custa O(1) e só as posições já trocadas ficam guardadas, então uma
+# varredura interrompida após k movimentos paga O(k) e não O(m)
+def _lazy_permutation(m, rng):
+    swapped = {}
+    random_ = rng.random
+    for i in range(m):
+        j = i + int(random_() * (m - i))
+        value = swapped.get(j, j)
+        swapped[j] = swapped.pop(i, i)
+        yield value
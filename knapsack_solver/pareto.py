@@ -0,0 +1,216 @@
+import math
+from bisect import bisect_left, bisect_right
+
+# Arquivos de soluções não dominadas (todas as componentes são maximizadas) e
+# hipervolume. Para dois objetivos, ParetoFront2D mantém a frente ordenada: a consulta
+# de dominância é uma busca binária e os pontos dominados por um novo ponto formam um
+# trecho contíguo. Para três ou mais objetivos, NDTree (Jaszkiewicz e Lust, 2018)
+# agrupa os pontos numa árvore cujos nós guardam os pontos ideal e nadir, e descarta
+# subárvores inteiras sem compará-las ponto a ponto.
+
+# a domina fracamente b: a >= b em todas as componentes
+def weakly_dominates(a, b):
+    return all(x >= y for x, y in zip(a, b))
+
+# a domina b: a >= b em todas as componentes e a != b
+def dominates(a, b):
+    return weakly_dominates(a, b) and tuple(a) != tuple(b)
+
+class ParetoFront2D:
+    __slots__ = ("first", "second", "payloads")
+
+    def __init__(self):
+        self.first = []  # Crescente
+        self.second = []  # Decrescente
+        self.payloads = []
+
+    # Um ponto com f1 >= a e f2 >= b existe se e só se o primeiro ponto com f1 >= a o tem.
+    # Com strict=True, um ponto igual não conta.
+    def is_dominated(self, objectives, strict=False):
+        a, b = objectives
+        i = bisect_left(self.first, a)
+        if i == len(self.first) or self.second[i] < b:
+            return False
+        return not strict or self.first[i] != a or self.second[i] != b
+
+    # Insere o ponto se ninguém o domina fracamente, retirando os que ele domina
+    def add(self, objectives, payload=None):
+        if self.is_dominated(objectives):
+            return False
+        a, b = objectives
+        hi = bisect_right(self.first, a)
+        lo = hi
+        while lo > 0 and self.second[lo - 1] <= b:
+            lo -= 1
+        self.first[lo:hi] = [a]
+        self.second[lo:hi] = [b]
+        self.payloads[lo:hi] = [payload]
+        return True
+
+    def __len__(self):
+        return len(self.first)
+
+    def points(self):
+        return [((a, b), payload) for a, b, payload in zip(self.first, self.second, self.payloads)]
+
+class _Node:
+    __slots__ = ("points", "children", "ideal", "nadir")
+
+    def __init__(self, points):
+        self.points = points  # Lista de (objetivos, payload) numa folha; None num nó interno
+        self.children = None
+        self.ideal = list(points[0][0])
+        self.nadir = list(points[0][0])
+        for objectives, _ in points[1:]:
+            self.widen(objectives)
+
+    def widen(self, objectives):
+        for k, x in enumerate(objectives):
+            if x > self.ideal[k]:
+                self.ideal[k] = x
+            if x < self.nadir[k]:
+                self.nadir[k] = x
+
+    def empty(self):
+        return not self.points if self.children is None else not self.children
+
+class NDTree:
+    __slots__ = ("root", "max_leaf", "branching", "size")
+
+    def __init__(self, num_objectives=3, max_leaf=20, branching=None):
+        self.root = None
+        self.max_leaf = max_leaf
+        self.branching = branching or num_objectives + 1
+        self.size = 0
+
+    def is_dominated(self, objectives, strict=False):
+        return self.root is not None and self._dominated(self.root, tuple(objectives), strict)
+
+    def _dominated(self, node, q, strict):
+        if weakly_dominates(node.nadir, q) and (not strict or q != tuple(node.nadir)):
+            return True
+        if not weakly_dominates(node.ideal, q):
+            return False  # Nenhum ponto do nó pode dominar q
+        if node.children is None:
+            test = dominates if strict else weakly_dominates
+            return any(test(p, q) for p, _ in node.points)
+        return any(self._dominated(child, q, strict) for child in node.children)
+
+    def add(self, objectives, payload=None):
+        q = tuple(objectives)
+        if self.root is not None:
+            if not self._update(self.root, q):
+                return False
+            if self.root.empty():
+                self.root = None
+        if self.root is None:
+            self.root = _Node([(q, payload)])
+        else:
+            self._insert(self.root, q, payload)
+        self.size += 1
+        return True
+
+    # Falso se q é dominado fracamente por algum ponto; senão retira os pontos que q domina
+    def _update(self, node, q):
+        if weakly_dominates(node.nadir, q):
+            return False
+        if weakly_dominates(q, node.ideal) and q != tuple(node.ideal):
+            self.size -= self._count(node)
+            node.points, node.children = [], None
+            return True
+        if not (weakly_dominates(node.ideal, q) or weakly_dominates(q, node.nadir)):
+            return True  # Nenhuma relação de dominância possível com o nó
+        if node.children is None:
+            kept = []
+            for p, payload in node.points:
+                if weakly_dominates(p, q):
+                    return False
+                if not weakly_dominates(q, p):
+                    kept.append((p, payload))
+            self.size -= len(node.points) - len(kept)
+            node.points = kept
+            return True
+        for child in node.children:
+            if not self._update(child, q):
+                return False
+        node.children = [child for child in node.children if not child.empty()]
+        return True
+
+    def _count(self, node):
+        if node.children is None:
+            return len(node.points)
+        return sum(self._count(child) for child in node.children)
+
+    def _insert(self, node, q, payload):
+        while True:
+            node.widen(q)
+            if node.children is None:
+                node.points.append((q, payload))
+                if len(node.points) > self.max_leaf:
+                    self._split(node)
+                return
+            node = min(node.children, key=lambda child: _distance(q, child))
+
+    # Divide uma folha: sementes distantes entre si e cada ponto vai para a mais próxima
+    def _split(self, node):
+        points = node.points
+        seeds = [max(range(len(points)), key=lambda i: sum(_sq(points[i][0], p) for p, _ in points))]
+        while len(seeds) < self.branching:
+            seeds.append(max(range(len(points)), key=lambda i: min(_sq(points[i][0], points[s][0]) for s in seeds)))
+        groups = [[] for _ in seeds]
+        for point in points:
+            k = min(range(len(seeds)), key=lambda s: _sq(point[0], points[seeds[s]][0]))
+            groups[k].append(point)
+        node.children = [_Node(group) for group in groups if group]
+        node.points = None
+
+    def __len__(self):
+        return self.size
+
+    def points(self):
+        result = []
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.children is None:
+                result.extend(node.points)
+            else:
+                stack.extend(node.children)
+        return result
+
+def _sq(a, b):
+    return sum((x - y) ** 2 for x, y in zip(a, b))
+
+# Distância de q ao centro da caixa [nadir, ideal] do nó
+def _distance(q, node):
+    return math.fsum((x - (lo + hi) / 2) ** 2 for x, lo, hi in zip(q, node.nadir, node.ideal))
+
+# Arquivo adequado ao número de objetivos
+def make_archive(num_objectives):
+    return ParetoFront2D() if num_objectives == 2 else NDTree(num_objectives)
+
+# Hipervolume (maximização) dominado pelos pontos em relação ao ponto de referência,
+# que deve ser pior que todos em todas as componentes. Em 2-D é uma varredura
+# O(n log n); com mais objetivos, fatia o último objetivo e soma os hipervolumes das
+# fatias (HSO), o que é exato e suficiente para frentes de alguns milhares de pontos.
+def hypervolume(points, reference):
+    points = [tuple(p) for p in points if all(x > r for x, r in zip(p, reference))]
+    if not points:
+        return 0.0
+    if len(reference) == 1:
+        return float(max(p[0] for p in points) - reference[0])
+    if len(reference) == 2:
+        volume = 0.0
+        best_second = reference[1]
+        for a, b in sorted(points, reverse=True):
+            if b > best_second:
+                volume += (a - reference[0]) * (b - best_second)
+                best_second = b
+        return volume
+    points.sort(key=lambda p: p[-1], reverse=True)
+    volume = 0.0
+    for k, p in enumerate(points):
+        below = points[k + 1][-1] if k + 1 < len(points) else reference[-1]
+        if p[-1] > below:
+            volume += (p[-1] - below) * hypervolume([q[:-1] for q in points[:k + 1]], reference[:-1])
+    return volume
@@ -0,0 +1,110 @@
+import numpy as np
+
+from .construction import smart_constructive_heuristic
+from .local_search import variable_neighborhood_descent
+
+# Redução ao "núcleo" antes das heurísticas. Na ordem de razão lucro/peso de
+# smart_constructive_heuristic, o item crítico b é o primeiro que não cabe inteiro; a
+# relaxação linear inclui todos os anteriores, uma fração de b e nenhum posterior, e
+# seu valor é o limitante de Dantzig. Com λ = p_b / w_b, o custo reduzido de j é
+# r_j = p_j - λ w_j, e forçar x_j contra a relaxação reduz o limitante em pelo menos
+# |r_j|. Se nem assim o limitante supera o lucro de uma solução conhecida, nenhuma
+# solução melhor tem x_j invertido e o item fica fixado no valor da relaxação.
+# Os itens livres formam o núcleo, uma instância menor resolvida por qualquer método;
+# expand() monta a solução completa a partir da solução do núcleo.
+
+class CoreProblem:
+    __slots__ = ("n", "Q", "profits", "weights", "items", "fixed_ones", "fixed_profit", "fixed_weight",
+                 "full_n", "break_item", "upper_bound", "lower_bound", "incumbent")
+
+    def __init__(self, items, fixed_ones, profits, weights, Q, full_n, break_item, upper_bound, lower_bound, incumbent):
+        self.items = items
+        self.fixed_ones = fixed_ones
+        self.full_n = full_n
+        self.n = len(items)
+        self.profits = [int(profits[i]) for i in items]
+        self.weights = [int(weights[i]) for i in items]
+        self.fixed_profit = sum(int(profits[i]) for i in fixed_ones)
+        self.fixed_weight = sum(int(weights[i]) for i in fixed_ones)
+        self.Q = Q - self.fixed_weight
+        self.break_item = break_item
+        self.upper_bound = upper_bound
+        self.lower_bound = lower_bound
+        self.incumbent = incumbent
+
+    # Solução da instância completa a partir de uma solução do núcleo
+    def expand(self, core_solution):
+        solution = [0] * self.full_n
+        for i in self.fixed_ones:
+            solution[i] = 1
+        for k, i in enumerate(self.items):
+            if core_solution[k]:
+                solution[i] = 1
+        return solution
+
+    def __repr__(self):
+        return (f"CoreProblem(n={self.n} de {self.full_n}, Q={self.Q}, fixados em 1: {len(self.fixed_ones)}, "
+                f"limitantes [{self.lower_bound}, {self.upper_bound}])")
+
+# Item crítico e limitante de Dantzig: devolve a ordem por razão, a posição do item
+# crítico nela (n se todos cabem) e o valor da relaxação linear
+def dantzig_bound(n, Q, profits, weights):
+    order = sorted(range(n), key=lambda i: profits[i] / weights[i], reverse=True)
+    capacity = Q
+    bound = 0.0
+    for k, i in enumerate(order):
+        if weights[i] > capacity:
+            return order, k, bound + capacity * profits[i] / weights[i]
+        capacity -= weights[i]
+        bound += profits[i]
+    return order, n, bound
+
+# Reduz a instância. lower_bound/incumbent: lucro e solução conhecidos; sem eles, usa a
+# construção gulosa melhorada por VND. Com core_size, além da fixação exata por custo
+# reduzido, fixa heuristicamente no valor da relaxação os itens livres mais distantes
+# do item crítico na ordem por razão, deixando no máximo core_size itens no núcleo.
+def reduce_instance(n, Q, profits, weights, lower_bound=None, incumbent=None, core_size=None):
+    if incumbent is None:
+        incumbent = smart_constructive_heuristic(n, Q, weights, profits, float("inf"))[0]
+        incumbent = variable_neighborhood_descent(incumbent, profits, weights, Q)
+    if lower_bound is None:
+        lower_bound = sum(p for p, x in zip(profits, incumbent) if x)
+    order, b, upper_bound = dantzig_bound(n, Q, profits, weights)
+    if b == n:  # Todos os itens cabem
+        return CoreProblem([], list(range(n)), profits, weights, Q, n, None, int(upper_bound), lower_bound, incumbent)
+
+    order = np.array(order, dtype=np.int64)
+    p = np.asarray(profits, dtype=np.float64)[order]
+    w = np.asarray(weights, dtype=np.float64)[order]
+    ratio = p[b] / w[b]
+    reduced_cost = np.abs(p - ratio * w)
+    in_relaxation = np.arange(n) < b
+    fixed = upper_bound - reduced_cost < lower_bound + 1
+    fixed[b] = False  # O item crítico é fracionário na relaxação
+
+    free = np.flatnonzero(~fixed)
+    if core_size is not None and len(free) > core_size:
+        keep = free[np.argsort(np.abs(free - b), kind="stable")[:core_size]]
+        fixed[:] = True
+        fixed[keep] = False
+        free = np.sort(keep)
+
+    fixed_ones = order[fixed & in_relaxation].tolist()
+    items = sorted(order[free].tolist())
+    core = CoreProblem(items, fixed_ones, profits, weights, Q, n, int(order[b]), int(upper_bound), lower_bound, incumbent)
+    if core.Q < 0:  # Só com core_size: os itens fixados em 1 já não cabem
+        raise ValueError("Núcleo inviável: reduza a fixação heurística (core_size maior)")
+    return core
+
+# Reduz, resolve o núcleo com solver(n, Q, lucros, pesos) -> solução do núcleo e
+# reconstrói a solução completa; fica com a solução conhecida se ela for melhor.
+# Devolve a solução, seu lucro e o CoreProblem.
+def solve_reduced(n, Q, profits, weights, solver, lower_bound=None, incumbent=None, core_size=None):
+    core = reduce_instance(n, Q, profits, weights, lower_bound, incumbent, core_size)
+    solution = core.expand(solver(core.n, core.Q, core.profits, core.weights)) if core.n else core.expand([])
+    profit = sum(p for p, x in zip(profits, solution) if x)
+    weight = sum(w for w, x in zip(weights, solution) if x)
+    incumbent_profit = sum(p for p, x in zip(profits, core.incumbent) if x)
+    if weight > Q or profit < incumbent_profit:
+        return list(core.incumbent), incumbent_profit, core
+    return solution, profit, core
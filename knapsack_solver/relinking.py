@@ -0,0 +1,229 @@
+import random
+import time
+
+import numpy as np
+
+from .construction import greedy_randomized_solution
+from .evaluation import evaluate_solution
+from .local_search import hill_climbing_fi
+
+# Path relinking sobre o GRASP (Resende e Ribeiro). Os ótimos locais bons e diferentes
+# entre si ficam num pool de elite; a trajetória entre um ótimo local novo e um membro
+# do pool, invertendo um bit diferente por passo, passa por soluções que misturam as
+# duas e que a construção gulosa raramente produz.
+
+if hasattr(np, "bitwise_count"):
+    _popcount = np.bitwise_count
+else:
+    _POPCOUNT_TABLE = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+    def _popcount(x):
+        return _POPCOUNT_TABLE[x]
+
+RELINK_DIRECTIONS = ("forward", "backward", "mixed")
+POST_SHARE = 0.1  # Fração de um time_limit total reservada à pós-otimização
+
+# Pool de elite com até size soluções, guardadas com bits empacotados (uma linha de
+# (n + 7) / 8 bytes por solução). A distância de Hamming entre uma solução e todo o pool
+# é um XOR seguido de popcount sobre a matriz, numa operação NumPy.
+# Regra de entrada: com o pool incompleto, entra a solução que dista pelo menos
+# min_distance de todas; com o pool cheio, a solução precisa também ser melhor que a
+# pior e substitui a mais parecida entre as piores que ela. Uma solução melhor que a
+# melhor do pool entra sempre que não for repetida.
+class ElitePool:
+    __slots__ = ("n", "size", "min_distance", "rows", "profits", "count")
+
+    def __init__(self, n, size=10, min_distance=None):
+        self.n = n
+        self.size = size
+        self.min_distance = max(1, n // 200) if min_distance is None else min_distance
+        self.rows = np.zeros((size, (n + 7) >> 3), dtype=np.uint8)
+        self.profits = np.zeros(size, dtype=np.int64)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    # Distâncias de Hamming da solução (já empacotada) a cada membro do pool
+    def distances(self, packed):
+        return _popcount(self.rows[:self.count] ^ packed).sum(axis=1, dtype=np.int64)
+
+    def add(self, solution, profit):
+        count = self.count
+        if count == self.size and profit <= self.profits[:count].min():
+            return False  # Caso mais comum: pior que o pool inteiro, sem calcular distâncias
+        packed = np.packbits(np.asarray(solution, dtype=np.uint8))
+        distances = self.distances(packed)
+        if count and distances.min() == 0:
+            return False
+        best = count == 0 or profit > self.profits[:count].max()
+        if not best and count and distances.min() < self.min_distance:
+            return False
+        if count < self.size:
+            slot = count
+            self.count += 1
+        else:
+            # Substitui, entre os membros piores que a solução, o mais parecido com ela
+            worse = np.flatnonzero(self.profits < profit)
+            slot = int(worse[distances[worse].argmin()])
+        self.rows[slot] = packed
+        self.profits[slot] = profit
+        return True
+
+    # Membro do pool para guiar o relinking a partir de solution, sorteado com
+    # probabilidade proporcional à distância; None se o pool só tem cópias dela
+    def select(self, solution, rng=random):
+        if not self.count:
+            return None
+        distances = self.distances(np.packbits(np.asarray(solution, dtype=np.uint8)))
+        if not distances.any():
+            return None
+        k = rng.choices(range(self.count), weights=distances.tolist())[0]
+        return self.solution(k)
+
+    def solution(self, k):
+        return np.unpackbits(self.rows[k], count=self.n).tolist()
+
+    def best(self):
+        if not self.count:
+            return None, 0
+        k = int(self.profits[:self.count].argmax())
+        return self.solution(k), int(self.profits[k])
+
+    # Pares (solução, lucro), do maior lucro para o menor
+    def members(self):
+        order = np.argsort(-self.profits[:self.count], kind="stable")
+        return [(self.solution(int(k)), int(self.profits[k])) for k in order]
+
+    # Conteúdo em vetores, para checkpoint.Checkpointer
+    def state(self):
+        return {"pool_rows": self.rows[:self.count].copy(), "pool_profits": self.profits[:self.count].copy()}
+
+    def restore(self, state):
+        count = len(state["pool_profits"])
+        self.rows[:count] = state["pool_rows"]
+        self.profits[:count] = state["pool_profits"]
+        self.count = count
+
+    def __repr__(self):
+        best = int(self.profits[:self.count].max()) if self.count else None
+        return f"ElitePool(n={self.n}, {self.count}/{self.size} solutions, best={best})"
+
+# Path relinking entre source e target: a cada passo inverte, entre os bits em que as
+# pontas ainda diferem, o que leva ao melhor valor (lucro, descontado o excesso de peso
+# vezes a maior razão lucro/peso), avaliando todos os candidatos do passo de uma vez a
+# partir do lucro e do peso correntes.
+# direction: "forward" parte de source em direção a target, "backward" de target em
+# direção a source e "mixed" alterna passos das duas pontas, que se encontram no meio.
+# Devolve a melhor solução viável intermediária (nenhuma das pontas) e seu lucro, ou
+# (None, 0) se as pontas diferem em menos de dois bits ou nenhuma intermediária é viável.
+def path_relinking(source, target, profits, weights, Q, direction="forward"):
+    if direction not in RELINK_DIRECTIONS:
+        raise ValueError(f"Direção de path relinking desconhecida: {direction}")
+    if direction == "backward":
+        source, target = target, source
+    profits = np.asarray(profits, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.int64)
+    penalty = float((profits / np.maximum(weights, 1)).max()) if len(profits) else 1.0
+    ends = [np.array(source, dtype=np.int8), np.array(target, dtype=np.int8)]
+    totals = [[int(profits @ end), int(weights @ end)] for end in ends]
+    diff = np.flatnonzero(ends[0] != ends[1])
+    best_solution = None
+    best_profit = 0
+    side = 0
+
+    while len(diff) > 1:  # O último passo chegaria à outra ponta
+        end, total = ends[side], totals[side]
+        sign = 1 - 2 * end[diff].astype(np.int64)  # +1: o item entra; -1: sai
+        new_profit = total[0] + sign * profits[diff]
+        new_weight = total[1] + sign * weights[diff]
+        score = new_profit - penalty * np.maximum(new_weight - Q, 0)
+        k = int(score.argmax())
+        i = int(diff[k])
+        end[i] ^= 1
+        total[0] = int(new_profit[k])
+        total[1] = int(new_weight[k])
+        diff = np.delete(diff, k)
+        if total[1] <= Q and total[0] > best_profit:
+            best_profit = total[0]
+            best_solution = end.tolist()
+        if direction == "mixed":
+            side ^= 1
+    return best_solution, best_profit
+
+# Relinking de solution com um membro do pool sorteado por select, seguido de hill
+# climbing na melhor intermediária. Devolve (solução, lucro) ou (None, 0).
+def relink_with_pool(solution, pool, profits, weights, Q, direction="mixed", rng=random, deadline=None):
+    guide = pool.select(solution, rng)
+    if guide is None:
+        return None, 0
+    relinked, _ = path_relinking(solution, guide, profits, weights, Q, direction)
+    if relinked is None:
+        return None, 0
+    relinked = hill_climbing_fi(relinked, profits, weights, Q, deadline=deadline)
+    return relinked, evaluate_solution(relinked, profits, weights, Q)[0]
+
+# Pós-otimização do pool: relinking (e hill climbing) entre todos os pares de membros;
+# os resultados disputam a entrada num novo pool, e as rodadas se repetem enquanto o
+# melhor lucro do pool melhora (no máximo max_rounds). Devolve o novo pool.
+def post_optimize(pool, profits, weights, Q, direction="mixed", max_rounds=10, time_limit=None):
+    start_time = time.time()
+    profit_array = np.asarray(profits, dtype=np.int64)
+    weight_array = np.asarray(weights, dtype=np.int64)
+    for _ in range(max_rounds):
+        members = pool.members()
+        previous_best = pool.best()[1]
+        new_pool = ElitePool(pool.n, pool.size, pool.min_distance)
+        for solution, profit in members:
+            new_pool.add(solution, profit)
+        for a in range(len(members)):
+            for b in range(a + 1, len(members)):
+                if time_limit is not None and time.time() - start_time >= time_limit:
+                    return new_pool
+                relinked, _ = path_relinking(members[a][0], members[b][0], profit_array, weight_array, Q, direction)
+                if relinked is None:
+                    continue
+                relinked = hill_climbing_fi(relinked, profits, weights, Q)
+                new_pool.add(relinked, evaluate_solution(relinked, profits, weights, Q)[0])
+        pool = new_pool
+        if pool.best()[1] <= previous_best:
+            break
+    return pool
+
+# GRASP com path relinking. Cada ótimo local da busca local é relinkado com um membro
+# do pool de elite (intensificação, com intensify=True) e os dois resultados disputam a
+# entrada no pool; com post_optimization=True, o pool final passa por post_optimize.
+# Com time_limit, o tempo é o total: as iterações param em (1 - post_share) * time_limit
+# (todo o tempo, sem pós-otimização) e a pós-otimização usa o que sobrar.
+# Devolve a melhor solução, seu lucro e o pool.
+def grasp_path_relinking(n, profits, weights, capacity, iterations, alpha=0.12, pool_size=10, min_distance=None,
+                         direction="mixed", intensify=True, post_optimization=True, time_limit=None, post_share=POST_SHARE,
+                         rng=random, pool=None):
+    if iterations is None and time_limit is None:
+        raise ValueError("grasp_path_relinking sem iterations precisa de time_limit")
+    start_time = time.time()
+    search_limit = time_limit
+    if time_limit is not None and post_optimization:
+        search_limit = time_limit * (1 - post_share)
+    if pool is None:
+        pool = ElitePool(n, pool_size, min_distance)
+    iteration = 0
+
+    while iterations is None or iteration < iterations:
+        if search_limit is not None and time.time() - start_time >= search_limit:
+            break
+        iteration += 1
+        solution, _, _ = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit=2.0, rng=rng)
+        solution = hill_climbing_fi(solution, profits, weights, capacity)
+        profit, _ = evaluate_solution(solution, profits, weights, capacity)
+        if intensify:
+            relinked, relinked_profit = relink_with_pool(solution, pool, profits, weights, capacity, direction, rng)
+            if relinked is not None:
+                pool.add(relinked, relinked_profit)
+        pool.add(solution, profit)
+
+    if post_optimization and len(pool) > 1:
+        remaining = None if time_limit is None else max(time_limit - (time.time() - start_time), 0.0)
+        pool = post_optimize(pool, profits, weights, capacity, direction, time_limit=remaining)
+    best_solution, best_profit = pool.best()
+    return best_solution, best_profit, pool
@@ -0,0 +1,189 @@
+import asyncio
+import hashlib
+import os
+import random
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+
+from .anytime import solve_anytime
+from .instance import parse_knapsack_text
+
+# Serviço assíncrono para muitas resoluções simultâneas. As instâncias chegam como
+# texto (formato dos arquivos) ou como (n, Q, lucros, pesos); o texto é interpretado
+# uma vez e guardado num cache LRU pelo hash SHA-256 do conteúdo. As resoluções rodam
+# num pool de processos com no máximo max_pending pedidos em andamento; instâncias
+# pequenas (até small_items itens) são agrupadas e enviadas ao pool em lotes, para não
+# pagar o custo de despacho uma a uma. Cada pedido tem seu prazo: o worker resolve com
+# solve_anytime até o instante limite, e o pedido falha com TimeoutError se a resposta
+# não chegar até lá (mais uma folga de grace segundos).
+# Com um executor próprio, workers (quantos pedidos ele executa ao mesmo tempo) é
+# obrigatório: define em quantos lotes os pedidos pequenos são divididos.
+
+# Executa o pedido no worker: resolve até o instante deadline_at (time.time()) do
+# pedido, ou até stop_at, se for antes
+def _solve_job(job, stop_at=None):
+    n, Q, profits, weights, deadline_at, iterations, method, seed = job
+    if stop_at is not None:
+        deadline_at = min(deadline_at, stop_at)
+    remaining = max(deadline_at - time.time(), 0.0)
+    return solve_anytime(n, profits, weights, Q, remaining, method=method, max_iterations=iterations,
+                         rng=random.Random(seed))
+
+# Lote de pedidos pequenos, resolvidos em sequência no mesmo worker. Cada pedido fica
+# com uma fatia igual do tempo que resta até o seu prazo entre ele e os que faltam, para
+# que os primeiros não consumam o prazo dos últimos. Um erro num pedido é devolvido no
+# lugar do resultado, sem derrubar os demais.
+def _solve_batch(jobs):
+    results = []
+    for k, job in enumerate(jobs):
+        now = time.time()
+        stop_at = now + max(job[4] - now, 0.0) / (len(jobs) - k)
+        try:
+            results.append(_solve_job(job, stop_at))
+        except Exception as e:
+            results.append(e)
+    return results
+
+# Executor que roda cada tarefa na hora, no próprio processo. Substitui o pool de
+# processos em testes locais e em ambientes sem multiprocessing.
+class InlineExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        return future
+
+class SolverService:
+    def __init__(self, workers=None, executor=None, max_pending=64, batch_size=32, batch_window=0.002,
+                 small_items=1000, cache_size=256, time_limit=1.0, iterations=50, grace=0.5):
+        if executor is not None and workers is None:
+            raise ValueError("SolverService com executor próprio precisa de workers")
+        self._own_executor = executor is None
+        self.executor = ProcessPoolExecutor(max_workers=workers) if executor is None else executor
+        self.workers = workers or os.cpu_count() or 1
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.small_items = small_items
+        self.cache_size = cache_size
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.grace = grace
+        self._pending = asyncio.Semaphore(max_pending)
+        self._cache = OrderedDict()
+        self._queue = []
+        self._flush_handle = None
+        self.stats = {"requests": 0, "batches": 0, "single": 0, "cache_hits": 0, "cache_misses": 0, "timeouts": 0}
+
+    # Instância interpretada: texto (str ou bytes) passa pelo cache; tuplas são usadas como estão
+    def load(self, data):
+        if not isinstance(data, (str, bytes)):
+            n, Q, profits, weights = data
+            return n, Q, list(profits), list(weights)
+        if isinstance(data, str):
+            data = data.encode()
+        key = hashlib.sha256(data).digest()
+        instance = self._cache.get(key)
+        if instance is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return instance
+        self.stats["cache_misses"] += 1
+        n, Q, profits, weights = parse_knapsack_text(data)
+        instance = (n, Q, profits.tolist(), weights.tolist())
+        self._cache[key] = instance
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return instance
+
+    # Resolve uma instância e devolve o anytime.Snapshot da melhor solução.
+    # time_limit: prazo do pedido em segundos; iterations: máximo de iterações de melhora.
+    async def solve(self, data, time_limit=None, iterations=None, method="grasp", seed=None):
+        time_limit = self.time_limit if time_limit is None else time_limit
+        iterations = self.iterations if iterations is None else iterations
+        n, Q, profits, weights = self.load(data)
+        self.stats["requests"] += 1
+        async with self._pending:
+            job = (n, Q, profits, weights, time.time() + time_limit, iterations, method, seed)
+            if n <= self.small_items:
+                future = self._enqueue(job)
+            else:
+                self.stats["single"] += 1
+                future = asyncio.get_running_loop().run_in_executor(self.executor, _solve_job, job)
+            try:
+                return await asyncio.wait_for(future, time_limit + self.grace)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                raise
+
+    async def solve_many(self, instances, **kwargs):
+        return await asyncio.gather(*(self.solve(data, **kwargs) for data in instances))
+
+    def _enqueue(self, job):
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._queue.append((job, future))
+        if len(self._queue) >= self.batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.batch_window, self._flush)
+        return future
+
+    # Envia os pedidos pequenos acumulados ao pool, divididos em até workers lotes de
+    # tamanho parecido, para que todos os workers trabalhem
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+        loop = asyncio.get_running_loop()
+        chunk = -(-len(queue) // self.workers)
+        for start in range(0, len(queue), chunk):
+            self._submit_batch(loop, queue[start:start + chunk])
+
+    def _submit_batch(self, loop, queue):
+        self.stats["batches"] += 1
+        batch = loop.run_in_executor(self.executor, _solve_batch, [job for job, _ in queue])
+        futures = [future for _, future in queue]
+
+        def deliver(batch):
+            error = batch.exception()
+            results = [error] * len(futures) if error is not None else batch.result()
+            for future, result in zip(futures, results):
+                if future.done():  # Cancelado por prazo
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+        batch.add_done_callback(deliver)
+
+    async def close(self):
+        self._flush()
+        if self._own_executor:
+            await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+# Cliente local do serviço, no mesmo processo e sem rede, para testes e exemplos:
+# recebe textos de instância e devolve dicionários como os que uma API devolveria
+class LocalClient:
+    def __init__(self, service):
+        self.service = service
+
+    async def solve(self, text, **kwargs):
+        snapshot = await self.service.solve(text, **kwargs)
+        return {"profit": snapshot.profit, "weight": snapshot.weight, "items": [i for i, x in enumerate(snapshot.solution) if x],
+                "time": snapshot.time}
+
+    async def solve_many(self, texts, **kwargs):
+        return await asyncio.gather(*(self.solve(text, **kwargs) for text in texts))
@@ -0,0 +1,62 @@
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Instância compartilhada com os processos de um pool. Lucros e pesos são copiados uma
+# única vez para um segmento de memória compartilhada ([lucros | pesos | sinal de parada]);
+# as tarefas recebem só o nome do segmento e cada worker o anexa uma vez (attach_instance).
+class SharedInstance:
+    __slots__ = ("n", "shm", "data")
+
+    def __init__(self, n, profits, weights):
+        self.n = n
+        self.shm = shared_memory.SharedMemory(create=True, size=8 * (2 * n + 1))
+        self.data = np.ndarray((2 * n + 1,), dtype=np.int64, buffer=self.shm.buf)
+        self.data[:n] = profits
+        self.data[n:2 * n] = weights
+        self.data[2 * n] = 0
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    # Sinaliza aos workers que devem parar
+    def stop(self):
+        self.data[2 * self.n] = 1
+
+    def close(self):
+        self.data = None
+        self.shm.close()
+        self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+# Instância anexada por este processo: (nome do segmento, segmento, lucros, pesos, sinal).
+# Só a última fica anexada: um executor de vida longa recebe um segmento novo a cada
+# chamada, e o anterior (já removido por SharedInstance.close) é desanexado aqui.
+_worker_instance = None
+
+# Devolve lucros e pesos (listas) e o sinal de parada (vetor de 1 posição) do segmento
+def attach_instance(name, n):
+    global _worker_instance
+    if _worker_instance is None or _worker_instance[0] != name:
+        _detach_instance()
+        shm = shared_memory.SharedMemory(name=name)
+        data = np.ndarray((2 * n + 1,), dtype=np.int64, buffer=shm.buf)
+        _worker_instance = (name, shm, data[:n].tolist(), data[n:2 * n].tolist(), data[2 * n:])
+    return _worker_instance[2:]
+
+def _detach_instance():
+    global _worker_instance
+    if _worker_instance is None:
+        return
+    shm = _worker_instance[1]
+    _worker_instance = None  # Solta a visão do sinal antes de fechar o mapeamento
+    try:
+        shm.close()
+    except BufferError:
+        pass  # Alguma tarefa ainda segura o sinal; o mapeamento sai junto com ela
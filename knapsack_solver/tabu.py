@@ -0,0 +1,64 @@
+import random
+import time
+
+from .construction import greedy_randomized_solution, smart_constructive_heuristic
+from .memo import TabuList, ZobristTable
+
+# Busca tabu com vizinhança de bit flip. As soluções visitadas recentemente ficam numa
+# TabuList pelo hash Zobrist, calculado de forma incremental para cada vizinho, e um
+# vizinho tabu só é aceito se superar o melhor lucro já encontrado (aspiração). A cada
+# iteração o melhor vizinho viável não tabu é aceito, mesmo que piore a solução.
+# Devolve a melhor solução, seu lucro e o número de iterações.
+def tabu_search(n, profits, weights, Q, initial="smart", tenure=None, max_iterations=1000, time_limit=None,
+                alpha=0.12, seed=0, rng=random):
+    start_time = time.perf_counter()
+    if initial == "smart":
+        solution = smart_constructive_heuristic(n, Q, weights, profits, float("inf"))[0]
+    elif initial == "greedy":
+        solution = greedy_randomized_solution(n, profits, weights, Q, alpha, float("inf"), rng=rng)[0]
+    else:
+        solution = list(initial)
+    zobrist = ZobristTable(n, seed)
+    keys = zobrist.keys
+    tabu = TabuList(tenure if tenure is not None else max(7, n // 10))
+
+    h = zobrist.hash(solution)
+    tabu.add(h)
+    profit = sum(p for p, x in zip(profits, solution) if x)
+    weight = sum(w for w, x in zip(weights, solution) if x)
+    best_solution = solution[:]
+    best_profit = profit
+
+    iteration = 0
+    while iteration < max_iterations:
+        if time_limit is not None and time.perf_counter() - start_time >= time_limit:
+            break
+        iteration += 1
+        best_move = None
+        best_value = None
+        for i in range(n):
+            if solution[i]:
+                delta_profit, delta_weight = -profits[i], -weights[i]
+            else:
+                delta_profit, delta_weight = profits[i], weights[i]
+                if weight + delta_weight > Q:
+                    continue
+            if best_value is not None and delta_profit <= best_value:
+                continue
+            if h ^ keys[i] in tabu and profit + delta_profit <= best_profit:
+                continue
+            best_move = i
+            best_value = delta_profit
+        if best_move is None:
+            break  # Todos os vizinhos viáveis são tabu
+
+        i = best_move
+        solution[i] = 1 - solution[i]
+        profit += best_value
+        weight += weights[i] if solution[i] else -weights[i]
+        h ^= keys[i]
+        tabu.add(h)
+        if profit > best_profit:
+            best_profit = profit
+            best_solution = solution[:]
+    return best_solution, best_profit, iteration
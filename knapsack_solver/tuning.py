@@ -0,0 +1,102 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .construction import greedy_randomized_solution
+from .evaluation import evaluate_solution
+from .local_search import hill_climbing_fi
+from .shared import SharedInstance, attach_instance
+
+# Ajuste de α da construção gulosa randomizada. Cada α é avaliado com várias sementes
+# num pool de processos (a instância fica em memória compartilhada) e os valores ruins
+# são descartados cedo, em vez da varredura serial de find_best_alpha com uma amostra
+# por α. A k-ésima amostra usa a mesma semente para todos os α (números aleatórios
+# comuns), o que reduz a variância das comparações entre eles.
+
+TUNING_METHODS = ("halving", "racing")
+
+# Amostras de um α executadas num worker: lucro de uma construção (seguida de hill
+# climbing, com local_search=True) para cada semente
+def _evaluate_alpha(shm_name, n, capacity, alpha, seeds, time_limit, local_search):
+    profits, weights, _ = attach_instance(shm_name, n)
+    results = []
+    for seed in seeds:
+        rng = random.Random(seed)
+        solution, _, profit = greedy_randomized_solution(n, profits, weights, capacity, alpha, time_limit, rng=rng)
+        if local_search:
+            profit, _ = evaluate_solution(hill_climbing_fi(solution, profits, weights, capacity), profits, weights, capacity)
+        results.append(profit)
+    return results
+
+def _summary(alpha, samples, eliminated):
+    mean = sum(samples) / len(samples)
+    variance = sum((x - mean) ** 2 for x in samples) / (len(samples) - 1) if len(samples) > 1 else 0.0
+    return {"alpha": alpha, "samples": len(samples), "mean": mean, "std": math.sqrt(variance),
+            "best": max(samples), "eliminated": eliminated}
+
+# Procura o melhor α entre alphas (padrão: 0, 0.01, ..., 1).
+# method="halving" (successive halving): todos os α começam com initial_samples
+# amostras; a cada rodada só o melhor 1/eta (pela média) segue e recebe eta vezes mais
+# amostras, até restar um α ou atingir max_samples.
+# method="racing": a cada rodada todos os α vivos ganham initial_samples amostras e um α
+# é eliminado quando média + z·erro padrão fica abaixo de média - z·erro padrão do líder.
+# Devolve a tabela ordenada (α sobreviventes primeiro, depois pela média) com α,
+# amostras, média, desvio padrão, melhor lucro e a rodada em que o α foi eliminado.
+def tune_alpha(n, profits, weights, capacity, alphas=None, method="halving", initial_samples=2, eta=2,
+               max_samples=32, z=2.0, workers=None, executor=None, seed=None, time_limit=1.0, local_search=False):
+    if method not in TUNING_METHODS:
+        raise ValueError(f"Método de ajuste desconhecido: {method}")
+    if alphas is None:
+        alphas = [i / 100 for i in range(101)]
+    alphas = list(alphas)
+    seeds = [int(s) for s in np.random.SeedSequence(seed).generate_state(max_samples)]
+    samples = {alpha: [] for alpha in alphas}
+    eliminated = {}
+    alive = alphas[:]
+
+    with SharedInstance(n, profits, weights) as instance:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            round_ = 0
+            target = initial_samples
+            while alive:
+                target = min(target, max_samples)
+                futures = {
+                    alpha: executor.submit(_evaluate_alpha, instance.name, n, capacity, alpha,
+                                           seeds[len(samples[alpha]):target], time_limit, local_search)
+                    for alpha in alive if len(samples[alpha]) < target
+                }
+                for alpha, future in futures.items():
+                    samples[alpha].extend(future.result())
+                round_ += 1
+                if len(alive) == 1 or target >= max_samples:
+                    break
+
+                means = {alpha: sum(samples[alpha]) / len(samples[alpha]) for alpha in alive}
+                if method == "halving":
+                    ranked = sorted(alive, key=lambda alpha: -means[alpha])
+                    keep = max(1, math.ceil(len(ranked) / eta))
+                    survivors = ranked[:keep]
+                    target *= eta
+                else:
+                    bounds = {alpha: z * _summary(alpha, samples[alpha], None)["std"] / math.sqrt(len(samples[alpha]))
+                              for alpha in alive}
+                    leader = max(alive, key=lambda alpha: means[alpha])
+                    floor = means[leader] - bounds[leader]
+                    survivors = [alpha for alpha in alive if means[alpha] + bounds[alpha] >= floor]
+                    target += initial_samples
+                for alpha in alive:
+                    if alpha not in survivors:
+                        eliminated[alpha] = round_
+                alive = [alpha for alpha in alive if alpha in survivors]
+        finally:
+            if own_executor:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    table = [_summary(alpha, samples[alpha], eliminated.get(alpha)) for alpha in alphas]
+    table.sort(key=lambda row: (row["eliminated"] is not None, -(row["eliminated"] or 0), -row["mean"]))
+    return table
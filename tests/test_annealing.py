@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from knapsack_solver.annealing import simulated_annealing
+
+@pytest.mark.parametrize("infeasible", ["penalty", "repair"])
+def test_recovers_from_overweight_initial_solution(infeasible):
+    n = 10
+    profits = [5] * n
+    weights = [10] * n
+    solution, profit, _ = simulated_annealing(n, profits, weights, 25, initial=[1] * n, max_iterations=2000,
+                                              infeasible=infeasible, rng=random.Random(0))
+    assert profit == 10
+    assert sum(w for w, x in zip(weights, solution) if x) <= 25
+
+def test_repair_keeps_the_best_ratio_items():
+    profits = [1, 9, 2, 8]
+    weights = [5, 5, 5, 5]
+    solution, profit, _ = simulated_annealing(4, profits, weights, 10, initial=[1, 1, 1, 1], max_iterations=0,
+                                              infeasible="repair", rng=random.Random(0))
+    assert solution == [0, 1, 0, 1]
+    assert profit == 17
+
+@pytest.mark.parametrize("infeasible", ["penalty", "repair"])
+def test_solutions_are_feasible(infeasible):
+    rng = random.Random(3)
+    for _ in range(20):
+        n = rng.randint(5, 40)
+        profits = [rng.randint(1, 50) for _ in range(n)]
+        weights = [rng.randint(1, 50) for _ in range(n)]
+        Q = rng.randint(20, 300)
+        solution, profit, _ = simulated_annealing(n, profits, weights, Q, initial="greedy", max_iterations=3000,
+                                                  infeasible=infeasible, rng=random.Random(1))
+        assert sum(w for w, x in zip(weights, solution) if x) <= Q
+        assert sum(p for p, x in zip(profits, solution) if x) == profit
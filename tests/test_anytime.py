@@ -0,0 +1,36 @@
+import random
+import time
+
+from knapsack_solver.anytime import AnytimeSolver, CancelToken, Deadline, solve_anytime
+from knapsack_solver.construction import CHECK_EVERY
+from knapsack_solver.generator import generate_instance
+
+def test_deadline_reads_the_clock_every_check_every_calls():
+    deadline = Deadline(0.0)
+    assert deadline.check_every == CHECK_EVERY
+    assert deadline.expired()  # A primeira chamada consulta o relógio
+    token = CancelToken()
+    deadline = Deadline(None, token, check_every=4)
+    assert not deadline.expired()
+    token.cancel()
+    assert [deadline.expired() for _ in range(4)] == [False, False, False, True]
+    assert deadline.expired()
+    assert deadline.remaining() == 0.0
+
+def test_solve_anytime_respects_the_time_limit():
+    n, Q, profits, weights = generate_instance(2000, "weakly", seed=0)
+    profits, weights = profits.tolist(), weights.tolist()
+    start = time.perf_counter()
+    snapshot = solve_anytime(n, profits, weights, Q, 0.3, rng=random.Random(0))
+    assert time.perf_counter() - start < 0.3 + 0.5
+    assert sum(w for w, x in zip(weights, snapshot.solution) if x) == snapshot.weight <= Q
+    assert sum(p for p, x in zip(profits, snapshot.solution) if x) == snapshot.profit
+
+def test_cancel_stops_the_solver():
+    n, Q, profits, weights = generate_instance(500, "uncorrelated", seed=1)
+    with AnytimeSolver(n, profits.tolist(), weights.tolist(), Q, rng=random.Random(0)) as solver:
+        time.sleep(0.05)
+        solver.cancel()
+        best = solver.result(timeout=2.0)
+    assert not solver.running
+    assert best.profit > 0
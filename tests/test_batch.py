@@ -0,0 +1,98 @@
+import csv
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from knapsack_solver.batch import FIELDS, decode_items, iter_instance_paths, open_writer, solve_batch
+from knapsack_solver.generator import generate_instance
+from knapsack_solver.instance import load_instance, write_knapsack_text
+
+COUNT = 6
+
+@pytest.fixture
+def instance_dir(tmp_path):
+    directory = tmp_path / "instances"
+    directory.mkdir()
+    for k in range(COUNT):
+        write_knapsack_text(directory / f"i{k}.txt", *generate_instance(30 + k, "weakly", seed=k))
+    (directory / "broken.txt").write_text("3\n10\n1 2\n")
+    (directory / "notes.md").write_text("ignorado pelo padrão *.txt\n")
+    return directory
+
+# Executor em threads que registra quantas tarefas ficaram em andamento ao mesmo tempo
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self, max_workers):
+        super().__init__(max_workers)
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, future):
+        with self.lock:
+            self.in_flight -= 1
+
+def check_records(records, instance_dir):
+    assert len(records) == COUNT + 1
+    assert sorted(int(record["index"]) for record in records) == list(range(COUNT + 1))
+    for record in records:
+        assert set(record) == set(FIELDS)
+        if record["instance"].endswith("broken.txt"):
+            assert "ValueError" in record["error"]
+            continue
+        assert not record["error"]
+        n, Q, profits, weights = load_instance(record["instance"])
+        items = decode_items(record["solution"], n)
+        assert int(record["n"]) == n and int(record["items"]) == len(items)
+        assert sum(int(weights[i]) for i in items) == int(record["weight"]) <= Q
+        assert sum(int(profits[i]) for i in items) == int(record["profit"])
+
+def run(instance_dir, output, **kwargs):
+    writer = open_writer(str(output))
+    try:
+        summary = solve_batch(iter_instance_paths([str(instance_dir)]), writer, time_limit=0.05, seed=1, **kwargs)
+    finally:
+        writer.close()
+    assert (summary["solved"], summary["errors"]) == (COUNT, 1)
+
+def test_jsonl_writer(tmp_path, instance_dir):
+    output = tmp_path / "out.jsonl"
+    run(instance_dir, output)
+    check_records([json.loads(line) for line in output.read_text().splitlines()], instance_dir)
+
+def test_csv_writer(tmp_path, instance_dir):
+    output = tmp_path / "out.csv"
+    run(instance_dir, output)
+    with open(output, newline="") as f:
+        check_records(list(csv.DictReader(f)), instance_dir)
+
+def test_parquet_writer(tmp_path, instance_dir):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "out.parquet"
+    run(instance_dir, output)
+    check_records(pq.read_table(output).to_pylist(), instance_dir)
+
+@pytest.mark.parametrize("max_pending", [1, 3])
+def test_max_pending_bounds_futures_in_flight(tmp_path, instance_dir, max_pending):
+    executor = CountingExecutor(4)
+    try:
+        run(instance_dir, tmp_path / "out.jsonl", executor=executor, max_pending=max_pending)
+    finally:
+        executor.shutdown()
+    assert executor.peak == max_pending
+    assert executor.in_flight == 0
+
+def test_manifest_paths_are_relative_to_the_manifest(tmp_path, instance_dir):
+    manifest = tmp_path / "manifest.txt"
+    manifest.write_text("# comentário\n\ninstances/i0.txt\ninstances/i1.txt\n")
+    assert list(iter_instance_paths(manifests=[str(manifest)])) == [str(tmp_path / "instances" / "i0.txt"),
+                                                                     str(tmp_path / "instances" / "i1.txt")]
@@ -0,0 +1,101 @@
+import os
+import random
+
+import numpy as np
+import pytest
+
+from knapsack_solver import cli
+from knapsack_solver.checkpoint import Checkpointer, atomic_savez
+from knapsack_solver.generator import generate_instance
+from knapsack_solver.grasp import grasp_knapsack
+from knapsack_solver.instance import write_knapsack_text
+from knapsack_solver.memo import SolutionCache
+from knapsack_solver.relinking import ElitePool
+
+class Interrupted(Exception):
+    pass
+
+# Checkpointer que simula a morte do processo logo depois da gravação número limit
+class KillAfter(Checkpointer):
+    __slots__ = ("limit",)
+
+    def __init__(self, path, limit, **kwargs):
+        super().__init__(path, **kwargs)
+        self.limit = limit
+
+    def save(self, iteration, **arrays):
+        super().save(iteration, **arrays)
+        if self.saves >= self.limit:
+            raise Interrupted
+
+@pytest.fixture
+def instance():
+    n, Q, profits, weights = generate_instance(120, "weakly", seed=3)
+    return n, Q, profits.tolist(), weights.tolist()
+
+def run(instance, seed, alpha, checkpoint=None, resume=False):
+    n, Q, profits, weights = instance
+    cache = SolutionCache(n, 8)
+    pool = ElitePool(n, 5)
+    solution, profit = grasp_knapsack(n, profits, weights, Q, 60, alpha, batch_size=16, rng=random.Random(seed),
+                                      cache=cache, checkpoint=checkpoint, resume=resume, pool=pool)
+    return solution, profit, cache.stats, pool.members()
+
+@pytest.mark.parametrize("alpha", [0.02, 0.3])
+def test_grasp_resume_matches_uninterrupted_run(tmp_path, instance, alpha):
+    expected = run(instance, 5, alpha)
+    path = tmp_path / "grasp.npz"
+    for limit in (2, 3):
+        with pytest.raises(Interrupted):
+            run(instance, 5 if limit == 2 else 999, alpha, KillAfter(path, limit, every=7, interval=None), resume=True)
+    # A semente do gerador não importa mais: o estado vem do checkpoint
+    resumed = run(instance, 999, alpha, Checkpointer(path, every=7, interval=None), resume=True)
+    assert resumed == expected
+
+def test_resume_rejects_other_parameters(tmp_path, instance):
+    path = tmp_path / "grasp.npz"
+    run(instance, 5, 0.3, Checkpointer(path, every=7, interval=None))
+    with pytest.raises(ValueError, match="alpha"):
+        run(instance, 5, 0.5, Checkpointer(path), resume=True)
+
+def test_local_search_resume_matches_uninterrupted_run(tmp_path, instance, monkeypatch, capsys):
+    instance_path = str(tmp_path / "instance.txt")
+    n, Q, profits, weights = instance
+    write_knapsack_text(instance_path, n, Q, np.array(profits), np.array(weights))
+    args = ["local-search", instance_path, "--starts", "12", "--seed", "2", "--order", "random"]
+
+    def profits_line(output):
+        return [line for line in output.splitlines() if "Profit" in line]
+
+    cli.main(args)
+    expected = profits_line(capsys.readouterr().out)
+
+    checkpoint = str(tmp_path / "ls.npz")
+    original_save = Checkpointer.save
+
+    def save(self, iteration, **arrays):
+        original_save(self, iteration, **arrays)
+        if iteration == 5:
+            raise Interrupted
+
+    monkeypatch.setattr(Checkpointer, "save", save)
+    with pytest.raises(Interrupted):
+        cli.main(args + ["--checkpoint", checkpoint, "--checkpoint-every", "1"])
+    monkeypatch.setattr(Checkpointer, "save", original_save)
+    capsys.readouterr()
+    cli.main(args + ["--checkpoint", checkpoint, "--checkpoint-every", "1", "--resume"])
+    assert profits_line(capsys.readouterr().out) == expected
+
+def test_failed_write_keeps_previous_checkpoint(tmp_path):
+    path = tmp_path / "state.npz"
+    atomic_savez(path, value=np.array(1))
+
+    class Broken:
+        def __array__(self, *args, **kwargs):
+            raise RuntimeError("falha no meio da gravação")
+
+    with pytest.raises(RuntimeError):
+        atomic_savez(path, value=np.array(2), broken=Broken())
+    with np.load(path) as data:
+        assert int(data["value"]) == 1
+    assert os.listdir(tmp_path) == ["state.npz"]
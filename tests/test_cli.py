@@ -0,0 +1,24 @@
+import pytest
+
+from knapsack_solver import cli
+from knapsack_solver.generator import generate_instance
+from knapsack_solver.instance import write_knapsack_text
+
+@pytest.fixture
+def instance_path(tmp_path):
+    path = str(tmp_path / "instance.txt")
+    write_knapsack_text(path, *generate_instance(60, "weakly", seed=1))
+    return path
+
+@pytest.mark.parametrize("options", [["--workers", "2"], ["--target", "10"], ["--memo", "8"], ["--stats"],
+                                     ["--trace", "trace.csv"], ["--reactive"]])
+@pytest.mark.parametrize("mode", ["intensify", "both"])
+def test_relink_rejects_options_it_would_ignore(instance_path, options, mode):
+    with pytest.raises(ValueError, match=options[0]):
+        cli.main(["grasp", instance_path, "--relink", "mixed", "--relink-mode", mode, *options])
+
+def test_relink_post_mode_accepts_serial_options(instance_path, capsys):
+    cli.main(["grasp", instance_path, "--iterations", "20", "--seed", "1", "--relink", "mixed", "--relink-mode", "post",
+              "--memo", "8", "--stats"])
+    output = capsys.readouterr().out
+    assert "Elite pool" in output and "Memo:" in output
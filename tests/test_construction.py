@@ -0,0 +1,36 @@
+import random
+
+from knapsack_solver.construction import greedy_randomized_solution
+
+# Construção original (lista de candidatos reordenada a cada passo), com o gerador
+# recebido por parâmetro
+def old_greedy_randomized_solution(n, profits, weights, capacity, alpha, rng):
+    solution = [0] * n
+    remaining_capacity = capacity
+    total_profit = 0
+    items = list(range(n))
+    while items:
+        candidates = [(i, profits[i] / weights[i]) for i in items if weights[i] <= remaining_capacity]
+        if not candidates:
+            break
+        candidates.sort(key=lambda x: x[1], reverse=True)
+        num_candidates = max(1, int(alpha * len(candidates)))
+        selected_item = rng.choice(candidates[:num_candidates])[0]
+        solution[selected_item] = 1
+        remaining_capacity -= weights[selected_item]
+        total_profit += profits[selected_item]
+        items.remove(selected_item)
+    return solution, capacity - remaining_capacity, total_profit
+
+def test_same_solutions_as_old_construction_for_fixed_seed():
+    rng = random.Random(1)
+    for case in range(200):
+        n = rng.randint(1, 60)
+        # Lucros e pesos pequenos produzem muitos empates de razão
+        profits = [rng.randint(1, 10) for _ in range(n)]
+        weights = [rng.randint(1, 10) for _ in range(n)]
+        capacity = rng.randint(0, 5 * n)
+        alpha = rng.choice([0.0, 0.1, 0.3, 0.5, 1.0, rng.random()])
+        expected = old_greedy_randomized_solution(n, profits, weights, capacity, alpha, random.Random(case))
+        got = greedy_randomized_solution(n, profits, weights, capacity, alpha, float("inf"), rng=random.Random(case))
+        assert got == expected
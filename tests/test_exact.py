@@ -0,0 +1,39 @@
+import itertools
+import random
+
+import pytest
+
+from knapsack_solver import evaluate_solution
+from knapsack_solver.exact import branch_and_bound, dp_knapsack
+
+def brute_force(n, Q, profits, weights):
+    best = 0
+    for solution in itertools.product((0, 1), repeat=n):
+        if sum(w for w, x in zip(weights, solution) if x) <= Q:
+            best = max(best, sum(p for p, x in zip(profits, solution) if x))
+    return best
+
+def small_instances(count=150, seed=0):
+    rng = random.Random(seed)
+    for _ in range(count):
+        n = rng.randint(1, 12)
+        profits = [rng.randint(1, 30) for _ in range(n)]
+        weights = [rng.randint(1, 30) for _ in range(n)]
+        Q = rng.randint(0, sum(weights))
+        yield n, Q, profits, weights
+
+@pytest.mark.parametrize("n, Q, profits, weights", list(small_instances()))
+def test_dp_and_branch_and_bound_match_brute_force(n, Q, profits, weights):
+    optimum = brute_force(n, Q, profits, weights)
+
+    solution, profit = dp_knapsack(n, Q, profits, weights)
+    assert profit == optimum
+    assert evaluate_solution(solution, profits, weights, Q)[0] == optimum
+    assert sum(w for w, x in zip(weights, solution) if x) <= Q
+    assert dp_knapsack(n, Q, profits, weights, reconstruct=False)[1] == optimum
+
+    solution, profit, proven = branch_and_bound(n, Q, profits, weights)
+    assert proven
+    assert profit == optimum
+    assert evaluate_solution(solution, profits, weights, Q)[0] == optimum
+    assert sum(w for w, x in zip(weights, solution) if x) <= Q
@@ -0,0 +1,46 @@
+import numpy as np
+import pytest
+
+from knapsack_solver.generator import generate_instance
+from knapsack_solver.genetic import CROSSOVERS, _Repair, genetic_algorithm
+
+# Reparo de Chu e Beasley item a item, na ordem interna (razão decrescente)
+def sequential_repair(row, weights, Q):
+    row = row.copy()
+    weight = int(row @ weights)
+    for k in range(len(row) - 1, -1, -1):
+        if weight <= Q:
+            break
+        if row[k]:
+            row[k] = 0
+            weight -= weights[k]
+    for k in range(len(row)):
+        if not row[k] and weight + weights[k] <= Q:
+            row[k] = 1
+            weight += weights[k]
+    return row
+
+@pytest.mark.parametrize("family", ["uncorrelated", "strongly", "subset-sum"])
+def test_repair_matches_sequential_greedy(family):
+    rng = np.random.default_rng(0)
+    for seed in range(10):
+        n, Q, profits, weights = generate_instance(50, family, R=100, capacity_ratio=rng.uniform(0.05, 0.9), seed=seed)
+        repair = _Repair(profits.tolist(), weights.tolist(), Q)
+        population = (rng.random((40, n)) < rng.uniform(0.05, 0.95)).astype(np.uint8)
+        expected = np.array([sequential_repair(row, repair.weights.astype(np.int64), Q) for row in population])
+        fitness, total_weights = repair(population)
+        assert np.array_equal(population, expected)
+        assert (total_weights <= Q).all()
+        assert np.array_equal(total_weights, expected @ repair.weights.astype(np.int64))
+
+@pytest.mark.parametrize("crossover", CROSSOVERS)
+def test_genetic_algorithm_returns_feasible_solution(crossover):
+    n, Q, profits, weights = generate_instance(100, "weakly", seed=4)
+    profits, weights = profits.tolist(), weights.tolist()
+    solution, profit, generations, _ = genetic_algorithm(n, profits, weights, Q, population_size=30, generations=20,
+                                                         crossover=crossover, seed=1)
+    assert generations == 20
+    assert sum(w for w, x in zip(weights, solution) if x) <= Q
+    assert sum(p for p, x in zip(profits, solution) if x) == profit
+    assert genetic_algorithm(n, profits, weights, Q, population_size=30, generations=20, crossover=crossover,
+                             seed=1)[:2] == (solution, profit)
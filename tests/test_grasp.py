@@ -0,0 +1,31 @@
+from knapsack_solver.generator import generate_instance
+from knapsack_solver.grasp import parallel_grasp_knapsack
+from knapsack_solver.service import InlineExecutor
+
+# Executor no próprio processo que registra o tamanho de cada bloco enviado
+class RecordingExecutor(InlineExecutor):
+    def __init__(self):
+        self.sizes = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        self.sizes.append(args[4])
+        return super().submit(fn, *args, **kwargs)
+
+def instance():
+    n, Q, profits, weights = generate_instance(80, "weakly", seed=2)
+    return n, Q, profits.tolist(), weights.tolist()
+
+def test_default_chunks_spread_few_iterations():
+    n, Q, profits, weights = instance()
+    for iterations, sizes in [(64, [1] * 64), (1000, [4] * 250), (100_000, [64] * 1562 + [32])]:
+        executor = RecordingExecutor()
+        parallel_grasp_knapsack(n, profits, weights, Q, iterations, seed=1, executor=executor, time_limit=0)
+        assert executor.sizes == sizes
+
+def test_result_does_not_depend_on_workers():
+    n, Q, profits, weights = instance()
+    expected = parallel_grasp_knapsack(n, profits, weights, Q, 40, seed=7, executor=InlineExecutor())
+    assert parallel_grasp_knapsack(n, profits, weights, Q, 40, seed=7, workers=2) == expected
+    solution, profit = expected
+    assert sum(w for w, x in zip(weights, solution) if x) <= Q
+    assert sum(p for p, x in zip(profits, solution) if x) == profit
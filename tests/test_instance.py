@@ -0,0 +1,73 @@
+import os
+import warnings
+
+import numpy as np
+import pytest
+
+from knapsack_solver.instance import (LazyInstance, cache_path, detect_layout, load_instance, parse_knapsack_text,
+                                      write_knapsack_text)
+
+PROFITS = [10, 20, 30, 40, 50]
+WEIGHTS = [1, 2, 3, 4, 5]
+
+@pytest.mark.parametrize("layout", ["columns", "pairs"])
+def test_both_layouts_are_detected(tmp_path, layout):
+    path = tmp_path / "instance.txt"
+    write_knapsack_text(path, 5, 9, PROFITS, WEIGHTS, layout=layout)
+    assert detect_layout(path.read_bytes(), 5) == layout
+    n, Q, profits, weights = load_instance(path)
+    assert (n, Q, profits.tolist(), weights.tolist()) == (5, 9, PROFITS, WEIGHTS)
+    assert load_instance(path, layout="columns" if layout == "pairs" else "pairs")[2].tolist() != PROFITS
+
+def test_declared_size_must_match():
+    with pytest.raises(ValueError):
+        parse_knapsack_text("3\n10\n1 2\n3 4\n")
+    with pytest.raises(ValueError):
+        parse_knapsack_text("4\n10\n1 2 3\n4 5 6\n1 1\n")
+
+# Com n = 2 as duas leituras têm a mesma forma: vale "pairs", com aviso quando diferem
+def test_two_items_are_read_as_pairs_with_a_warning():
+    text = b"2\n10\n5 3\n7 4\n"
+    with pytest.warns(UserWarning, match="ambíguos"):
+        n, Q, profits, weights = parse_knapsack_text(text)
+    assert (profits.tolist(), weights.tolist()) == ([5, 7], [3, 4])
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert parse_knapsack_text(text, layout="columns")[2].tolist() == [5, 3]
+        assert parse_knapsack_text(b"2\n10\n5 3\n3 4\n")[2].tolist() == [5, 3]  # As leituras coincidem
+
+def test_cache_is_used_and_invalidated(tmp_path):
+    path = tmp_path / "instance.txt"
+    write_knapsack_text(path, 5, 9, PROFITS, WEIGHTS)
+    stat = os.stat(path)
+    assert load_instance(path, cache=True)[1] == 9
+    cached = cache_path(str(path))
+    assert os.path.exists(cached)
+
+    # A cópia binária é usada enquanto o texto não muda (o texto nem é lido)
+    with np.load(cached) as data:
+        arrays = dict(data)
+    arrays["Q"] = np.array(99)
+    np.savez(cached, **arrays)
+    assert load_instance(path, cache=True)[1] == 99
+
+    # Edição no mesmo instante de modificação, só com outro tamanho
+    write_knapsack_text(path, 5, 12, PROFITS, WEIGHTS)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert load_instance(path, cache=True)[1] == 12
+
+    # Mesmo tamanho, outro mtime
+    write_knapsack_text(path, 5, 13, PROFITS, WEIGHTS)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert load_instance(path, cache=True)[1] == 13
+
+    # Outro layout pedido não reaproveita a cópia do layout detectado
+    assert load_instance(path, layout="columns", cache=True)[2].tolist() != PROFITS
+    assert load_instance(path, cache=True)[2].tolist() == PROFITS
+
+def test_lazy_instance_reads_on_first_access(tmp_path):
+    path = tmp_path / "instance.txt"
+    instance = LazyInstance(path)
+    write_knapsack_text(path, 5, 9, PROFITS, WEIGHTS, layout="columns")
+    assert "não carregada" in repr(instance)
+    assert instance.profits == PROFITS and instance.weights == WEIGHTS and instance.n == 5
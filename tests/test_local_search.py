@@ -0,0 +1,125 @@
+import random
+
+import pytest
+
+from knapsack_solver import BitSolution, evaluate_solution
+from knapsack_solver.evaluation import DeltaEvaluator
+from knapsack_solver.local_search import best_improvement, first_improvement, hill_climbing_bi, hill_climbing_fi
+
+# Versões originais (listas de vizinhos e avaliação completa), usadas como referência
+# para as buscas com avaliação incremental
+
+def old_get_neighbors(solution):
+    neighbors = []
+    for i in range(len(solution) - 1):
+        neighbor = solution[:]
+        neighbor[i] = 1 - neighbor[i]
+        neighbor[i + 1] = 1 - neighbor[i + 1]
+        neighbors.append(neighbor)
+    return neighbors
+
+def old_first_improvement(solution, profits, weights, Q):
+    current_profit, _ = evaluate_solution(solution, profits, weights, Q)
+    for neighbor in old_get_neighbors(solution):
+        if evaluate_solution(neighbor, profits, weights, Q)[0] > current_profit:
+            return neighbor
+    return solution
+
+def old_best_improvement(solution, profits, weights, Q):
+    best_solution = solution[:]
+    best_profit, _ = evaluate_solution(solution, profits, weights, Q)
+    for neighbor in old_get_neighbors(solution):
+        neighbor_profit, _ = evaluate_solution(neighbor, profits, weights, Q)
+        if neighbor_profit > best_profit:
+            best_solution = neighbor
+            best_profit = neighbor_profit
+    return best_solution
+
+def old_hill_climbing_bi(solution, profits, weights, Q):
+    current_profit, _ = evaluate_solution(solution, profits, weights, Q)
+    while True:
+        best_solution = solution[:]
+        best_profit = current_profit
+        for neighbor in old_get_neighbors(solution):
+            neighbor_profit, _ = evaluate_solution(neighbor, profits, weights, Q)
+            if neighbor_profit > best_profit:
+                best_solution = neighbor
+                best_profit = neighbor_profit
+        if best_profit <= current_profit:
+            return solution
+        solution = best_solution
+        current_profit = best_profit
+
+def old_hill_climbing_fi(solution, profits, weights, Q):
+    current_profit, _ = evaluate_solution(solution, profits, weights, Q)
+    while True:
+        for neighbor in old_get_neighbors(solution):
+            neighbor_profit, _ = evaluate_solution(neighbor, profits, weights, Q)
+            if neighbor_profit > current_profit:
+                solution = neighbor
+                current_profit = neighbor_profit
+                break
+        else:
+            return solution
+
+# Versão circular: cada varredura recomeça logo depois do último movimento aceito e
+# a busca termina após uma volta inteira sem melhora
+def old_hill_climbing_fi_circular(solution, profits, weights, Q):
+    current_profit, _ = evaluate_solution(solution, profits, weights, Q)
+    neighbors = len(solution) - 1
+    start = 0
+    while True:
+        for k in range(neighbors):
+            i = (start + k) % neighbors
+            neighbor = solution[:]
+            neighbor[i] = 1 - neighbor[i]
+            neighbor[i + 1] = 1 - neighbor[i + 1]
+            neighbor_profit, _ = evaluate_solution(neighbor, profits, weights, Q)
+            if neighbor_profit > current_profit:
+                solution = neighbor
+                current_profit = neighbor_profit
+                start = i + 1
+                break
+        else:
+            return solution
+
+def sequential_hill_climbing_fi(solution, profits, weights, Q):
+    return hill_climbing_fi(solution, profits, weights, Q, order="sequential")
+
+PAIRS = [
+    (first_improvement, old_first_improvement),
+    (best_improvement, old_best_improvement),
+    (sequential_hill_climbing_fi, old_hill_climbing_fi),
+    (hill_climbing_fi, old_hill_climbing_fi_circular),
+    (hill_climbing_bi, old_hill_climbing_bi),
+]
+
+def random_case(rng):
+    n = rng.randint(2, 40)
+    profits = [rng.randint(1, 50) for _ in range(n)]
+    weights = [rng.randint(1, 50) for _ in range(n)]
+    Q = rng.randint(10, 400)
+    solution = [rng.randint(0, 1) for _ in range(n)]
+    return solution, profits, weights, Q
+
+@pytest.mark.parametrize("search, reference", PAIRS, ids=[search.__name__ for search, _ in PAIRS])
+def test_matches_list_based_version(search, reference):
+    rng = random.Random(0)
+    for _ in range(200):
+        solution, profits, weights, Q = random_case(rng)
+        expected = reference(solution, profits, weights, Q)
+        assert search(solution, profits, weights, Q) == expected
+        assert search(BitSolution.from_list(solution), profits, weights, Q) == expected
+
+def test_delta_evaluation_matches_full_evaluation():
+    rng = random.Random(2)
+    for _ in range(100):
+        solution, profits, weights, Q = random_case(rng)
+        state = DeltaEvaluator(solution, profits, weights, Q)
+        n = len(solution)
+        i = rng.randrange(n - 1)
+        for move in [(rng.randrange(n),), (i, i + 1), tuple(rng.sample(range(n), 2))]:
+            neighbor = state.neighbor(move)
+            assert state.evaluate_move(move) == evaluate_solution(neighbor, profits, weights, Q)
+            state.apply(move)
+            assert state.evaluate() == evaluate_solution(neighbor, profits, weights, Q)
@@ -0,0 +1,56 @@
+import random
+
+from knapsack_solver.construction import greedy_randomized_solution
+from knapsack_solver.memo import SolutionCache, TabuList, ZobristTable
+
+def test_construction_keeps_the_zobrist_hash():
+    rng = random.Random(0)
+    for case in range(50):
+        n = rng.randint(1, 80)
+        profits = [rng.randint(1, 30) for _ in range(n)]
+        weights = [rng.randint(1, 30) for _ in range(n)]
+        capacity = rng.randint(0, 10 * n)
+        zobrist = ZobristTable(n, seed=case)
+        plain = greedy_randomized_solution(n, profits, weights, capacity, 0.3, float("inf"), rng=random.Random(case))
+        *hashed, key = greedy_randomized_solution(n, profits, weights, capacity, 0.3, float("inf"),
+                                                  rng=random.Random(case), zobrist=zobrist)
+        assert tuple(hashed) == plain
+        assert key == zobrist.hash(plain[0])
+
+def test_update_matches_full_hash():
+    zobrist = ZobristTable(6, seed=1)
+    solution = [1, 0, 1, 0, 0, 1]
+    h = zobrist.update(zobrist.hash(solution), (0, 3))
+    assert h == zobrist.hash([0, 0, 1, 1, 0, 1])
+    assert zobrist.hash([0] * 6) == 0
+
+def test_cache_evicts_least_recently_used():
+    cache = SolutionCache(3, maxsize=2)
+    cache.put(1, ([1, 0, 0], 5, 2))
+    cache.put(2, ([0, 1, 0], 6, 3))
+    assert cache.get(1) == ([1, 0, 0], 5, 2)
+    cache.put(3, ([0, 0, 1], 7, 4))
+    assert cache.get(2) is None
+    assert cache.get(1) is not None and cache.get(3) is not None
+    stats = cache.stats
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (3, 1, 1, 2)
+
+def test_cache_state_round_trip():
+    cache = SolutionCache(10, maxsize=4)
+    rng = random.Random(2)
+    for _ in range(6):
+        solution = [rng.randint(0, 1) for _ in range(10)]
+        cache.put(cache.key(solution), (solution, rng.randint(0, 99), rng.randint(0, 99)))
+    cache.get(12345)
+    restored = SolutionCache(10, maxsize=4)
+    restored.restore(cache.state())
+    assert list(restored.entries.items()) == list(cache.entries.items())
+    assert restored.stats == cache.stats
+
+def test_tabu_list_forgets_after_tenure():
+    tabu = TabuList(2)
+    for key in (1, 2, 1, 3):
+        tabu.add(key)
+    assert 1 in tabu and 3 in tabu and 2 not in tabu
+    tabu.add(4)
+    assert 1 not in tabu and len(tabu) == 2
@@ -0,0 +1,36 @@
+import random
+
+import pytest
+
+from knapsack_solver.neighborhood import get_neighbors, iter_moves
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10, 257])
+def test_orders_visit_every_move_once(n):
+    sequential = list(iter_moves(n))
+    assert sequential == [(i, i + 1) for i in range(n - 1)]
+    assert sorted(iter_moves(n, "circular", start=n // 2)) == sequential
+    assert sorted(iter_moves(n, "random", rng=random.Random(n))) == sequential
+
+def test_circular_order_starts_at_start():
+    assert list(iter_moves(5, "circular", start=2)) == [(2, 3), (3, 4), (0, 1), (1, 2)]
+    assert list(iter_moves(5, "circular", start=6)) == list(iter_moves(5, "circular", start=2))
+
+def test_random_order_is_uniform():
+    rng = random.Random(0)
+    counts = {}
+    for _ in range(6000):
+        order = tuple(iter_moves(4, "random", rng=rng))
+        counts[order] = counts.get(order, 0) + 1
+    assert len(counts) == 6
+    assert all(800 < count < 1200 for count in counts.values())
+
+def test_get_neighbors_is_lazy():
+    solution = [0, 1, 0, 1]
+    neighbors = get_neighbors(solution)
+    assert next(neighbors) == [1, 0, 0, 1]
+    assert list(neighbors) == [[0, 0, 1, 1], [0, 1, 1, 0]]
+    assert solution == [0, 1, 0, 1]
+
+def test_unknown_order():
+    with pytest.raises(ValueError):
+        list(iter_moves(5, "diagonal"))
@@ -0,0 +1,93 @@
+import itertools
+import random
+
+import pytest
+
+from knapsack_solver.multiobjective import evaluate_objectives, objective_matrix, pareto_local_search
+from knapsack_solver.pareto import NDTree, ParetoFront2D, dominates, hypervolume, weakly_dominates
+
+# Filtro O(n²): a frente de uma sequência de pontos é o conjunto dos pontos distintos
+# que nenhum outro domina
+def brute_front(points):
+    distinct = set(points)
+    return {p for p in distinct if not any(dominates(q, p) for q in distinct)}
+
+def random_points(rng, count, dimensions, high):
+    return [tuple(rng.randint(0, high) for _ in range(dimensions)) for _ in range(count)]
+
+ARCHIVES = [
+    (2, ParetoFront2D),
+    (2, lambda: NDTree(2, max_leaf=3)),
+    (3, lambda: NDTree(3, max_leaf=4)),
+    (3, NDTree),
+    (4, lambda: NDTree(4, max_leaf=2)),
+]
+
+@pytest.mark.parametrize("dimensions, make", ARCHIVES)
+def test_archive_matches_brute_force_filtering(dimensions, make):
+    rng = random.Random(dimensions)
+    for trial in range(60):
+        # Poucos valores distintos: muitos empates e pontos repetidos
+        points = random_points(rng, rng.randint(1, 120), dimensions, rng.choice([3, 10, 1000]))
+        archive = make()
+        front = set()
+        for k, p in enumerate(points):
+            archive.add(p, k)
+            front = brute_front(front | {p})
+            assert len(archive) == len(front)
+        stored = archive.points()
+        assert {p for p, _ in stored} == front
+        for p, payload in stored:
+            assert points[payload] == p
+        for q in random_points(rng, 30, dimensions, 12) + points[:10]:
+            assert archive.is_dominated(q) == any(weakly_dominates(p, q) for p in front)
+            assert archive.is_dominated(q, strict=True) == any(dominates(p, q) for p in front)
+
+def test_archive_rejects_weakly_dominated_points():
+    front = ParetoFront2D()
+    assert front.add((3, 3))
+    assert not front.add((3, 3))
+    assert not front.add((2, 3))
+    assert front.add((4, 1))
+    assert front.add((3, 4))
+    assert [p for p, _ in front.points()] == [(3, 4), (4, 1)]
+
+# Hipervolume por contagem das células unitárias da grade dominadas por algum ponto
+def grid_volume(points, reference, high):
+    cells = itertools.product(*(range(r, high) for r in reference))
+    return sum(any(all(c < x for c, x in zip(cell, p)) for p in points) for cell in cells)
+
+@pytest.mark.parametrize("dimensions", [1, 2, 3])
+def test_hypervolume_matches_grid_counting(dimensions):
+    rng = random.Random(10 + dimensions)
+    reference = tuple(rng.randint(-3, 0) for _ in range(dimensions))
+    for _ in range(80):
+        points = random_points(rng, rng.randint(0, 12), dimensions, 7)
+        assert hypervolume(points, reference) == grid_volume(points, reference, 8)
+
+def test_hypervolume_ignores_points_not_better_than_reference():
+    assert hypervolume([(0, 5), (5, 0)], (0, 0)) == 0.0
+    assert hypervolume([(2, 2), (0, 9)], (0, 0)) == 4.0
+
+@pytest.mark.parametrize("objectives, moves", [("profit-weight", None), ("bi-profit", None),
+                                               ("bi-profit", "flip"), ("bi-profit", "flip+pairs")])
+def test_pareto_local_search_returns_feasible_nondominated_front(objectives, moves):
+    rng = random.Random(4)
+    n = 12
+    profits = [rng.randint(1, 40) for _ in range(n)]
+    weights = [rng.randint(1, 40) for _ in range(n)]
+    Q = sum(weights) // 2
+    matrix = objective_matrix(profits, weights, objectives, [rng.randint(1, 40) for _ in range(n)])
+    archive, _ = pareto_local_search(n, matrix, weights, Q, moves=moves, rng=random.Random(0))
+
+    feasible = [x for x in itertools.product((0, 1), repeat=n) if sum(w for w, b in zip(weights, x) if b) <= Q]
+    true_front = brute_front([evaluate_objectives(x, matrix) for x in feasible])
+    stored = [p for p, _ in archive.points()]
+    assert stored
+    for p, solution in archive.points():
+        solution = solution.to_list()
+        assert sum(w for w, b in zip(weights, solution) if b) <= Q
+        assert evaluate_objectives(solution, matrix) == p
+        assert not any(dominates(q, p) for q in stored)
+    # Em 12 itens a frente encontrada deve estar perto da exata
+    assert len(set(stored) & true_front) >= len(true_front) // 2
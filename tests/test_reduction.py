@@ -0,0 +1,51 @@
+import pytest
+
+from knapsack_solver.exact import dp_knapsack
+from knapsack_solver.generator import FAMILIES, generate_instance
+from knapsack_solver.reduction import reduce_instance, solve_reduced
+
+def dp_solver(n, Q, profits, weights):
+    return dp_knapsack(n, Q, profits, weights)[0]
+
+def instances(family, count=20):
+    for seed in range(count):
+        n, Q, profits, weights = generate_instance(60 + 20 * seed, family, R=100, seed=seed)
+        yield n, Q, profits.tolist(), weights.tolist()
+
+def total(values, solution):
+    return sum(v for v, x in zip(values, solution) if x)
+
+@pytest.mark.parametrize("family", FAMILIES)
+def test_reduced_cost_fixing_keeps_the_optimum(family):
+    for n, Q, profits, weights in instances(family):
+        optimum = dp_knapsack(n, Q, profits, weights, reconstruct=False)[1]
+        solution, profit, core = solve_reduced(n, Q, profits, weights, dp_solver)
+        assert profit == optimum
+        assert total(profits, solution) == profit
+        assert total(weights, solution) <= Q
+        assert core.n + len(core.fixed_ones) <= n
+
+# Com um limitante inferior bom (o ótimo), a fixação deve retirar itens do núcleo
+def test_optimal_lower_bound_shrinks_the_core():
+    n, Q, profits, weights = next(instances("uncorrelated"))
+    solution, optimum = dp_knapsack(n, Q, profits, weights)
+    core = reduce_instance(n, Q, profits, weights, lower_bound=optimum, incumbent=solution)
+    assert core.n < n
+    core_solution = dp_solver(core.n, core.Q, core.profits, core.weights)
+    assert total(profits, core.expand(core_solution)) == optimum
+
+@pytest.mark.parametrize("family", FAMILIES)
+@pytest.mark.parametrize("core_size", [1, 5, 20])
+def test_core_size_gives_a_feasible_solution(family, core_size):
+    for n, Q, profits, weights in instances(family, 4):
+        solution, profit, core = solve_reduced(n, Q, profits, weights, dp_solver, core_size=core_size)
+        assert core.n <= core_size
+        assert total(weights, solution) <= Q
+        assert total(profits, solution) == profit
+        assert profit >= total(profits, core.incumbent)
+
+def test_all_items_fit():
+    solution, profit, core = solve_reduced(3, 100, [1, 2, 3], [1, 2, 3], dp_solver)
+    assert solution == [1, 1, 1]
+    assert profit == 6
+    assert core.n == 0
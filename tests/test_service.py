@@ -0,0 +1,89 @@
+import asyncio
+import random
+from concurrent.futures import Executor, Future
+
+import pytest
+
+from knapsack_solver.exact import dp_knapsack
+from knapsack_solver.service import InlineExecutor, LocalClient, SolverService
+
+def instance_text(n, seed):
+    rng = random.Random(seed)
+    profits = [rng.randint(1, 100) for _ in range(n)]
+    weights = [rng.randint(1, 100) for _ in range(n)]
+    Q = sum(weights) // 2
+    lines = [f"{n} {Q}"] + [f"{p} {w}" for p, w in zip(profits, weights)]
+    return "\n".join(lines) + "\n", Q, profits, weights
+
+# Executor cujas tarefas nunca terminam, para exercitar o prazo dos pedidos
+class StalledExecutor(Executor):
+    def submit(self, fn, /, *args, **kwargs):
+        return Future()
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+def test_custom_executor_requires_workers():
+    with pytest.raises(ValueError, match="workers"):
+        SolverService(executor=InlineExecutor())
+
+@pytest.mark.parametrize("workers, batches", [(1, 3), (2, 5)])
+def test_small_instances_are_batched(workers, batches):
+    texts = [instance_text(20, seed) for seed in range(7)]
+
+    async def main():
+        service = SolverService(workers=workers, executor=InlineExecutor(), batch_size=3, time_limit=0.5, iterations=5)
+        async with service:
+            results = await LocalClient(service).solve_many([text for text, *_ in texts], seed=1)
+        return service, results
+
+    service, results = run(main())
+    assert service.stats["batches"] == batches
+    assert service.stats["single"] == 0
+    assert service.stats["requests"] == 7
+    for result, (_, Q, profits, weights) in zip(results, texts):
+        assert sum(weights[i] for i in result["items"]) == result["weight"] <= Q
+        assert sum(profits[i] for i in result["items"]) == result["profit"]
+        assert result["profit"] <= dp_knapsack(len(profits), Q, profits, weights, reconstruct=False)[1]
+
+def test_large_instances_are_sent_alone():
+    text, Q, _, weights = instance_text(50, 0)
+
+    async def main():
+        service = SolverService(workers=1, executor=InlineExecutor(), small_items=10, time_limit=0.5, iterations=5)
+        async with service:
+            result = await LocalClient(service).solve(text, seed=0)
+        return service, result
+
+    service, result = run(main())
+    assert service.stats["single"] == 1
+    assert service.stats["batches"] == 0
+    assert result["weight"] <= Q
+
+def test_parsed_instances_are_cached_by_content():
+    service = SolverService(workers=1, executor=InlineExecutor(), cache_size=2)
+    texts = [instance_text(5, seed)[0] for seed in range(3)]
+    first = service.load(texts[0])
+    assert service.load(texts[0].encode()) is first
+    assert service.stats["cache_hits"] == 1
+    service.load(texts[1])
+    service.load(texts[2])  # Descarta texts[0], o menos usado
+    assert service.load(texts[0]) is not first
+    assert (service.stats["cache_hits"], service.stats["cache_misses"]) == (1, 4)
+    assert service.load(texts[0]) == first
+
+@pytest.mark.parametrize("small_items", [1000, 0])
+def test_request_fails_after_deadline_plus_grace(small_items):
+    text = instance_text(20, 0)[0]
+
+    async def main():
+        service = SolverService(workers=1, executor=StalledExecutor(), small_items=small_items, grace=0.05)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(asyncio.TimeoutError):
+            await LocalClient(service).solve(text, time_limit=0.1)
+        return service, loop.time() - start
+
+    service, elapsed = run(main())
+    assert service.stats["timeouts"] == 1
+    assert 0.15 <= elapsed < 1.0